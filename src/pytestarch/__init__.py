@@ -1,5 +1,8 @@
 from pytestarch.diagram_extension.diagram_rule import DiagramRule
 from pytestarch.eval_structure.evaluable_architecture import EvaluableArchitecture
+from pytestarch.eval_structure_generation.file_import.import_recorder import (
+    ImportRecorder,
+)
 from pytestarch.query_language.layered_architecture_rule import (
     LayeredArchitecture,
     LayerRule,
@@ -7,15 +10,26 @@ from pytestarch.query_language.layered_architecture_rule import (
 from pytestarch.query_language.rule import Rule
 
 from .pytestarch import (
+    add_recorded_imports,
     get_evaluable_architecture,
+    get_evaluable_architecture_for_archive,
+    get_evaluable_architecture_for_files,
     get_evaluable_architecture_for_module_objects,
+    get_evaluable_architecture_from_runtime,
+    get_evaluable_architectures_for_git_history,
 )
 
 __all__ = [
+    "add_recorded_imports",
     "DiagramRule",
     "EvaluableArchitecture",
     "get_evaluable_architecture",
+    "get_evaluable_architecture_for_archive",
+    "get_evaluable_architecture_for_files",
     "get_evaluable_architecture_for_module_objects",
+    "get_evaluable_architecture_from_runtime",
+    "get_evaluable_architectures_for_git_history",
+    "ImportRecorder",
     "LayeredArchitecture",
     "LayerRule",
     "Rule",
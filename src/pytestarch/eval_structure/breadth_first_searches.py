@@ -13,26 +13,11 @@ def get_dependency_between_modules(
 
     nodes_to_exclude = get_parent_nodes([dependent, dependent_upon])
 
-    nodes_to_check = [dependent_node]
-    checked_nodes = set()
-
     dependencies = []
 
-    while nodes_to_check:
-        node = nodes_to_check.pop()
-
-        if node in checked_nodes:
-            continue
-
-        checked_nodes.add(node)
-
-        children = graph.direct_successor_nodes(node)
-
-        for child in children:
-            if graph.parent_child_relationship(node, child):
-                nodes_to_check.append(child)
-
-            elif (
+    for node in graph.subtree_index().submodules(dependent_node):
+        for child in graph.import_successors(node):
+            if (
                 child in dependent_upon_nodes
                 and node not in nodes_to_exclude
                 and child not in nodes_to_exclude
@@ -94,17 +79,14 @@ def any_dependency_to_module_other_than(
 
         checked_nodes.add(node)
 
-        children = graph.direct_successor_nodes(node)
-
-        for child in children:
-            if not graph.parent_child_relationship(node, child):
-                if (
-                    child not in nodes_to_exclude
-                    and child not in nodes_that_do_not_fulfill_criterion
-                ):
-                    nodes_fulfilling_criteria.append(tuple(to_modules([node, child])))
-                else:
-                    nodes_to_check.append(child)
+        for child in graph.import_successors(node):
+            if (
+                child not in nodes_to_exclude
+                and child not in nodes_that_do_not_fulfill_criterion
+            ):
+                nodes_fulfilling_criteria.append(tuple(to_modules([node, child])))
+            else:
+                nodes_to_check.append(child)
 
     return nodes_fulfilling_criteria  # type: ignore
 
@@ -163,18 +145,15 @@ def any_other_dependency_to_module_than(
 
         checked_nodes.add(node)
 
-        parents = graph.direct_predecessor_nodes(node)
-
-        for parent in parents:
-            if not graph.parent_child_relationship(parent, node):
-                if (
-                    parent not in nodes_to_exclude
-                    and parent not in nodes_that_count_as_not_fulfilling_criterion
-                ):
-                    nodes_fulfilling_criteria.append(tuple(to_modules([parent, node])))
+        for parent in graph.import_predecessors(node):
+            if (
+                parent not in nodes_to_exclude
+                and parent not in nodes_that_count_as_not_fulfilling_criterion
+            ):
+                nodes_fulfilling_criteria.append(tuple(to_modules([parent, node])))
 
-                if parent not in nodes_to_exclude:
-                    nodes_to_check.append(parent)
+            if parent not in nodes_to_exclude:
+                nodes_to_check.append(parent)
 
     return nodes_fulfilling_criteria  # type: ignore
 
@@ -190,26 +169,4 @@ def get_all_submodules_of(
     Returns:
         all submodules, including the module itself
     """
-    start_node = get_node(module)
-
-    nodes_to_check = [start_node]
-    checked_nodes = set()
-
-    submodules = set()
-
-    while nodes_to_check:
-        node = nodes_to_check.pop()
-
-        if node in checked_nodes:
-            continue
-
-        checked_nodes.add(node)
-        submodules.add(node)
-
-        children = graph.direct_successor_nodes(node)
-
-        for child in children:
-            if graph.parent_child_relationship(node, child):
-                nodes_to_check.append(child)
-
-    return submodules
+    return set(graph.subtree_index().submodules(get_node(module)))
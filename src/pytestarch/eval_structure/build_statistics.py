@@ -0,0 +1,52 @@
+"""Statistics collected while generating an evaluable architecture."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class BuildStatistics:
+    """Summary of the work that was done to generate an evaluable architecture.
+
+    Attributes:
+        cache_hits: number of files whose imports were served from the import cache without being parsed
+        cache_misses: number of files that had to be parsed although an import cache was configured
+        cache_evictions: number of stale import cache entries that were removed
+        skipped_files: paths of all files that were not parsed, mapped to the reason why they were skipped
+        verified_files: number of files whose header scan was verified by parsing the complete file
+        missed_imports: paths of verified files, mapped to the imported modules their header scan did not find
+        bytecode_hits: number of files whose imports were read from their cached bytecode
+        bytecode_misses: number of files that had to be parsed, because their cached bytecode was missing or outdated
+        reused_blobs: number of files of a git revision whose imports were reused, because the identical file had
+            already been parsed for another revision
+        classification_hits: number of imports of external modules whose classification as retained or excluded was
+            served from the classification cache
+        classification_misses: number of imports of external modules that had to be classified
+    """
+
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_evictions: int = 0
+    skipped_files: dict[str, str] = field(default_factory=dict)
+    verified_files: int = 0
+    missed_imports: dict[str, list[str]] = field(default_factory=dict)
+    bytecode_hits: int = 0
+    bytecode_misses: int = 0
+    reused_blobs: int = 0
+    classification_hits: int = 0
+    classification_misses: int = 0
+
+    def summary(self) -> str:
+        """Returns a human-readable summary of the collected statistics."""
+        return (
+            f"import cache: {self.cache_hits} hits, {self.cache_misses} misses, "
+            f"{self.cache_evictions} evicted entries; "
+            f"{len(self.skipped_files)} skipped files; "
+            f"header scan: {self.verified_files} verified files, "
+            f"{len(self.missed_imports)} with missed imports; "
+            f"bytecode: {self.bytecode_hits} hits, {self.bytecode_misses} misses; "
+            f"git history: {self.reused_blobs} reused blobs; "
+            f"external classification: {self.classification_hits} hits, "
+            f"{self.classification_misses} misses"
+        )
@@ -0,0 +1,96 @@
+"""Side table of imports of external modules that are only part of the graph as one of their parent modules."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+
+from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
+from pytestarch.eval_structure.types import RUNTIME_IMPORT
+
+# typecode of the arrays storing module ids and import kinds
+MODULE_ID_TYPE = "l"
+# number of values stored per import: importing module, imported module, and kind of the import
+IMPORT_SIZE = 3
+
+
+class CollapsedImports:
+    """Stores imports of external modules below a certain depth, e.g. 'numpy.linalg', which are only added to the graph
+    as imports of their parent module at that depth, e.g. 'numpy', so that the graph does not contain a node for every
+    external module that is imported somewhere.
+
+    For each parent module, the ids of the importing and imported modules in the module hierarchy are stored in a flat
+    array together with the kind of the import, so that the full names of the imported modules take up little memory
+    until they are actually needed.
+    """
+
+    def __init__(self, depth: int, module_hierarchy: ModuleHierarchy) -> None:
+        """
+        Args:
+            depth: number of levels of external modules that are part of the graph, e.g. 1 for top level modules only
+            module_hierarchy: table of module names the ids refer to
+        """
+        self._depth = depth
+        self._module_hierarchy = module_hierarchy
+        self._imports: dict[int, array[int]] = {}
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def collapse(self, importer: str, importee: str, kind: int = RUNTIME_IMPORT) -> str:
+        """Returns the module the imported module is collapsed to. If this is a parent module of the imported module,
+        the import is stored.
+
+        Args:
+            importer: importing module
+            importee: imported external module
+            kind: kind of the import
+        Returns:
+            parent module of the imported module at the configured depth, or the imported module itself
+        """
+        collapsed = self.collapsed_module(importee)
+
+        if collapsed != importee:
+            imports = self._imports.setdefault(
+                self._module_hierarchy.id(collapsed), array(MODULE_ID_TYPE)
+            )
+            imports.append(self._module_hierarchy.id(importer))
+            imports.append(self._module_hierarchy.id(importee))
+            imports.append(kind)
+
+        return collapsed
+
+    def collapsed_module(self, module: str) -> str:
+        """Same as collapse, but the import is not stored.
+
+        Args:
+            module: imported external module
+        Returns:
+            parent module of the module at the configured depth, or the module itself
+        """
+        return self._module_hierarchy.ancestor_at_depth(module, self._depth - 1)
+
+    def expand(self, module: str) -> Iterator[tuple[str, str, int]]:
+        """Returns all stored imports of the given module and its submodules.
+
+        Args:
+            module: external module, e.g. 'numpy.linalg'
+        Returns:
+            importing and imported module as well as the kind of each import
+        """
+        hierarchy = self._module_hierarchy
+        module_id = hierarchy.id(module)
+        module_depth = hierarchy.depth(module_id)
+
+        if module_depth < self._depth:
+            return
+
+        collapsed = hierarchy.ancestor_at_depth(module, self._depth - 1)
+        imports = self._imports.get(hierarchy.id(collapsed), array(MODULE_ID_TYPE))
+
+        for index in range(0, len(imports), IMPORT_SIZE):
+            importee = hierarchy.name(imports[index + 1])
+
+            if hierarchy.ancestor_at_depth(importee, module_depth) == module:
+                yield hierarchy.name(imports[index]), importee, imports[index + 2]
@@ -0,0 +1,642 @@
+"""Compact graph of modules and their imports, stored in arrays instead of networkx' nested dictionaries."""
+
+from __future__ import annotations
+
+import copy
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+import networkx as nx
+
+from pytestarch.eval_structure.collapsed_imports import CollapsedImports
+from pytestarch.eval_structure.evaluable_structures import AbstractGraph, AbstractNode
+from pytestarch.eval_structure.module_hierarchy import NO_PARENT, ModuleHierarchy
+from pytestarch.eval_structure.networkxgraph import (
+    DYNAMIC,
+    EXPECTED_EDGE_AND_NODE_TYPES,
+    KINDS,
+    NetworkxGraph,
+)
+from pytestarch.eval_structure.subtree_index import SubtreeIndex
+from pytestarch.eval_structure.types import (
+    IMPORT_KIND_COMBINATIONS,
+    RUNTIME_IMPORT,
+    Import,
+)
+
+# typecode of the arrays storing node ids and offsets
+INDEX_TYPE = "I"
+# typecode of the arrays storing the flags of import edges
+FLAGS_TYPE = "H"
+# typecode of the array storing the parent of each node, which is NO_PARENT for nodes without parent
+PARENT_TYPE = "l"
+
+# the flags of an edge contain the bit mask of the combinations of import kinds of the imports it represents in the
+# lowest bits, as stored in the KINDS attribute of the edges of NetworkxGraph
+KINDS_MASK = (1 << IMPORT_KIND_COMBINATIONS) - 1
+RUNTIME_KINDS = 1 << RUNTIME_IMPORT
+DYNAMIC_FLAG = 1 << IMPORT_KIND_COMBINATIONS
+INHERITS_FLAG = DYNAMIC_FLAG << 1
+
+Node = AbstractNode
+
+
+class CsrGraph(AbstractGraph):
+    """Constructs the same graph as NetworkxGraph from a list of modules and their imports, but stores it in compressed
+    sparse row (CSR) arrays: each module is mapped to a dense integer id, and the successors of all modules are stored
+    in a single array, in which the successors of module i are located between offsets[i] and offsets[i + 1].
+
+    Edges between parent and child modules and import edges are stored in separate arrays, together with an array of
+    the importing modules of each module for reverse queries and an array of the parent of each module. The successors
+    of each module are sorted by name, so that they do not need to be sorted when they are requested.
+
+    The graph cannot be changed once it is built; adding imports to it creates a new graph.
+    """
+
+    def __init__(
+        self,
+        all_modules: list[Node],
+        imports: Iterable[Import],
+        level_limit: int | None = None,
+        module_hierarchy: ModuleHierarchy | None = None,
+        collapsed_imports: CollapsedImports | None = None,
+    ) -> None:
+        """
+        Args:
+            all_modules: list of all nodes in the graph, which can be connected by imports.
+            imports: all dependencies between the graph's nodes. Consumed exactly once, so this can be a generator.
+            level_limit: if not None, specifies the depth of the graph
+            module_hierarchy: table of module names to look up parent modules in, shared with the other components
+                building the graph
+            collapsed_imports: if set, imports of external modules that were collapsed to one of their parent modules,
+                which are added to the graph once a rule refers to them
+        """
+        self._level_limit = level_limit
+        self._module_hierarchy = (
+            module_hierarchy if module_hierarchy is not None else ModuleHierarchy()
+        )
+        self._collapsed_imports = collapsed_imports
+        # graph expanded by the collapsed modules most recently referred to, as the queries of a rule refer to the same
+        # modules
+        self._expanded_graph: tuple[frozenset[Node], CsrGraph] | None = None
+        self._visible_kinds = KINDS_MASK
+
+        builder = _GraphBuilder(self._module_hierarchy, level_limit)
+
+        for module in all_modules:
+            builder.create_node(module)
+            builder.add_edges_within_module_hierarchy(module)
+
+        for imp in imports:
+            importer = imp.importer()
+            importee = imp.importee()
+
+            builder.create_edge(importer, importee, kind=imp.kind())
+            builder.add_edges_within_module_hierarchy(importer)
+            builder.add_edges_within_module_hierarchy(importee, create_nodes=False)
+
+        self._load(builder)
+
+    def _load(self, builder: _GraphBuilder) -> None:
+        """Converts the nodes and edges collected by the builder to arrays."""
+        self._names = builder.names
+        self._ids = builder.ids
+        self._subtree_index: SubtreeIndex | None = None
+        node_count = len(self._names)
+
+        ranks = array(INDEX_TYPE, [0]) * node_count
+        for rank, node_id in enumerate(
+            sorted(range(node_count), key=self._names.__getitem__)
+        ):
+            ranks[node_id] = rank
+
+        self._parents = array(PARENT_TYPE, [NO_PARENT]) * node_count
+
+        children: list[list[int]] = [[] for _ in range(node_count)]
+        imports: list[list[tuple[int, int]]] = [[] for _ in range(node_count)]
+        importers: list[list[tuple[int, int]]] = [[] for _ in range(node_count)]
+
+        for node_start, successors in enumerate(builder.edges):
+            for node_end, flags in successors.items():
+                if flags & INHERITS_FLAG:
+                    children[node_start].append(node_end)
+                    self._parents[node_end] = node_start
+                else:
+                    imports[node_start].append((node_end, flags))
+                    importers[node_end].append((node_start, flags))
+
+        self._child_offsets, self._children, _ = _to_csr(
+            [[(child, 0) for child in nodes] for nodes in children], ranks
+        )
+        self._import_offsets, self._imports, self._import_flags = _to_csr(
+            imports, ranks
+        )
+        self._importer_offsets, self._importers, self._importer_flags = _to_csr(
+            importers, ranks
+        )
+
+    def _builder(self, visible_kinds: int) -> _GraphBuilder:
+        """Returns a builder containing all nodes of this graph and its edges of the given kinds, to add further nodes
+        and edges.
+
+        Args:
+            visible_kinds: combination of the flags of the import kind combinations whose edges are copied
+        """
+        builder = _GraphBuilder(self._module_hierarchy, self._level_limit)
+        builder.ids = dict(self._ids)
+        builder.names = list(self._names)
+        builder.edges = [{} for _ in self._names]
+
+        for node_id, successors in enumerate(builder.edges):
+            for index in range(
+                self._child_offsets[node_id], self._child_offsets[node_id + 1]
+            ):
+                successors[self._children[index]] = INHERITS_FLAG
+
+            for index in range(
+                self._import_offsets[node_id], self._import_offsets[node_id + 1]
+            ):
+                if self._import_flags[index] & visible_kinds:
+                    successors[self._imports[index]] = self._import_flags[index]
+
+        return builder
+
+    def with_dynamic_imports(self, imports: Iterable[Import]) -> CsrGraph:
+        """Returns a copy of this graph, to which the given imports are added as edges marked as dynamic, e.g. imports
+        recorded while the code was running. Imports between modules that are not part of the graph are ignored.
+        Imports that are already part of the graph are not marked as dynamic, but count as runtime imports.
+
+        Args:
+            imports: imports to add to the copy of the graph
+        """
+        builder = self._builder(self._visible_kinds)
+
+        for imp in imports:
+            builder.create_edge(
+                imp.importer(), imp.importee(), dynamic=True, kind=imp.kind()
+            )
+
+        graph = copy.copy(self)
+        graph._expanded_graph = None
+        graph._visible_kinds = KINDS_MASK
+        graph._load(builder)
+
+        return graph
+
+    def with_expanded_modules(self, modules: Iterable[Node]) -> CsrGraph:
+        """Returns a copy of this graph, to which the given external modules are added together with their submodules
+        and all imports of them, if they were collapsed to one of their parent modules while the graph was built.
+        Returns this graph itself if none of the modules was collapsed. This graph is not changed, so that the modules
+        one rule refers to do not change the result of other rules.
+
+        Args:
+            modules: names of modules a rule refers to
+        """
+        if self._collapsed_imports is None:
+            return self
+
+        collapsed_modules = frozenset(
+            module for module in modules if module not in self._ids
+        )
+        if (
+            self._expanded_graph is not None
+            and self._expanded_graph[0] == collapsed_modules
+        ):
+            return self._expanded_graph[1]
+
+        imports = [
+            imp
+            for module in sorted(collapsed_modules)
+            for imp in self._collapsed_imports.expand(module)
+        ]
+        if not imports:
+            return self
+
+        # hidden edges are kept, so that a view also hides the added imports of excluded kinds
+        builder = self._builder(KINDS_MASK)
+
+        for importer, importee, kind in imports:
+            builder.create_node(importee)
+            builder.add_edges_within_module_hierarchy(importee)
+            builder.create_edge(importer, importee, kind=kind)
+
+        graph = copy.copy(self)
+        graph._expanded_graph = None
+        graph._load(builder)
+
+        self._expanded_graph = (collapsed_modules, graph)
+        return graph
+
+    def view(self, excluded_kinds: int) -> CsrGraph:
+        """Returns a view of this graph without the imports of the given kinds. The view shares the arrays of this
+        graph instead of copying them; edges are filtered whenever they are accessed.
+
+        An edge is only hidden if all imports it represents are of one of the excluded kinds, e.g. an edge representing
+        both an import at module level and an import within a function is not hidden if LOCAL_IMPORT is excluded.
+
+        Args:
+            excluded_kinds: combination of import kind flags, e.g. TYPE_CHECKING_IMPORT | LOCAL_IMPORT
+        """
+        graph = copy.copy(self)
+        graph._expanded_graph = None
+        graph._visible_kinds = self._visible_kinds & sum(
+            1 << kinds
+            for kinds in range(IMPORT_KIND_COMBINATIONS)
+            if not kinds & excluded_kinds
+        )
+
+        return graph
+
+    def is_dynamic(self, node_start: Node, node_end: Node) -> bool:
+        """Returns True if the edge between the two nodes was only added as a dynamic import."""
+        return bool(self._import_edge_flags(node_start, node_end) & DYNAMIC_FLAG)
+
+    def _import_edge_flags(self, node_start: Node, node_end: Node) -> int:
+        start_id = self._ids[node_start]
+        end_id = self._ids[node_end]
+
+        for index in range(
+            self._import_offsets[start_id], self._import_offsets[start_id + 1]
+        ):
+            if self._imports[index] == end_id:
+                return self._import_flags[index]
+
+        return 0
+
+    def __contains__(self, item) -> bool:
+        if not isinstance(item, str | tuple):
+            raise TypeError(EXPECTED_EDGE_AND_NODE_TYPES)
+
+        if isinstance(item, str):
+            return item in self._ids
+
+        if (
+            len(item) != 2
+            or not isinstance(item[0], str)
+            or not isinstance(item[1], str)
+        ):
+            raise TypeError(EXPECTED_EDGE_AND_NODE_TYPES)
+
+        return self._has_path(self._ids[item[0]], self._ids[item[1]])
+
+    def _has_path(self, start_id: int, end_id: int) -> bool:
+        """Searches forwards from the start node and backwards from the end node at the same time, always expanding the
+        smaller frontier, until both searches meet.
+        """
+        if start_id == end_id:
+            return True
+
+        reached_forwards = {start_id}
+        reached_backwards = {end_id}
+        forward_frontier = [start_id]
+        backward_frontier = [end_id]
+
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                neighbours, reached, other_reached = (
+                    self._successor_ids,
+                    reached_forwards,
+                    reached_backwards,
+                )
+                frontier = forward_frontier
+            else:
+                neighbours, reached, other_reached = (
+                    self._predecessor_ids,
+                    reached_backwards,
+                    reached_forwards,
+                )
+                frontier = backward_frontier
+
+            next_frontier = []
+            for node_id in frontier:
+                for neighbour_id in neighbours(node_id):
+                    if neighbour_id in other_reached:
+                        return True
+
+                    if neighbour_id not in reached:
+                        reached.add(neighbour_id)
+                        next_frontier.append(neighbour_id)
+
+            if frontier is forward_frontier:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+
+        return False
+
+    def _successor_ids(self, node_id: int) -> list[int]:
+        successor_ids = self._children[
+            self._child_offsets[node_id] : self._child_offsets[node_id + 1]
+        ].tolist()
+        successor_ids.extend(
+            self._visible(
+                self._imports, self._import_flags, self._import_offsets, node_id
+            )
+        )
+
+        return successor_ids
+
+    def _predecessor_ids(self, node_id: int) -> list[int]:
+        predecessor_ids = list(
+            self._visible(
+                self._importers, self._importer_flags, self._importer_offsets, node_id
+            )
+        )
+
+        parent_id = self._parents[node_id]
+        if parent_id != NO_PARENT:
+            predecessor_ids.append(parent_id)
+
+        return predecessor_ids
+
+    def _visible(
+        self, nodes: array[int], flags: array[int], offsets: array[int], node_id: int
+    ) -> Iterable[int]:
+        """Returns the neighbours of the given node stored in the given arrays, without those connected by imports of
+        hidden kinds.
+        """
+        start = offsets[node_id]
+        end = offsets[node_id + 1]
+
+        if self._visible_kinds == KINDS_MASK:
+            return nodes[start:end]
+
+        visible_kinds = self._visible_kinds
+
+        return [
+            neighbour
+            for neighbour, edge_flags in zip(nodes[start:end], flags[start:end])
+            if edge_flags & visible_kinds
+        ]
+
+    @property
+    def edges_number(self) -> int:
+        return len(self.edges)
+
+    @property
+    def nodes_number(self) -> int:
+        return len(self._names)
+
+    @property
+    def nodes(self) -> list[Node]:
+        return list(self._names)
+
+    @property
+    def edges(self) -> list[tuple[Node, Node]]:
+        names = self._names
+
+        return [
+            (names[node_id], names[successor_id])
+            for node_id in range(len(names))
+            for successor_id in self._successor_ids(node_id)
+        ]
+
+    def direct_predecessor_nodes(self, node: Node) -> list[Node]:
+        """Returns all nodes that have a directed edge towards the given node.
+
+        Args:
+            node: node for which to retrieve predecessor nodes
+
+        Returns:
+            all predecessor nodes
+        """
+        names = self._names
+        predecessors = [
+            names[node_id] for node_id in self._predecessor_ids(self._ids[node])
+        ]
+        # sorted run of importing modules followed by the parent module, which is merged in linear time
+        predecessors.sort()
+
+        return predecessors
+
+    def direct_successor_nodes(self, node: Node) -> list[Node]:
+        """Returns all nodes that the given node has a directed edge towards.
+
+        Args:
+            node: node for which to retrieve successor nodes
+
+        Returns:
+            all successor nodes
+        """
+        names = self._names
+        successors = [
+            names[node_id] for node_id in self._successor_ids(self._ids[node])
+        ]
+        # concatenation of two sorted runs, which is merged in linear time
+        successors.sort()
+
+        return successors
+
+    def hierarchy_children(self, node: Node) -> tuple[Node, ...]:
+        """Returns the child modules of the given node, sorted by name."""
+        node_id = self._ids[node]
+        names = self._names
+
+        return tuple(
+            names[child_id]
+            for child_id in self._children[
+                self._child_offsets[node_id] : self._child_offsets[node_id + 1]
+            ]
+        )
+
+    def import_successors(self, node: Node) -> tuple[Node, ...]:
+        """Returns the modules imported by the given node, sorted by name."""
+        names = self._names
+
+        return tuple(
+            names[node_id]
+            for node_id in self._visible(
+                self._imports, self._import_flags, self._import_offsets, self._ids[node]
+            )
+        )
+
+    def import_predecessors(self, node: Node) -> tuple[Node, ...]:
+        """Returns the modules importing the given node, sorted by name."""
+        names = self._names
+
+        return tuple(
+            names[node_id]
+            for node_id in self._visible(
+                self._importers,
+                self._importer_flags,
+                self._importer_offsets,
+                self._ids[node],
+            )
+        )
+
+    @property
+    def module_hierarchy(self) -> ModuleHierarchy:
+        """Table of module names shared with the other components that built this graph."""
+        return self._module_hierarchy
+
+    def subtree_index(self) -> SubtreeIndex:
+        """Returns the index of the module hierarchy of this graph, see NetworkxGraph.subtree_index."""
+        if self._subtree_index is None:
+            self._subtree_index = SubtreeIndex(self._names, self.hierarchy_children)
+
+        return self._subtree_index
+
+    def parent_child_relationship(
+        self, supposed_parent_node: Node, supposed_child_node: Node
+    ) -> bool:
+        """Returns True if the given nodes are marked as a parent-child hierarchy.
+
+        Args:
+            supposed_parent_node:
+            supposed_child_node:
+
+        Returns:
+            True if supposed parent is actually parent of supposed child node
+        """
+        return (
+            self._parents[self._ids[supposed_child_node]]
+            == self._ids[supposed_parent_node]
+        )
+
+    def draw(self, **kwargs: Any) -> None:
+        """Creates a matplotlib plot representing the graph, see NetworkxGraph.draw."""
+        NetworkxGraph.from_digraph(self.to_networkx()).draw(**kwargs)
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Returns a networkx graph with the same nodes and edges as this graph, marked like the edges of
+        NetworkxGraph.
+        """
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self._names)
+        names = self._names
+
+        for node_id in range(len(names)):
+            for index in range(
+                self._child_offsets[node_id], self._child_offsets[node_id + 1]
+            ):
+                graph.add_edge(
+                    names[node_id], names[self._children[index]], inherits=True
+                )
+
+            for index in range(
+                self._import_offsets[node_id], self._import_offsets[node_id + 1]
+            ):
+                flags = self._import_flags[index]
+
+                if not flags & self._visible_kinds:
+                    continue
+
+                attributes: dict[str, Any] = {"inherits": False}
+                if flags & DYNAMIC_FLAG:
+                    attributes[DYNAMIC] = True
+                if flags & KINDS_MASK != RUNTIME_KINDS:
+                    attributes[KINDS] = flags & KINDS_MASK
+
+                graph.add_edge(
+                    names[node_id], names[self._imports[index]], **attributes
+                )
+
+        return graph
+
+
+class _GraphBuilder:
+    """Collects the nodes and edges of a graph in the same way as NetworkxGraph, before they are stored in arrays."""
+
+    def __init__(
+        self, module_hierarchy: ModuleHierarchy, level_limit: int | None
+    ) -> None:
+        self._module_hierarchy = module_hierarchy
+        self._level_limit = level_limit
+
+        self.ids: dict[str, int] = {}
+        self.names: list[str] = []
+        # successors of each node with the flags of the edge towards them
+        self.edges: list[dict[int, int]] = []
+
+    def create_node(self, node: Node) -> None:
+        node = self._flatten_graph_node(node)
+
+        if node not in self.ids:
+            self.ids[node] = len(self.names)
+            self.names.append(node)
+            self.edges.append({})
+
+    def add_edges_within_module_hierarchy(
+        self, module: Node, create_nodes: bool = True
+    ) -> None:
+        parent_modules = self._module_hierarchy.parent_modules(module)
+
+        for parent, child in zip(parent_modules, parent_modules[1:] + [module]):
+            if create_nodes:
+                self.create_node(parent)
+
+            self.create_edge(parent, child, inherits=True)
+
+    def create_edge(
+        self,
+        node_start: Node,
+        node_end: Node,
+        inherits: bool = False,
+        dynamic: bool = False,
+        kind: int = RUNTIME_IMPORT,
+    ) -> None:
+        node_start = self._flatten_graph_node(node_start)
+        node_end = self._flatten_graph_node(node_end)
+
+        if node_start == node_end:
+            return
+
+        start_id = self.ids.get(node_start)
+        end_id = self.ids.get(node_end)
+
+        if start_id is None or end_id is None:
+            return
+
+        successors = self.edges[start_id]
+        flags = successors.get(end_id)
+
+        if flags is not None and bool(flags & INHERITS_FLAG) == inherits:
+            if not inherits:
+                successors[end_id] = flags | 1 << kind
+            return
+
+        # an existing edge is overwritten like the attributes of an edge of NetworkxGraph: the kinds of its imports are
+        # only replaced by a kind other than RUNTIME_IMPORT, and it stays dynamic
+        flags = flags or 0
+        kinds = 1 << kind if kind != RUNTIME_IMPORT else flags & KINDS_MASK
+        dynamic = dynamic or bool(flags & DYNAMIC_FLAG)
+
+        successors[end_id] = (
+            (kinds or RUNTIME_KINDS)
+            | (DYNAMIC_FLAG if dynamic else 0)
+            | (INHERITS_FLAG if inherits else 0)
+        )
+
+    def _flatten_graph_node(self, node: Node) -> Node:
+        if self._level_limit is None:
+            return node
+
+        return self._module_hierarchy.ancestor_at_depth(node, self._level_limit)
+
+
+def _to_csr(
+    successors: list[list[tuple[int, int]]], ranks: array[int]
+) -> tuple[array[int], array[int], array[int]]:
+    """Stores the successors of all nodes in a single array, sorted by the name of each successor.
+
+    Args:
+        successors: id of each successor of each node with the flags of the edge towards it
+        ranks: position of each node in the list of all nodes sorted by name
+    Returns:
+        offsets of the successors of each node, successors, and flags of the edges towards the successors
+    """
+    offsets = array(INDEX_TYPE, [0])
+    nodes = array(INDEX_TYPE)
+    flags = array(FLAGS_TYPE)
+
+    for node_successors in successors:
+        node_successors.sort(key=lambda successor: ranks[successor[0]])
+
+        for node_id, edge_flags in node_successors:
+            nodes.append(node_id)
+            flags.append(edge_flags)
+
+        offsets.append(len(nodes))
+
+    return offsets, nodes, flags
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from bisect import bisect
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any, Protocol
 
 from pytestarch.eval_structure.exceptions import LayerMismatch
+from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
+from pytestarch.eval_structure.subtree_index import SubtreeIndex
 
 Layer = str
 ModuleName = str
@@ -20,7 +21,17 @@ class LayerMapping:
         layer_mapping_for_module_filters: Mapping[
             Layer, Sequence[ModuleFilter] | Sequence[Module]
         ],
+        subtree_index: SubtreeIndex | None = None,
+        module_hierarchy: ModuleHierarchy | None = None,
     ) -> None:
+        """
+        Args:
+            layer_mapping_for_module_filters: modules of each layer
+            subtree_index: if set, index of the module hierarchy of the architecture, in which the layers of its modules
+                are looked up
+            module_hierarchy: if set, table of module names of the architecture, in which the parent modules of modules
+                that are not part of the subtree index are looked up
+        """
         self._layer_mapping_for_module_filters = layer_mapping_for_module_filters
         self._module_filter_mapping: Mapping[ModuleFilter | Module, Layer] = {
             module: layer
@@ -28,64 +39,41 @@ class LayerMapping:
             for module in modules
         }
 
-        self._sorted_module_filter_names = sorted(
-            map(lambda module: module.identifier, self._module_filter_mapping.keys())
+        # layer of each module of the layer definition, looked up for the module and each of its parent modules
+        self._layer_by_module_name: dict[ModuleName, Layer] = {}
+        for module, layer in self._module_filter_mapping.items():
+            self._layer_by_module_name.setdefault(module.identifier, layer)
+
+        self._module_hierarchy = (
+            module_hierarchy if module_hierarchy is not None else ModuleHierarchy()
         )
 
+        self._subtree_index = subtree_index
+        self._layers_by_submodule: dict[ModuleName, set[Layer]] | None = None
+
     def get_module_filters(self, layer: Layer) -> Sequence[ModuleFilter]:
         # assumption: only ModuleFilters present in the layer mapping
         return self._layer_mapping_for_module_filters[layer]  # type: ignore
 
-    def _get_layer(self, module: ModuleNameFilter) -> Layer:
-        # assumption: there is exactly one match
-        return [
-            self._module_filter_mapping[key]
-            for key in self._module_filter_mapping
-            if key.identifier == module.identifier
-        ][0]
-
-    def _get_layer_or_none(self, module_name: str) -> Layer | None:
-        layers = [
-            self._module_filter_mapping[key]
-            for key in self._module_filter_mapping
-            if key.identifier == module_name
-        ]
-
-        if layers:
-            return layers[0]
-
-        return None
-
     def get_layer_for_module_name(self, module_name: str) -> Layer | None:
         """Attempts to find the layer the given module belongs to. If the module does not appear in the
         layer definition itself, it is checked whether the module is a submodule of one of the modules in the layer
         definition. If so, the layer of the parent module is returned. Otherwise, None is returned.
         This assumes that if a module is in layer X, all of its submodules are as well.
         """
-        layer_candidate = self._get_layer_or_none(module_name)
+        layer_candidate = self._layer_by_module_name.get(module_name)
 
         if layer_candidate is not None:
             return layer_candidate
 
-        idx_of_module = (
-            bisect(self._sorted_module_filter_names, module_name) - 1
-        )  # -1 since idx is after the insertion point
-
-        candidate_parent_modules = []
-        while idx_of_module >= 0:
-            parent_module_candidate = self._sorted_module_filter_names[idx_of_module]
-            if module_name.startswith(parent_module_candidate):
-                candidate_parent_modules.append(
-                    ModuleNameFilter(name=parent_module_candidate)
-                )
-            idx_of_module -= 1
-
-        candidate_layers = set(
-            map(
-                self._get_layer,
-                candidate_parent_modules,
-            )
-        )
+        if self._subtree_index is not None and module_name in self._subtree_index:
+            candidate_layers = set(self._get_layers_by_submodule().get(module_name, ()))
+        else:
+            candidate_layers = {
+                self._layer_by_module_name[parent_module]
+                for parent_module in self._module_hierarchy.ancestors(module_name)
+                if parent_module in self._layer_by_module_name
+            }
 
         if len(candidate_layers) > 1:
             raise LayerMismatch(
@@ -97,6 +85,24 @@ class LayerMapping:
         else:
             return candidate_layers.pop()
 
+    def _get_layers_by_submodule(self) -> dict[ModuleName, set[Layer]]:
+        """Layers of the parent modules of each module, collected once from the submodules of each module of the layer
+        definition in the subtree index.
+        """
+        if self._layers_by_submodule is None:
+            self._layers_by_submodule = {}
+            subtree_index: SubtreeIndex = self._subtree_index  # type: ignore
+
+            for module_name, layer in self._layer_by_module_name.items():
+                if module_name not in subtree_index:
+                    continue
+
+                # the module itself is skipped, it does not count as its own submodule here
+                for submodule in subtree_index.submodules(module_name)[1:]:
+                    self._layers_by_submodule.setdefault(submodule, set()).add(layer)
+
+        return self._layers_by_submodule
+
     @property
     def all_layers(self) -> Iterable[Layer]:
         return self._layer_mapping_for_module_filters.keys()
@@ -300,7 +306,34 @@ class EvaluableArchitecture(Protocol):
         """
         raise NotImplementedError()
 
+    def view(
+        self, runtime_only: bool = False, excluded_kinds: int = 0
+    ) -> EvaluableArchitecture:
+        """Returns a view of this architecture without certain kinds of imports, e.g. to evaluate rules for runtime
+        imports only. The view shares the dependency structure of this architecture instead of copying it, so no
+        source code is parsed again. A dependency is only excluded if all of its imports are of an excluded kind.
+
+        Args:
+            runtime_only: if True, imports within 'if TYPE_CHECKING:' blocks and within functions are excluded, i.e.
+                only the imports that are executed when a module is imported are taken into account
+            excluded_kinds: combination of further import kinds to exclude, e.g. GUARDED_IMPORT for imports within try
+                blocks, as defined in pytestarch.eval_structure.types
+        """
+        raise NotImplementedError()
+
     @property
     def modules(self) -> list[str]:
         """Return names of all modules that are present in this architecture."""
         raise NotImplementedError()
+
+    def subtree_index(self) -> SubtreeIndex:
+        """Returns an index of the module hierarchy of this architecture, in which all submodules of a module are
+        stored next to each other, e.g. to find the submodules of a module without traversing the hierarchy.
+        """
+        raise NotImplementedError()
+
+    def module_hierarchy(self) -> ModuleHierarchy:
+        """Returns the table of module names this architecture was built with, e.g. to look up the parent modules of
+        a module without storing their names again.
+        """
+        raise NotImplementedError()
@@ -13,6 +13,7 @@ from pytestarch.eval_structure.breadth_first_searches import (
     any_other_dependency_to_module_than,
     get_dependency_between_modules,
 )
+from pytestarch.eval_structure.build_statistics import BuildStatistics
 from pytestarch.eval_structure.evaluable_architecture import (
     EvaluableArchitecture,
     ExplicitlyRequestedDependenciesByBaseModules,
@@ -20,14 +21,20 @@ from pytestarch.eval_structure.evaluable_architecture import (
     NotExplicitlyRequestedDependenciesByBaseModule,
 )
 from pytestarch.eval_structure.evaluable_structures import AbstractGraph
+from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
+from pytestarch.eval_structure.subtree_index import SubtreeIndex
+from pytestarch.eval_structure.types import LOCAL_IMPORT, TYPE_CHECKING_IMPORT, Import
 from pytestarch.eval_structure.utils import filter_to_module
 
 
 class EvaluableArchitectureGraph(EvaluableArchitecture):
     """Abstract implementation of an evaluable object that is based on a graph structure."""
 
-    def __init__(self, graph: AbstractGraph) -> None:
+    def __init__(
+        self, graph: AbstractGraph, build_statistics: BuildStatistics | None = None
+    ) -> None:
         self._graph = graph
+        self._build_statistics = build_statistics or BuildStatistics()
 
     def get_dependencies(
         self,
@@ -40,9 +47,11 @@ class EvaluableArchitectureGraph(EvaluableArchitecture):
         dependents_set = set(dependents)
         dependent_upons_set = set(dependent_upons)
 
+        graph = self._expand_collapsed_modules(dependents_set | dependent_upons_set)
+
         for dependent, dependent_upon in product(dependents_set, dependent_upons_set):
             dependency = get_dependency_between_modules(
-                self._graph, dependent, dependent_upon
+                graph, dependent, dependent_upon
             )
             result[(filter_to_module(dependent), filter_to_module(dependent_upon))] = (
                 dependency
@@ -59,11 +68,13 @@ class EvaluableArchitectureGraph(EvaluableArchitecture):
         dependents_set = set(dependents)
         dependent_upons_set = set(dependent_upons)
 
+        graph = self._expand_collapsed_modules(dependents_set | dependent_upons_set)
+
         result = {}
 
         for dependent in dependents_set:
             dependencies = any_dependency_to_module_other_than(
-                self._graph, dependent, dependent_upons_set
+                graph, dependent, dependent_upons_set
             )
             result[filter_to_module(dependent)] = dependencies
 
@@ -78,19 +89,70 @@ class EvaluableArchitectureGraph(EvaluableArchitecture):
         dependents_set = set(dependents)
         dependent_upons_set = set(dependent_upons)
 
+        graph = self._expand_collapsed_modules(dependents_set | dependent_upons_set)
+
         result = {}
 
         for dependent_upon in dependent_upons_set:
             dependencies = any_other_dependency_to_module_than(
-                self._graph, dependents_set, dependent_upon
+                graph, dependents_set, dependent_upon
             )
             result[filter_to_module(dependent_upon)] = dependencies
 
         return result
 
+    def with_dynamic_imports(
+        self, imports: Iterable[Import]
+    ) -> EvaluableArchitectureGraph:
+        """Returns a copy of this evaluable that additionally contains the given imports, marked as dynamic imports.
+        Imports between modules that are not part of this evaluable are ignored.
+        """
+        return EvaluableArchitectureGraph(
+            self._graph.with_dynamic_imports(imports),
+            self._build_statistics,
+        )
+
+    def view(
+        self, runtime_only: bool = False, excluded_kinds: int = 0
+    ) -> EvaluableArchitectureGraph:
+        """Returns a view of this evaluable without certain kinds of imports, which shares the graph of this evaluable
+        instead of copying it.
+        """
+        if runtime_only:
+            excluded_kinds |= TYPE_CHECKING_IMPORT | LOCAL_IMPORT
+
+        return EvaluableArchitectureGraph(
+            self._graph.view(excluded_kinds),
+            self._build_statistics,
+        )
+
+    def _expand_collapsed_modules(
+        self, module_filters: set[ModuleFilter]
+    ) -> AbstractGraph:
+        """Returns the graph to answer a query with, to which external modules that were collapsed to one of their
+        parent modules while building the graph are added if the query refers to them by name. The graph of this
+        evaluable is not changed, so that the result of a query does not depend on the queries run before it.
+        """
+        return self._graph.with_expanded_modules(
+            module_filter.identifier
+            for module_filter in module_filters
+            if not module_filter.identifier_is_regex
+        )
+
     def visualize(self, **kwargs: Any) -> None:
         self._graph.draw(**kwargs)  # type: ignore
 
     @property
     def modules(self) -> list[str]:
         return self._graph.nodes
+
+    def subtree_index(self) -> SubtreeIndex:
+        return self._graph.subtree_index()
+
+    def module_hierarchy(self) -> ModuleHierarchy:
+        return self._graph.module_hierarchy
+
+    @property
+    def build_statistics(self) -> BuildStatistics:
+        """Statistics about the work that was done while generating this evaluable."""
+        return self._build_statistics
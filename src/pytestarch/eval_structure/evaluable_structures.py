@@ -1,6 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
+    from pytestarch.eval_structure.subtree_index import SubtreeIndex
+    from pytestarch.eval_structure.types import Import
 
 AbstractNode = str
 
@@ -20,7 +27,40 @@ class AbstractGraph(ABC):
     def direct_predecessor_nodes(self, node: AbstractNode) -> list[AbstractNode]:
         raise NotImplementedError()
 
+    @abstractmethod
+    def hierarchy_children(self, node: AbstractNode) -> tuple[AbstractNode, ...]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def import_successors(self, node: AbstractNode) -> tuple[AbstractNode, ...]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def import_predecessors(self, node: AbstractNode) -> tuple[AbstractNode, ...]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def subtree_index(self) -> SubtreeIndex:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def with_dynamic_imports(self, imports: Iterable[Import]) -> AbstractGraph:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def with_expanded_modules(self, modules: Iterable[AbstractNode]) -> AbstractGraph:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def view(self, excluded_kinds: int) -> AbstractGraph:
+        raise NotImplementedError()
+
     @property
     @abstractmethod
     def nodes(self) -> list[AbstractNode]:
         raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def module_hierarchy(self) -> ModuleHierarchy:
+        raise NotImplementedError()
@@ -0,0 +1,129 @@
+"""Table of module names and their parent modules, shared by all components that build an evaluable."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+
+# parent id of top level modules
+NO_PARENT = -1
+
+
+class ModuleHierarchy:
+    """Interns the name of each module once and stores the id of its parent module, so that the parent modules of a
+    module can be iterated without creating any new strings.
+
+    Modules are added implicitly whenever they are looked up, together with all their parent modules. Ids are assigned in
+    the order in which modules are added; the parent of a module is always added before the module itself.
+
+    E.g. looking up 'a.b.c' adds
+    - names: ['a', 'a.b', 'a.b.c']
+    - parents: [NO_PARENT, 0, 1]
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._parents: list[int] = []
+        self._depths: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, module: str) -> bool:
+        return module in self._ids
+
+    def id(self, module: str) -> int:
+        """Returns the id of the given module, adding it and its parent modules if necessary.
+
+        Args:
+            module: full name of the module, e.g. 'a.b.c'
+        Returns:
+            id of the module
+        """
+        module_id = self._ids.get(module)
+
+        if module_id is None:
+            module_id = self._add(module)
+
+        return module_id
+
+    def name(self, module_id: int) -> str:
+        """Returns the interned name of the module with the given id."""
+        return self._names[module_id]
+
+    def parent(self, module_id: int) -> int:
+        """Returns the id of the parent module of the module with the given id, or NO_PARENT for top level modules."""
+        return self._parents[module_id]
+
+    def depth(self, module_id: int) -> int:
+        """Returns the number of parent modules of the module with the given id, e.g. 0 for 'a' and 2 for 'a.b.c'."""
+        return self._depths[module_id]
+
+    def intern(self, module: str) -> str:
+        """Returns the interned name of the given module, so that equal module names share the same string object."""
+        return self._names[self.id(module)]
+
+    def ancestors(self, module: str) -> Iterator[str]:
+        """Iterates over the names of all parent modules of the given module, starting with its direct parent.
+
+        Args:
+            module: full name of the module, e.g. 'a.b.c'
+        Returns:
+            names of the parent modules, e.g. 'a.b' and 'a'
+        """
+        parent_id = self._parents[self.id(module)]
+
+        while parent_id != NO_PARENT:
+            yield self._names[parent_id]
+            parent_id = self._parents[parent_id]
+
+    def parent_modules(self, module: str) -> list[str]:
+        """Same as get_parent_modules, but the names are taken from the table instead of being created again.
+
+        Args:
+            module: full name of the module, e.g. 'a.b.c'
+        Returns:
+            names of the parent modules, starting with the top level module, e.g. ['a', 'a.b']
+        """
+        parent_modules = list(self.ancestors(module))
+        parent_modules.reverse()
+
+        return parent_modules
+
+    def ancestor_at_depth(self, module: str, depth: int) -> str:
+        """Returns the name of the parent module of the given module with the given depth, or the name of the module
+        itself if it is not deeper than that.
+
+        Args:
+            module: full name of the module, e.g. 'a.b.c'
+            depth: number of parent modules the returned module has, e.g. 1 for 'a.b'
+        Returns:
+            name of the module or its parent module at the given depth
+        """
+        module_id = self.id(module)
+
+        for _ in range(self._depths[module_id] - depth):
+            module_id = self._parents[module_id]
+
+        return self._names[module_id]
+
+    def _add(self, module: str) -> int:
+        separator = module.rfind(".")
+
+        if separator == -1:
+            parent_id = NO_PARENT
+            depth = 0
+        else:
+            parent_id = self.id(module[:separator])
+            depth = self._depths[parent_id] + 1
+
+        module_id = len(self._names)
+        name = sys.intern(module)
+
+        self._ids[name] = module_id
+        self._names.append(name)
+        self._parents.append(parent_id)
+        self._depths.append(depth)
+
+        return module_id
@@ -5,7 +5,6 @@ from collections import defaultdict
 from collections.abc import Sequence
 from typing import cast
 
-from pytestarch.eval_structure.breadth_first_searches import get_all_submodules_of
 from pytestarch.eval_structure.evaluable_architecture import (
     EvaluableArchitecture,
     Module,
@@ -43,12 +42,14 @@ class ModuleNameConverter:
 
         converted_module_filters = set()
         conversion_mapping = defaultdict(list)
-        matching_submodules = set()
+        matching_submodules: set[str] = set()
 
         module_names_that_need_to_be_matched = list(
             map(lambda module: module.identifier, modules_that_need_converting)
         )
 
+        subtree_index = arch.subtree_index() if modules_that_need_converting else None
+
         for actually_present_module in arch.modules:
             for module_to_match in module_names_that_need_to_be_matched:
                 if cls._name_matches_pattern(module_to_match, actually_present_module):
@@ -62,14 +63,10 @@ class ModuleNameConverter:
 
                     never_matched.discard(module_to_match)
 
-                    submodules_of_match = get_all_submodules_of(
-                        arch._graph,  # type: ignore
-                        converted_module_filter,
+                    # the module itself should not count as its own submodule here
+                    matching_submodules.update(
+                        subtree_index.submodules(actually_present_module)[1:]  # type: ignore
                     )
-                    submodules_of_match.remove(
-                        actually_present_module
-                    )  # should not count as its own submodule here
-                    matching_submodules.update(submodules_of_match)
 
         if never_matched:
             raise ImpossibleMatch(
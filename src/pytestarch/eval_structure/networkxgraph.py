@@ -2,18 +2,36 @@
 
 from __future__ import annotations
 
+import bisect
+import copy
+import heapq
 import re
-from collections.abc import Sequence
+from collections.abc import Iterable
 from typing import Any
 
 import networkx as nx
 from networkx import draw_networkx, has_path, spring_layout
 
+from pytestarch.eval_structure.collapsed_imports import CollapsedImports
 from pytestarch.eval_structure.evaluable_structures import AbstractGraph, AbstractNode
-from pytestarch.eval_structure.types import Import, get_parent_modules
+from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
+from pytestarch.eval_structure.subtree_index import SubtreeIndex
+from pytestarch.eval_structure.types import (
+    IMPORT_KIND_COMBINATIONS,
+    RUNTIME_IMPORT,
+    Import,
+)
 
 EXPECTED_EDGE_AND_NODE_TYPES = "Only str and tuple of two str supported."
 
+# edge attribute marking imports that were recorded at runtime instead of found in the source code
+DYNAMIC = "dynamic"
+# edge attribute storing the kinds of the imports an edge represents as a bit mask with one bit per combination of
+# import kinds, e.g. 1 << (TYPE_CHECKING_IMPORT | LOCAL_IMPORT). Only set if not all imports are runtime imports
+KINDS = "kinds"
+RUNTIME_KINDS = 1 << RUNTIME_IMPORT
+ALL_KINDS = (1 << IMPORT_KIND_COMBINATIONS) - 1
+
 
 Node = AbstractNode
 
@@ -35,69 +53,98 @@ class NetworkxGraph(AbstractGraph):
     def __init__(
         self,
         all_modules: list[Node],
-        imports: Sequence[Import],
+        imports: Iterable[Import],
         level_limit: int | None = None,
+        module_hierarchy: ModuleHierarchy | None = None,
+        collapsed_imports: CollapsedImports | None = None,
     ) -> None:
         """
         Args:
             all_modules: list of all nodes in the graph, which can be connected by imports.
-            imports: all dependencies between the graph's nodes.
+            imports: all dependencies between the graph's nodes. Consumed exactly once, so this can be a generator.
             level_limit: if not None, specifies the depth of the graph
+            module_hierarchy: table of module names to look up parent modules in, shared with the other components
+                building the graph
+            collapsed_imports: if set, imports of external modules that were collapsed to one of their parent modules,
+                which are added to the graph once a rule refers to them
         """
         self._all_modules = all_modules
-        self._imports = imports
         self._graph = nx.DiGraph()
+        # the graph without any filter applied, to which collapsed modules are added
+        self._full_graph = self._graph
+        self._visible_kinds = ALL_KINDS
 
         self._level_limit = level_limit
+        self._module_hierarchy = (
+            module_hierarchy if module_hierarchy is not None else ModuleHierarchy()
+        )
+        self._collapsed_imports = collapsed_imports
+        # graph expanded by the collapsed modules most recently referred to, as the queries of a rule refer to the same
+        # modules
+        self._expanded_graph: tuple[frozenset[Node], NetworkxGraph] | None = None
+        self._neighbours: _Neighbours | None = None
+        self._subtree_index: SubtreeIndex | None = None
+
+        self._initialise(imports)
+        self._freeze()
 
-        self._initialise()
-        nx.freeze(self._graph)
+    @classmethod
+    def from_digraph(cls, graph: nx.DiGraph) -> NetworkxGraph:
+        """Wraps an existing networkx graph whose edges are marked like the edges of this graph, e.g. to draw a graph
+        of another backend.
+
+        Args:
+            graph: graph to wrap, which is frozen
+        """
+        instance = cls([], [])
+        instance._full_graph = graph
+        instance._freeze()
 
-    def _initialise(self) -> None:
+        return instance
+
+    def _freeze(self) -> None:
+        """Freezes the graph once all nodes and edges are added, filters it by the visible import kinds, and
+        precomputes the neighbours of each node."""
+        nx.freeze(self._full_graph)
+        self._graph = _filtered(self._full_graph, self._visible_kinds)
+        self._neighbours = _Neighbours(self._graph)
+        self._subtree_index = None
+
+    def _initialise(self, imports: Iterable[Import]) -> None:
         """Constructs a graph from all modules and their imports."""
         self._add_all_modules_as_nodes()
 
-        for imp in self._imports:
+        for imp in imports:
             importer = imp.importer()
             importee = imp.importee()
 
-            self._create_edge(importer, importee)
+            self._create_edge(importer, importee, kind=imp.kind())
 
-            self._add_edges_within_module_hierarchy(
-                imp.importer_parent_modules(),
-                importer,
-            )
+            self._add_edges_within_module_hierarchy(importer)
 
-            all_importee_modules = imp.importee_parent_modules() + [importee]
-
-            for parent, child in zip(
-                all_importee_modules[:-1], all_importee_modules[1:]
-            ):
-                self._create_edge(parent, child, inherits=True)
+            self._add_edges_within_module_hierarchy(importee, create_nodes=False)
 
     def _add_all_modules_as_nodes(self) -> None:
         for module in self._all_modules:
             self._create_node(module)
 
-            self._add_edges_within_module_hierarchy(
-                get_parent_modules(module),
-                module,
-            )
+            self._add_edges_within_module_hierarchy(module)
 
     def _add_edges_within_module_hierarchy(
-        self,
-        parent_modules: list[Node],
-        child: Node,
+        self, module: Node, create_nodes: bool = True
     ) -> None:
         """Create edges between a node and its parent recursively until the parent-less parent is reached.
 
         Args:
-            parent_modules: list of all parent modules in order, last element is the direct parent of the child module
-            child: lowest element in the module hierarchy
+            module: lowest element in the module hierarchy
+            create_nodes: if True, parent modules are added as nodes if they are not yet part of the graph
         """
-        all_modules = parent_modules + [child]
-        for parent, child in zip(all_modules[:-1], all_modules[1:]):
-            self._create_node(parent)
+        parent_modules = self._module_hierarchy.parent_modules(module)
+
+        for parent, child in zip(parent_modules, parent_modules[1:] + [module]):
+            if create_nodes:
+                self._create_node(parent)
+
             self._create_edge(parent, child, inherits=True)
 
     def _create_node(self, node: Node) -> None:
@@ -110,15 +157,117 @@ class NetworkxGraph(AbstractGraph):
         if node not in self._graph:
             self._graph.add_node(node)
 
+    def with_dynamic_imports(self, imports: Iterable[Import]) -> NetworkxGraph:
+        """Returns a copy of this graph, to which the given imports are added as edges marked as dynamic, e.g. imports
+        recorded while the code was running. Imports between modules that are not part of the graph are ignored.
+        Imports that are already part of the graph are not marked as dynamic, but count as runtime imports.
+
+        Args:
+            imports: imports to add to the copy of the graph
+        """
+        graph = copy.copy(self)
+        graph._graph = nx.DiGraph(self._graph)
+        graph._full_graph = graph._graph
+        graph._visible_kinds = ALL_KINDS
+        graph._expanded_graph = None
+
+        for imp in imports:
+            graph._create_edge(
+                imp.importer(), imp.importee(), dynamic=True, kind=imp.kind()
+            )
+
+        graph._freeze()
+        return graph
+
+    def with_expanded_modules(self, modules: Iterable[Node]) -> NetworkxGraph:
+        """Returns a copy of this graph, to which the given external modules are added together with their submodules
+        and all imports of them, if they were collapsed to one of their parent modules while the graph was built.
+        Returns this graph itself if none of the modules was collapsed. This graph is not changed, so that the modules
+        one rule refers to do not change the result of other rules.
+
+        Args:
+            modules: names of modules a rule refers to
+        """
+        if self._collapsed_imports is None:
+            return self
+
+        collapsed_modules = frozenset(
+            module for module in modules if module not in self._graph
+        )
+        if (
+            self._expanded_graph is not None
+            and self._expanded_graph[0] == collapsed_modules
+        ):
+            return self._expanded_graph[1]
+
+        imports = [
+            imp
+            for module in sorted(collapsed_modules)
+            for imp in self._collapsed_imports.expand(module)
+        ]
+        if not imports:
+            return self
+
+        graph = copy.copy(self)
+        # added to the unfiltered graph, so that a view also hides the added imports of excluded kinds
+        graph._graph = nx.DiGraph(self._full_graph)
+        graph._full_graph = graph._graph
+        graph._expanded_graph = None
+
+        for importer, importee, kind in imports:
+            graph._create_node(importee)
+            graph._add_edges_within_module_hierarchy(importee)
+            graph._create_edge(importer, importee, kind=kind)
+
+        graph._freeze()
+
+        self._expanded_graph = (collapsed_modules, graph)
+        return graph
+
+    def view(self, excluded_kinds: int) -> NetworkxGraph:
+        """Returns a view of this graph without the imports of the given kinds. The view shares the nodes and edges of
+        this graph instead of copying them; edges are filtered whenever they are accessed.
+
+        An edge is only hidden if all imports it represents are of one of the excluded kinds, e.g. an edge representing
+        both an import at module level and an import within a function is not hidden if LOCAL_IMPORT is excluded.
+
+        Args:
+            excluded_kinds: combination of import kind flags, e.g. TYPE_CHECKING_IMPORT | LOCAL_IMPORT
+        """
+        graph = copy.copy(self)
+        graph._visible_kinds = self._visible_kinds & sum(
+            1 << kinds
+            for kinds in range(IMPORT_KIND_COMBINATIONS)
+            if not kinds & excluded_kinds
+        )
+        graph._graph = _filtered(self._full_graph, graph._visible_kinds)
+        graph._expanded_graph = None
+        # computed once the view is queried, so that creating a view does not depend on the size of the graph
+        graph._neighbours = None
+
+        return graph
+
+    def is_dynamic(self, node_start: Node, node_end: Node) -> bool:
+        """Returns True if the edge between the two nodes was only added as a dynamic import."""
+        return self._graph.get_edge_data(node_start, node_end).get(DYNAMIC, False)
+
     def _create_edge(
-        self, node_start: Node, node_end: Node, inherits: bool = False
+        self,
+        node_start: Node,
+        node_end: Node,
+        inherits: bool = False,
+        dynamic: bool = False,
+        kind: int = RUNTIME_IMPORT,
     ) -> None:
-        """Creates an edge in the graph between the two given modules.
+        """Creates an edge in the graph between the two given modules. If the edge already exists, the kind of the
+        import is added to it.
 
         Args:
             node_start: node the edge starts from
             node_end: node the edge points towards
             inherits: if True, edge will be marked as belonging to two nodes that are connected in a parent-child-relationship
+            dynamic: if True, edge will be marked as a dynamic import
+            kind: kind of the import the edge represents
         """
         node_start = self._flatten_graph_node(node_start)
         node_end = self._flatten_graph_node(node_end)
@@ -132,12 +281,28 @@ class NetworkxGraph(AbstractGraph):
         # foo.bar will only be added if both importer
         # and importee are already part of the eval_structure (which they will
         # be if they correspond to modules in the file system
-        if (
-            self._graph.has_node(node_start)
-            and self._graph.has_node(node_end)
-            and not self._edge_already_present(node_start, node_end, inherits)
-        ):
-            self._graph.add_edge(node_start, node_end, inherits=inherits)
+        if not self._graph.has_node(node_start) or not self._graph.has_node(node_end):
+            return
+
+        if self._edge_already_present(node_start, node_end, inherits):
+            if not inherits:
+                self._add_import_kind(node_start, node_end, kind)
+            return
+
+        attributes: dict[str, Any] = {"inherits": inherits}
+        if dynamic:
+            attributes[DYNAMIC] = True
+        if kind != RUNTIME_IMPORT:
+            attributes[KINDS] = 1 << kind
+
+        self._graph.add_edge(node_start, node_end, **attributes)
+
+    def _add_import_kind(self, node_start: Node, node_end: Node, kind: int) -> None:
+        edge_data = self._graph.adj[node_start][node_end]
+        kinds = edge_data.get(KINDS, RUNTIME_KINDS) | 1 << kind
+
+        if kinds != RUNTIME_KINDS:
+            edge_data[KINDS] = kinds
 
     def __contains__(self, item) -> bool:
         if not isinstance(item, str | tuple):
@@ -147,11 +312,11 @@ class NetworkxGraph(AbstractGraph):
             return self._graph.has_node(item)
 
         if (
-            len(item) > 2
+            len(item) != 2
             or not isinstance(item[0], str)
             or not isinstance(item[1], str)
         ):
-            TypeError(EXPECTED_EDGE_AND_NODE_TYPES)
+            raise TypeError(EXPECTED_EDGE_AND_NODE_TYPES)
 
         return self._graph.has_edge(*item) or has_path(self._graph, *item)
 
@@ -180,7 +345,14 @@ class NetworkxGraph(AbstractGraph):
         Returns:
             all predecessor nodes
         """
-        return sorted(self._graph.predecessors(node))
+        neighbours = self._neighbour_index()
+        predecessors = list(neighbours.import_predecessors[node])
+
+        parent = neighbours.parents.get(node)
+        if parent is not None:
+            bisect.insort(predecessors, parent)
+
+        return predecessors
 
     def direct_successor_nodes(self, node: Node) -> list[Node]:
         """Returns all nodes that the given node has a directed edge towards.
@@ -191,7 +363,45 @@ class NetworkxGraph(AbstractGraph):
         Returns:
             all successor nodes
         """
-        return sorted(self._graph.successors(node))
+        neighbours = self._neighbour_index()
+
+        return list(
+            heapq.merge(
+                neighbours.hierarchy_children[node], neighbours.import_successors[node]
+            )
+        )
+
+    def hierarchy_children(self, node: Node) -> tuple[Node, ...]:
+        """Returns the child modules of the given node, sorted by name."""
+        return self._neighbour_index().hierarchy_children[node]
+
+    def import_successors(self, node: Node) -> tuple[Node, ...]:
+        """Returns the modules imported by the given node, sorted by name."""
+        return self._neighbour_index().import_successors[node]
+
+    def import_predecessors(self, node: Node) -> tuple[Node, ...]:
+        """Returns the modules importing the given node, sorted by name."""
+        return self._neighbour_index().import_predecessors[node]
+
+    @property
+    def module_hierarchy(self) -> ModuleHierarchy:
+        """Table of module names shared with the other components that built this graph."""
+        return self._module_hierarchy
+
+    def subtree_index(self) -> SubtreeIndex:
+        """Returns the index of the module hierarchy of this graph, which is built on first use. Views share the index
+        of the graph they are created from, as imports of any kind are no edges within the module hierarchy.
+        """
+        if self._subtree_index is None:
+            self._subtree_index = SubtreeIndex(self._graph, self.hierarchy_children)
+
+        return self._subtree_index
+
+    def _neighbour_index(self) -> _Neighbours:
+        if self._neighbours is None:
+            self._neighbours = _Neighbours(self._graph)
+
+        return self._neighbours
 
     def parent_child_relationship(
         self, supposed_parent_node: Node, supposed_child_node: Node
@@ -205,9 +415,10 @@ class NetworkxGraph(AbstractGraph):
         Returns:
             True if supposed parent is actually parent of supposed child node
         """
-        edge_data = self._graph.get_edge_data(supposed_parent_node, supposed_child_node)
-
-        return edge_data["inherits"]
+        return (
+            self._neighbour_index().parents.get(supposed_child_node)
+            == supposed_parent_node
+        )
 
     def draw(self, **kwargs: Any) -> None:
         """Creates a matplotlib plot representing the graph.
@@ -311,8 +522,7 @@ class NetworkxGraph(AbstractGraph):
         # not to be included: src.A.a, src.A.aa, src.B.b, ...
         # logic: include at most level "." in the node name
 
-        node_parts = node.split(".")
-        return ".".join(node_parts[: self._level_limit + 1])
+        return self._module_hierarchy.ancestor_at_depth(node, self._level_limit)
 
     def _edge_already_present(
         self, node_start: Node, node_end: Node, inherits: bool
@@ -320,4 +530,51 @@ class NetworkxGraph(AbstractGraph):
         if not self._graph.has_edge(node_start, node_end):
             return False
 
-        return self.parent_child_relationship(node_start, node_end) == inherits
+        return self._graph.adj[node_start][node_end]["inherits"] == inherits
+
+
+class _Neighbours:
+    """Neighbours of each node of a frozen graph, split into the edges within the module hierarchy and import edges, so
+    that graph searches neither sort the neighbours of a node nor look up the attributes of an edge whenever they visit
+    it.
+    """
+
+    def __init__(self, graph: nx.DiGraph) -> None:
+        hierarchy_children: dict[Node, list[Node]] = {node: [] for node in graph}
+        import_successors: dict[Node, list[Node]] = {node: [] for node in graph}
+        import_predecessors: dict[Node, list[Node]] = {node: [] for node in graph}
+        self.parents: dict[Node, Node] = {}
+
+        for node_start, node_end, inherits in graph.edges(data="inherits"):
+            if inherits:
+                hierarchy_children[node_start].append(node_end)
+                self.parents[node_end] = node_start
+            else:
+                import_successors[node_start].append(node_end)
+                import_predecessors[node_end].append(node_start)
+
+        self.hierarchy_children = _sorted_tuples(hierarchy_children)
+        self.import_successors = _sorted_tuples(import_successors)
+        self.import_predecessors = _sorted_tuples(import_predecessors)
+
+
+def _sorted_tuples(neighbours: dict[Node, list[Node]]) -> dict[Node, tuple[Node, ...]]:
+    return {node: tuple(sorted(nodes)) for node, nodes in neighbours.items()}
+
+
+def _filtered(graph: nx.DiGraph, visible_kinds: int) -> nx.DiGraph:
+    """Returns a view of the given graph without the import edges whose kinds are not visible, or the graph itself if
+    all kinds are visible."""
+    if visible_kinds == ALL_KINDS:
+        return graph
+
+    adjacency = graph.adj
+
+    def is_visible(node_start: Node, node_end: Node) -> bool:
+        edge_data = adjacency[node_start][node_end]
+
+        return edge_data["inherits"] or bool(
+            edge_data.get(KINDS, RUNTIME_KINDS) & visible_kinds
+        )
+
+    return nx.subgraph_view(graph, filter_edge=is_visible)
@@ -0,0 +1,82 @@
+"""Index of the module hierarchy of a graph, in which each module is directly followed by all of its submodules."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from pytestarch.eval_structure.evaluable_structures import AbstractNode
+
+Node = AbstractNode
+
+
+class SubtreeIndex:
+    """Orders the modules of a graph by a depth-first traversal of the module hierarchy, and stores for each module the
+    position at which the traversal enters it and the position after its last submodule. A module is a submodule of
+    another module if its entry lies within the interval of the other module, and the submodules of a module are a
+    contiguous slice of the ordered modules.
+
+    E.g. the modules 'a', 'a.b', 'a.b.c', 'a.d' and 'e' result in
+    - order: ['a', 'a.b', 'a.b.c', 'a.d', 'e']
+    - entries: [0, 1, 2, 3, 4]
+    - exits: [4, 3, 3, 4, 5]
+    """
+
+    def __init__(
+        self,
+        nodes: Iterable[Node],
+        hierarchy_children: Callable[[Node], Iterable[Node]],
+    ) -> None:
+        """
+        Args:
+            nodes: all nodes of the graph
+            hierarchy_children: returns the child modules of a node
+        """
+        children = {node: tuple(hierarchy_children(node)) for node in nodes}
+        has_parent = {
+            child for node_children in children.values() for child in node_children
+        }
+
+        self._order: list[Node] = []
+        self._entries: dict[Node, int] = {}
+        self._exits: dict[Node, int] = {}
+
+        for root in sorted(node for node in children if node not in has_parent):
+            self._enter(root)
+            nodes_to_visit = [(root, iter(children[root]))]
+
+            while nodes_to_visit:
+                node, remaining_children = nodes_to_visit[-1]
+                child = next(remaining_children, None)
+
+                if child is None:
+                    nodes_to_visit.pop()
+                    self._exits[node] = len(self._order)
+                else:
+                    self._enter(child)
+                    nodes_to_visit.append((child, iter(children[child])))
+
+    def _enter(self, node: Node) -> None:
+        self._entries[node] = len(self._order)
+        self._order.append(node)
+
+    def __contains__(self, module: Node) -> bool:
+        return module in self._entries
+
+    def is_submodule_of(self, module: Node, parent: Node) -> bool:
+        """Returns True if the given module is the given parent module or one of its submodules, at any depth.
+
+        Args:
+            module: supposed submodule
+            parent: supposed parent module
+        """
+        entry = self._entries[module]
+
+        return self._entries[parent] <= entry < self._exits[parent]
+
+    def submodules(self, module: Node) -> list[Node]:
+        """Returns the given module followed by all of its submodules, at any depth.
+
+        Args:
+            module: module to retrieve submodules of
+        """
+        return self._order[self._entries[module] : self._exits[module]]
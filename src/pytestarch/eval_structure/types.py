@@ -2,12 +2,31 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+# kinds of imports, which are bit flags that can be combined, e.g. TYPE_CHECKING_IMPORT | LOCAL_IMPORT for an import
+# in a function within an 'if TYPE_CHECKING:' block
+RUNTIME_IMPORT = 0
+# import within an 'if TYPE_CHECKING:' block
+TYPE_CHECKING_IMPORT = 1
+# import within a function
+LOCAL_IMPORT = 2
+# import within a try block, e.g. of an optional dependency with a fallback in the except handler
+GUARDED_IMPORT = 4
+# number of different combinations of import kinds
+IMPORT_KIND_COMBINATIONS = 8
+
 
 class Import(ABC):
-    def __init__(self, importer: str) -> None:
-        self._importer = importer
+    """Single import of a module by another module.
+
+    Imports are created for every import statement of the analysed code, so they only store the names of the modules
+    in slots; the names of their parent modules are calculated when they are requested.
+    """
+
+    __slots__ = ("_importer", "_kind")
 
-        self._importer_module_hierarchy = get_parent_modules(self._importer)
+    def __init__(self, importer: str, kind: int = RUNTIME_IMPORT) -> None:
+        self._importer = importer
+        self._kind = kind
 
     def importer(self) -> str:
         """Returns name of the module that imports something.
@@ -17,13 +36,21 @@ class Import(ABC):
         """
         return self._importer
 
+    def kind(self) -> int:
+        """Returns the kind of the import, e.g. TYPE_CHECKING_IMPORT, or RUNTIME_IMPORT for an import at module level.
+
+        Returns:
+            combination of import kind flags
+        """
+        return self._kind
+
     def importer_parent_modules(self) -> list[str]:
         """Returns names of all parent modules of the importing module.
 
         Returns:
             list of module names
         """
-        return self._importer_module_hierarchy
+        return get_parent_modules(self._importer)
 
     @abstractmethod
     def importee(self) -> str:
@@ -65,12 +92,10 @@ def get_parent_modules(module: str) -> list[str]:
     """
     parent_modules = []
 
-    parent: list[str] = []
-
-    for char in module:
-        if char == ".":
-            parent_modules.append("".join(parent))
+    separator = module.find(".")
 
-        parent.append(char)
+    while separator != -1:
+        parent_modules.append(module[:separator])
+        separator = module.find(".", separator + 1)
 
     return parent_modules
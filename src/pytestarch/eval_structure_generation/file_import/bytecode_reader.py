@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import dis
+import importlib.util
+import inspect
+import marshal
+import os
+from pathlib import Path
+from types import CodeType
+
+from pytestarch.eval_structure.types import LOCAL_IMPORT, RUNTIME_IMPORT
+from pytestarch.eval_structure_generation.file_import.import_types import RawImport
+from pytestarch.eval_structure_generation.file_import.source_reader import Source
+
+SOURCE = "source"
+BYTECODE = "bytecode"
+SOURCE_KINDS = (SOURCE, BYTECODE)
+
+# layout of the header of a .pyc file, see PEP 552
+HEADER_SIZE = 16
+HASH_BASED_FLAG = 0b1
+
+IMPORT_NAME = dis.opmap["IMPORT_NAME"]
+EXTENDED_ARG = dis.opmap["EXTENDED_ARG"]
+LOAD_CONST = dis.opmap["LOAD_CONST"]
+# small integers such as the level of an import are loaded via a dedicated instruction as of python 3.14
+LOAD_SMALL_INT = dis.opmap.get("LOAD_SMALL_INT")
+
+
+def read_bytecode_imports(path: Path, source: Source) -> list[RawImport] | None:
+    """Returns the raw imports of a python file based on its cached bytecode in the __pycache__ directory, as written
+    by the interpreter when importing the file or by compileall.
+
+    In contrast to ImportConverter.extract_raw_imports, the imports of all blocks are found, e.g. also imports in the
+    else branch of an if statement, as the bytecode does not reveal the block an import is located in. For the same
+    reason, imports are only marked as LOCAL_IMPORT if they are located in a function; imports within an
+    'if TYPE_CHECKING:' block or a try block are runtime imports.
+
+    Args:
+        path: absolute path of the python file
+        source: undecoded content of the python file, used to validate hash-based .pyc files
+    Returns:
+        raw imports of the file, or None if there is no .pyc file or it is outdated
+    """
+    try:
+        with open(importlib.util.cache_from_source(str(path)), "rb") as file:
+            data = file.read()
+    except (OSError, NotImplementedError):
+        return None
+
+    if not _is_valid(data, path, source):
+        return None
+
+    # the code objects are only inspected, never executed
+    try:
+        code = marshal.loads(data[HEADER_SIZE:])  # noqa: S302
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(code, CodeType):
+        return None
+
+    return extract_imports_from_code(code)
+
+
+def extract_imports_from_code(
+    code: CodeType, kind: int = RUNTIME_IMPORT
+) -> list[RawImport]:
+    """Returns the raw imports of the given code object and all code objects nested in it, e.g. of functions and
+    classes. The level and the names listed by an import statement are the two constants loaded directly before the
+    import instruction.
+    """
+    imports = []
+
+    if code.co_flags & inspect.CO_OPTIMIZED:
+        # only the code objects of functions have fast locals
+        kind |= LOCAL_IMPORT
+
+    # values of the two constants loaded last
+    level: object = None
+    fromlist: object = None
+    extended_arg = 0
+    bytecode = code.co_code
+
+    for offset in range(0, len(bytecode), 2):
+        opcode = bytecode[offset]
+        arg = bytecode[offset + 1] | extended_arg
+
+        if opcode == EXTENDED_ARG:
+            extended_arg = arg << 8
+            continue
+
+        extended_arg = 0
+
+        if opcode == LOAD_CONST:
+            level, fromlist = fromlist, code.co_consts[arg]
+        elif opcode == LOAD_SMALL_INT:
+            level, fromlist = fromlist, arg
+        elif opcode == IMPORT_NAME and isinstance(level, int):
+            imports.extend(_to_raw_imports(code.co_names[arg], level, fromlist, kind))
+
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            imports.extend(extract_imports_from_code(constant, kind))
+
+    return imports
+
+
+def _to_raw_imports(
+    name: str, level: int, fromlist: object, kind: int
+) -> list[RawImport]:
+    if level == 0:
+        return [RawImport(name, None, 0, kind)]
+
+    if not isinstance(fromlist, tuple):
+        # only possible for code that was not compiled from an import statement, e.g. __import__('a', level=1)
+        return []
+
+    return [
+        RawImport(name or None, imported_name, level, kind)
+        for imported_name in fromlist
+    ]
+
+
+def _is_valid(data: bytes, path: Path, source: Source) -> bool:
+    """Returns True if the .pyc file was compiled by the running interpreter from the current source code, either
+    checked by the source hash or by the modification time and size of the source file.
+    """
+    if len(data) < HEADER_SIZE or data[:4] != importlib.util.MAGIC_NUMBER:
+        return False
+
+    flags = int.from_bytes(data[4:8], "little")
+
+    if flags & HASH_BASED_FLAG:
+        return data[8:16] == importlib.util.source_hash(source)  # type: ignore[arg-type]
+
+    stat = os.stat(path)
+    mtime = int.from_bytes(data[8:12], "little")
+    size = int.from_bytes(data[12:16], "little")
+
+    return (
+        mtime == int(stat.st_mtime) & 0xFFFFFFFF and size == stat.st_size & 0xFFFFFFFF
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 
 
 @dataclass
@@ -11,6 +12,32 @@ class Config:
         excluded_directories: Directory paths not to include in parsing specified via regex. Can be used to exclude
         e.g. test directories.
         excluded_external_dependencies: All external dependencies matching these patterns shall be excluded.
+        cache_dir: If set, the raw imports of each parsed file are cached in this directory and reused as long as
+        the file does not change.
+        workers: Number of workers used to parse files and extract their imports.
+        scanner: Method used to find the imports in a file, either 'ast', 'tokenize', or 'header_only'.
+        respect_ignore_files: If True, files and directories ignored by .gitignore or .ignore files are not parsed.
+        max_file_size: Files larger than this number of bytes are not parsed.
+        generated_file_marker: Files whose header matches this regex are not parsed.
+        skipped_file_imports: Either 'scan' to extract the imports of files that are not parsed from the lines that
+        contain import statements, or 'ignore' to ignore their imports.
+        header_only_verification: Fraction of files that are additionally parsed completely to report imports missed
+        by the 'header_only' scanner.
+        source: Either 'source' to find the imports in the source code of each file, or 'bytecode' to read them from
+        the cached bytecode of each file if it is up-to-date.
+        prefetch_bytes: If not 0, files are read ahead in background threads until they take up this number of bytes.
+        executor: Kind of workers used to parse files, either 'process', 'thread' or, as of Python 3.14, 'interpreter'.
     """
 
     excluded_directories: tuple[str, ...]
+    cache_dir: Path | None = None
+    workers: int = 1
+    scanner: str = "ast"
+    respect_ignore_files: bool = False
+    max_file_size: int | None = None
+    generated_file_marker: str | None = None
+    skipped_file_imports: str = "scan"
+    header_only_verification: float = 0.0
+    source: str = "source"
+    prefetch_bytes: int = 0
+    executor: str = "process"
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
 import ast
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 
-from pytestarch.eval_structure.types import Import
+from pytestarch.eval_structure.types import (
+    GUARDED_IMPORT,
+    LOCAL_IMPORT,
+    RUNTIME_IMPORT,
+    TYPE_CHECKING_IMPORT,
+    Import,
+)
 from pytestarch.eval_structure_generation.file_import.import_types import (
     AbsoluteImport,
+    ModuleImports,
     NamedModule,
+    RawImport,
     RelativeImport,
 )
 
+TYPE_CHECKING = "TYPE_CHECKING"
+FUNCTION_STATEMENTS = (ast.FunctionDef, ast.AsyncFunctionDef)
+# 'try: ... except* ...' statements are only available as of python 3.11
+TRY_STATEMENTS = tuple(
+    getattr(ast, name) for name in ("Try", "TryStar") if hasattr(ast, name)
+)
+
 
 class ImportConverter:
     """Converts all ast imports to custom import types."""
@@ -55,6 +70,94 @@ class ImportConverter:
 
         return imports
 
+    def convert_raw_imports(
+        self,
+        module_imports: Iterable[ModuleImports],
+        absolute_import_prefix: str,
+        internal_modules: set[str],
+    ) -> Iterator[Import]:
+        """Converts the raw imports of multiple modules to custom import objects. The import objects are created
+        lazily, so that they do not all need to be kept in memory at the same time.
+
+        Args:
+            module_imports: raw imports per module
+            absolute_import_prefix: prefix for modules imported via absolute import
+            internal_modules: set of all internal modules
+        Returns:
+            import objects
+        """
+        for module in module_imports:
+            for raw_import in module.imports:
+                yield self.to_import(
+                    module.name, raw_import, absolute_import_prefix, internal_modules
+                )
+
+    def extract_raw_imports(self, module: ast.Module) -> list[RawImport]:
+        """Collects all imports of a single parsed file without resolving any module names. In contrast to the
+        ast module, the result is small and can be cached or sent to other processes cheaply.
+
+        Each import is marked with the kinds of the blocks it is located in, e.g. TYPE_CHECKING_IMPORT for an import
+        within an 'if TYPE_CHECKING:' block.
+
+        Args:
+            module: ast module of a single file
+        Returns:
+            list of raw imports
+        """
+        nodes_to_search: list[tuple[ast.AST, int]] = [(module, RUNTIME_IMPORT)]
+        raw_imports: list[RawImport] = []
+
+        while nodes_to_search:
+            node, kind = nodes_to_search.pop()
+
+            if hasattr(node, "body"):
+                body_kind = kind | self._block_kind(node)
+                nodes_to_search.extend((child, body_kind) for child in node.body)  # type: ignore
+            else:
+                new_imports = self._extract(node, kind)
+
+                if new_imports:
+                    raw_imports.extend(new_imports)
+
+        return raw_imports
+
+    def to_import(
+        self,
+        module_name: str,
+        raw_import: RawImport,
+        absolute_import_prefix: str,
+        all_internal_modules: set[str],
+    ) -> Import:
+        """Converts a raw import to a custom import object.
+
+        Args:
+            module_name: name of the importing module
+            raw_import: import to convert
+            absolute_import_prefix: prefix for modules imported via absolute import
+            all_internal_modules: set of all internal modules
+
+        Returns:
+            calculated import object
+        """
+        if raw_import.level == 0:
+            return AbsoluteImport(
+                module_name,
+                self._adjust_with_root_prefix(
+                    raw_import.module,  # type: ignore
+                    absolute_import_prefix,
+                    all_internal_modules,
+                ),
+                raw_import.kind,
+            )
+
+        return RelativeImport(
+            module_name,
+            raw_import.module,
+            raw_import.name,
+            raw_import.level,
+            raw_import.kind,
+        )
+
     def _convert(
         self,
         module: ast.Module,
@@ -73,41 +176,65 @@ class ImportConverter:
         Returns:
             list of calculated import objects
         """
-        new_imports: Sequence[Import] | None = None
-
-        if isinstance(module, ast.Import):
-            new_imports = []
-            for alias in module.names:
-                new_imports.append(
-                    AbsoluteImport(
-                        module_name,
-                        self._adjust_with_root_prefix(
-                            alias.name, absolute_import_prefix, all_internal_modules
-                        ),
-                    )
-                )  # type: ignore
-        elif isinstance(module, ast.ImportFrom):
-            if module.level == 0:
-                new_imports = [
-                    AbsoluteImport(
-                        module_name,
-                        self._adjust_with_root_prefix(
-                            module.module,  # type: ignore
-                            absolute_import_prefix,
-                            all_internal_modules,
-                        ),
-                    )
-                ]
-            else:
-                new_imports = []
-                for alias in module.names:
-                    new_imports.append(
-                        RelativeImport(
-                            module_name, module.module, alias.name, module.level
-                        )
-                    )
-
-        return new_imports
+        raw_imports = self._extract(module)
+
+        if raw_imports is None:
+            return None
+
+        return [
+            self.to_import(
+                module_name, raw_import, absolute_import_prefix, all_internal_modules
+            )
+            for raw_import in raw_imports
+        ]
+
+    @classmethod
+    def _extract(
+        cls, node: ast.AST, kind: int = RUNTIME_IMPORT
+    ) -> list[RawImport] | None:
+        """Calculates the raw imports of the given ast node, if it is an import statement."""
+        if isinstance(node, ast.Import):
+            return [RawImport(alias.name, None, 0, kind) for alias in node.names]
+
+        if isinstance(node, ast.ImportFrom):
+            if node.level == 0:
+                return [RawImport(node.module, None, 0, kind)]
+
+            return [
+                RawImport(node.module, alias.name, node.level, kind)
+                for alias in node.names
+            ]
+
+        return None
+
+    @classmethod
+    def _block_kind(cls, node: ast.AST) -> int:
+        """Returns the kind of all imports within the body of the given statement."""
+        if isinstance(node, FUNCTION_STATEMENTS):
+            return LOCAL_IMPORT
+
+        if isinstance(node, TRY_STATEMENTS):
+            return GUARDED_IMPORT
+
+        if isinstance(node, ast.If) and cls._is_type_checking(node.test):
+            return TYPE_CHECKING_IMPORT
+
+        return RUNTIME_IMPORT
+
+    @classmethod
+    def _is_type_checking(cls, condition: ast.expr) -> bool:
+        """Returns True for the conditions 'TYPE_CHECKING' and e.g. 'typing.TYPE_CHECKING'."""
+        if isinstance(condition, ast.Name):
+            return condition.id == TYPE_CHECKING
+
+        if not isinstance(condition, ast.Attribute) or condition.attr != TYPE_CHECKING:
+            return False
+
+        value = condition.value
+        while isinstance(value, ast.Attribute):
+            value = value.value
+
+        return isinstance(value, ast.Name)
 
     @classmethod
     def _adjust_with_root_prefix(
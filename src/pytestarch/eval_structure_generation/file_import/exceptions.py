@@ -3,3 +3,7 @@ from __future__ import annotations
 
 class ImportException(Exception):
     pass
+
+
+class GitError(Exception):
+    """Raised if git fails or the repository does not contain a requested object."""
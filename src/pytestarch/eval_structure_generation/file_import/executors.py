@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import concurrent.futures
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+# pools of subinterpreters are available as of python 3.14
+_INTERPRETER_POOL_EXECUTOR = getattr(
+    concurrent.futures, "InterpreterPoolExecutor", None
+)
+
+PROCESS_EXECUTOR = "process"
+THREAD_EXECUTOR = "thread"
+INTERPRETER_EXECUTOR = "interpreter"
+EXECUTORS = (PROCESS_EXECUTOR, THREAD_EXECUTOR) + (
+    (INTERPRETER_EXECUTOR,) if _INTERPRETER_POOL_EXECUTOR is not None else ()
+)
+
+
+def create_executor(kind: str, workers: int) -> Executor:
+    """Creates a pool of workers to parse files in parallel.
+
+    Worker processes pay for starting a new interpreter and for pickling the function and its results, but parse in
+    parallel regardless of the global interpreter lock. Threads start instantly and share memory, but only parse in
+    parallel on free-threaded builds of Python, since parsing holds the global interpreter lock otherwise.
+    Subinterpreters run in threads of the current process, but each has its own global interpreter lock, so they parse
+    in parallel on all builds; like processes, they pay for pickling the function and its results.
+
+    Args:
+        kind: one of EXECUTORS
+        workers: maximum number of workers
+    Returns:
+        executor, which has to be shut down by the caller
+    """
+    if kind == THREAD_EXECUTOR:
+        return ThreadPoolExecutor(max_workers=workers)
+
+    if kind == INTERPRETER_EXECUTOR and _INTERPRETER_POOL_EXECUTOR is not None:
+        return _INTERPRETER_POOL_EXECUTOR(max_workers=workers)
+
+    return ProcessPoolExecutor(max_workers=workers)
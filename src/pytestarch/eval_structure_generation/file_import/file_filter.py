@@ -1,39 +1,90 @@
 from __future__ import annotations
 
 import re
-from functools import singledispatchmethod
 from pathlib import Path
 
 from pytestarch.eval_structure_generation.file_import.config import Config
 
 ALL_MARKER = "*"
 
+REGEX_ALL_MARKER = ".*"
+REGEX_END_MARKER = "$"
+
+# group references depend on the position of the group in the pattern, which changes if patterns are combined
+GROUP_REFERENCE = re.compile(r"\\\d|\(\?P=")
+
 
 class FileFilter:
-    """Uses a regex pattern to determine whether a file or directory should be excluded."""
+    """Uses a regex pattern to determine whether a file or directory should be excluded.
+
+    Patterns of the form '.*text.*' and '.*text$', where text does not contain any special regex characters, are checked
+    via simple string operations. All remaining patterns are combined into a single regex.
+    """
 
     def __init__(self, config: Config) -> None:
-        self._excluded_directories = [
-            re.compile(directory_pattern)
-            for directory_pattern in config.excluded_directories
-        ]
+        self._excluded_directories = config.excluded_directories
 
-    @singledispatchmethod
-    def is_excluded(self, obj: str | Path) -> bool:
-        """Returns True if the object matches one of the pre-configured exclusion patterns."""
-        raise NotImplementedError
+        self._contained_literals: list[str] = []
+        self._trailing_literals: list[str] = []
+        regex_patterns = []
+
+        for pattern in self._excluded_directories:
+            if not self._add_literal(pattern):
+                regex_patterns.append(pattern)
 
-    @is_excluded.register(Path)
-    def _(self, obj: Path) -> bool:
-        path_as_str = str(obj)
+        self._patterns = self._compile(regex_patterns)
 
-        return self.is_excluded(path_as_str)
+    def is_excluded(self, obj: str | Path) -> bool:
+        """Returns True if the object matches one of the pre-configured exclusion patterns."""
+        path_as_str = obj if isinstance(obj, str) else str(obj)
 
-    @is_excluded.register(str)
-    def _(self, obj: str) -> bool:
-        return any(
-            re.match(pattern, obj) is not None for pattern in self._excluded_directories
+        return (
+            any(literal in path_as_str for literal in self._contained_literals)
+            or path_as_str.endswith(tuple(self._trailing_literals))
+            or any(pattern.match(path_as_str) for pattern in self._patterns)
         )
 
     def has_filter(self) -> bool:
         return len(self._excluded_directories) > 0
+
+    def _add_literal(self, pattern: str) -> bool:
+        """If the pattern only checks whether a string contains or ends with a certain text, this text is stored
+        so that it can be checked without a regex. Returns True if this was the case.
+        """
+        if not pattern.startswith(REGEX_ALL_MARKER):
+            return False
+
+        if pattern.endswith(REGEX_ALL_MARKER) and len(pattern) > 2 * len(
+            REGEX_ALL_MARKER
+        ):
+            literals = self._contained_literals
+            text = pattern[len(REGEX_ALL_MARKER) : -len(REGEX_ALL_MARKER)]
+        elif pattern.endswith(REGEX_END_MARKER) and not pattern.endswith(
+            "\\" + REGEX_END_MARKER
+        ):
+            literals = self._trailing_literals
+            text = pattern[len(REGEX_ALL_MARKER) : -len(REGEX_END_MARKER)]
+        else:
+            return False
+
+        unescaped_text = re.sub(r"\\(.)", r"\1", text)
+
+        # only plain text, e.g. '__init__\.py', but not 'Test.py', where '.' matches any character
+        if not unescaped_text or re.escape(unescaped_text) != text:
+            return False
+
+        literals.append(unescaped_text)
+        return True
+
+    @classmethod
+    def _compile(cls, patterns: list[str]) -> list[re.Pattern[str]]:
+        """Combines all patterns into a single regex. If this is not possible, e.g. because a pattern contains
+        group references or global flags, each pattern is compiled on its own.
+        """
+        if len(patterns) <= 1 or any(GROUP_REFERENCE.search(p) for p in patterns):
+            return [re.compile(pattern) for pattern in patterns]
+
+        try:
+            return [re.compile("|".join(f"(?:{pattern})" for pattern in patterns))]
+        except re.error:
+            return [re.compile(pattern) for pattern in patterns]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from types import TracebackType
+from typing import IO
+
+from pytestarch.eval_structure_generation.file_import.exceptions import GitError
+from pytestarch.eval_structure_generation.file_import.import_types import (
+    ExtractedImports,
+)
+
+GIT_EXECUTABLE = "git"
+
+BLOB = "blob"
+# mode of symbolic links, whose blobs contain the link target instead of python code
+SYMBOLIC_LINK_MODE = "120000"
+
+
+class GitRepository:
+    """Reads commits and file contents directly from the object database of a git repository, without checking
+    anything out.
+
+    The contents of files are read via a single long-running 'git cat-file --batch' process, so that no process has to
+    be started per file. Can be used as a context manager, which stops the process on exit; it is started again once
+    the next blob is read.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path: path of the repository or of any directory within its working tree
+        """
+        self._path = path
+        self.top_level = Path(self._run("rev-parse", "--show-toplevel").strip())
+        self._cat_file: subprocess.Popen[bytes] | None = None
+
+    def __enter__(self) -> GitRepository:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def commits(self, revisions: str, max_count: int | None = None) -> list[str]:
+        """Returns the hashes of the commits in the given revision range, oldest first.
+
+        Args:
+            revisions: revision range in the format of 'git rev-list', e.g. 'HEAD' or 'v1.0..main'
+            max_count: if set, only the most recent commits of the range are returned
+        """
+        arguments = ["rev-list", "--reverse"]
+        if max_count is not None:
+            arguments.append(f"--max-count={max_count}")
+
+        return self._run(*arguments, revisions, "--").split()
+
+    def files(self, commit: str, path: PurePosixPath) -> dict[str, str]:
+        """Returns the files of the given commit within the given directory, mapped to the hashes of their blobs.
+
+        Args:
+            commit: hash or name of the commit
+            path: directory relative to the top level of the repository
+        Returns:
+            paths of the files relative to the top level of the repository, separated by '/'
+        """
+        output = self._run(
+            "ls-tree", "-r", "-z", "--full-tree", commit, "--", str(path)
+        )
+
+        files = {}
+        for entry in output.split("\0"):
+            if not entry:
+                continue
+
+            metadata, name = entry.split("\t", 1)
+            mode, object_type, object_hash = metadata.split()
+
+            if object_type == BLOB and mode != SYMBOLIC_LINK_MODE:
+                files[name] = object_hash
+
+        return files
+
+    def read_blob(self, object_hash: str) -> bytes:
+        """Returns the content of the blob with the given hash."""
+        process = self._start_cat_file()
+        stdin: IO[bytes] = process.stdin  # type: ignore[assignment]
+        stdout: IO[bytes] = process.stdout  # type: ignore[assignment]
+
+        stdin.write(object_hash.encode() + b"\n")
+        stdin.flush()
+
+        # the header has the format '<hash> <type> <size>' or '<hash> missing'
+        header = stdout.readline().split()
+        if len(header) != 3 or header[1] != BLOB.encode():
+            raise GitError(f"Blob {object_hash} not found in {self.top_level}.")
+
+        content = stdout.read(int(header[2]))
+        stdout.read(1)
+
+        return content
+
+    def close(self) -> None:
+        if self._cat_file is None:
+            return
+
+        self._cat_file.stdin.close()  # type: ignore[union-attr]
+        self._cat_file.wait()
+        self._cat_file.stdout.close()  # type: ignore[union-attr]
+        self._cat_file = None
+
+    def _start_cat_file(self) -> subprocess.Popen[bytes]:
+        if self._cat_file is None:
+            self._cat_file = subprocess.Popen(  # noqa: S603
+                [GIT_EXECUTABLE, "cat-file", "--batch"],
+                cwd=self._path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+
+        return self._cat_file
+
+    def _run(self, *arguments: str) -> str:
+        try:
+            return subprocess.run(  # noqa: S603
+                [GIT_EXECUTABLE, *arguments],
+                cwd=self._path,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        except (OSError, subprocess.CalledProcessError) as e:
+            details = getattr(e, "stderr", None) or e
+            raise GitError(f"git {arguments[0]} failed: {details}") from e
+
+
+@dataclass
+class GitRevision:
+    """A single commit of a repository, whose files are read from the object database instead of the working tree.
+
+    Attributes:
+        repository: repository containing the commit
+        commit: hash of the commit
+        parsed_blobs: imports extracted from all blobs parsed so far, keyed by the hash of the blob. Shared by all
+            revisions of a history, so that files that do not change between commits are only parsed once.
+    """
+
+    repository: GitRepository
+    commit: str
+    parsed_blobs: dict[str, ExtractedImports] = field(default_factory=dict)
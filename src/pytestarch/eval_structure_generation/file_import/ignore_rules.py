@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+# files in a directory are read in this order, so rules of later files take precedence
+IGNORE_FILE_NAMES = (".gitignore", ".ignore")
+REPOSITORY_DIRECTORY = ".git"
+REPOSITORY_EXCLUDE_FILE = os.path.join(REPOSITORY_DIRECTORY, "info", "exclude")
+
+ANY_DIRECTORIES = "**"
+SEPARATOR = "/"
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """A single line of an ignore file.
+
+    Attributes:
+        pattern: compiled pattern, matched against paths relative to the directory of the ignore file
+        negated: if True, matching paths are included again
+        directory_only: if True, the rule only applies to directories
+    """
+
+    pattern: re.Pattern[str]
+    negated: bool
+    directory_only: bool
+
+
+@dataclass(frozen=True)
+class IgnoreRuleSet:
+    """All rules defined by the ignore files of a single directory.
+
+    Attributes:
+        directory: directory of the ignore files, relative to the top directory of the IgnoreRules; '' for the top
+            directory itself
+        rules: rules in the order in which they are defined
+    """
+
+    directory: str
+    rules: tuple[IgnoreRule, ...]
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool | None:
+        """Returns whether the path is ignored according to the last matching rule, or None if no rule matches
+        or the path is not located below the directory of this rule set.
+
+        Args:
+            path: path relative to the top directory of the IgnoreRules, separated by '/'
+            is_dir: True if the path is a directory
+        """
+        if self.directory:
+            if not path.startswith(self.directory + SEPARATOR):
+                return None
+            path = path[len(self.directory) + 1 :]
+
+        for rule in reversed(self.rules):
+            if rule.directory_only and not is_dir:
+                continue
+
+            if rule.pattern.match(path):
+                return not rule.negated
+
+        return None
+
+
+class IgnoreRules:
+    """Determines which files and directories are ignored according to .gitignore and .ignore files, following the
+    pattern format of git. No git installation is required.
+
+    Rules of ignore files in deeper directories take precedence over those in higher directories. Since ignored
+    directories are not descended into, files in them cannot be included again, just like in git.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        root_relative_to_top: str,
+        rule_sets: tuple[IgnoreRuleSet, ...],
+    ) -> None:
+        """
+        Args:
+            root: path of the directory that is being scanned, as used by the caller
+            root_relative_to_top: path of the scanned directory relative to the top directory, which is the
+                repository root or the scanned directory itself if it is not part of a repository
+            rule_sets: rule sets of the top directory down to the scanned directory
+        """
+        self._root = root
+        self._root_relative_to_top = root_relative_to_top
+        self._rule_sets = rule_sets
+
+    @classmethod
+    def for_directory(cls, directory: Path) -> IgnoreRules:
+        """Loads the ignore files of the given directory. If the directory is part of a git repository, the ignore
+        files of all directories between the repository root and the directory, as well as the repository's exclude
+        file, are taken into account as well.
+
+        Args:
+            directory: directory that is going to be scanned
+        """
+        absolute_directory = directory.resolve()
+        top = next(
+            (
+                candidate
+                for candidate in (absolute_directory, *absolute_directory.parents)
+                if (candidate / REPOSITORY_DIRECTORY).exists()
+            ),
+            absolute_directory,
+        )
+
+        rule_sets = []
+
+        exclude_file_rules = cls._read_rules(top / REPOSITORY_EXCLUDE_FILE)
+        if exclude_file_rules:
+            rule_sets.append(IgnoreRuleSet("", tuple(exclude_file_rules)))
+
+        relative_directory = absolute_directory.relative_to(top).as_posix()
+        relative_directory = "" if relative_directory == "." else relative_directory
+
+        current = top
+        for part in ["", *Path(relative_directory).parts]:
+            current = current / part
+            rule_set = cls._load(current, current.relative_to(top).as_posix())
+            if rule_set is not None:
+                rule_sets.append(rule_set)
+
+        return cls(str(directory), relative_directory, tuple(rule_sets))
+
+    def for_subdirectory(self, directory: str) -> IgnoreRules:
+        """Returns the rules that apply within the given subdirectory of the scanned directory, including the ones of
+        its own ignore files.
+
+        Args:
+            directory: path of the subdirectory, starting with the path of the scanned directory
+        """
+        rule_set = self._load(Path(directory), self._relative_to_top(directory))
+
+        if rule_set is None:
+            return self
+
+        return IgnoreRules(
+            self._root, self._root_relative_to_top, self._rule_sets + (rule_set,)
+        )
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool:
+        """Returns True if the given file or directory is ignored.
+
+        Args:
+            path: path of the file or directory, starting with the path of the scanned directory
+            is_dir: True if the path is a directory
+        """
+        relative_path = self._relative_to_top(path)
+
+        if is_dir and relative_path.rsplit(SEPARATOR, 1)[-1] == REPOSITORY_DIRECTORY:
+            return True
+
+        for rule_set in reversed(self._rule_sets):
+            ignored = rule_set.is_ignored(relative_path, is_dir)
+
+            if ignored is not None:
+                return ignored
+
+        return False
+
+    def _relative_to_top(self, path: str) -> str:
+        if path.startswith(self._root + os.sep):
+            relative_path = path[len(self._root) + 1 :]
+        else:
+            relative_path = os.path.relpath(path, self._root)
+
+        if os.sep != SEPARATOR:
+            relative_path = relative_path.replace(os.sep, SEPARATOR)
+
+        if relative_path == ".":
+            return self._root_relative_to_top
+
+        if not self._root_relative_to_top:
+            return relative_path
+
+        return f"{self._root_relative_to_top}{SEPARATOR}{relative_path}"
+
+    @classmethod
+    def _load(cls, directory: Path, relative_directory: str) -> IgnoreRuleSet | None:
+        rules = []
+        for file_name in IGNORE_FILE_NAMES:
+            rules.extend(cls._read_rules(directory / file_name))
+
+        if not rules:
+            return None
+
+        return IgnoreRuleSet(
+            "" if relative_directory == "." else relative_directory, tuple(rules)
+        )
+
+    @classmethod
+    def _read_rules(cls, path: Path) -> list[IgnoreRule]:
+        try:
+            lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return []
+
+        rules = []
+        for line in lines:
+            rule = parse_ignore_rule(line)
+            if rule is not None:
+                rules.append(rule)
+
+        return rules
+
+
+def parse_ignore_rule(line: str) -> IgnoreRule | None:
+    """Converts a line of an ignore file to a rule. Returns None for blank lines and comments.
+
+    Args:
+        line: line in the format of a .gitignore file
+    """
+    if not line or line.startswith("#"):
+        return None
+
+    # trailing spaces are ignored unless they are escaped
+    stripped_line = line.rstrip(" ")
+    if stripped_line.endswith("\\") and len(stripped_line) < len(line):
+        stripped_line += " "
+    line = stripped_line
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+
+    directory_only = line.endswith(SEPARATOR)
+    line = line.rstrip(SEPARATOR)
+
+    if not line:
+        return None
+
+    # patterns with a separator at the beginning or in the middle are relative to the directory of the ignore file,
+    # all others can match at any level below it
+    anchored = SEPARATOR in line
+    line = line.lstrip(SEPARATOR)
+
+    pattern = _translate(line)
+    if not anchored:
+        pattern = f"(?:.*{SEPARATOR})?{pattern}"
+
+    return IgnoreRule(re.compile(f"{pattern}$", re.DOTALL), negated, directory_only)
+
+
+def _translate(pattern: str) -> str:
+    segments = pattern.split(SEPARATOR)
+    regex = []
+
+    for index, segment in enumerate(segments):
+        last_segment = index == len(segments) - 1
+
+        if segment == ANY_DIRECTORIES:
+            # 'a/**' matches everything inside a, '**/b' and 'a/**/b' match b in any number of directories
+            regex.append(".*" if last_segment else f"(?:[^{SEPARATOR}]*{SEPARATOR})*")
+        else:
+            regex.append(_translate_segment(segment))
+
+            if not last_segment:
+                regex.append(SEPARATOR)
+
+    return "".join(regex)
+
+
+def _translate_segment(segment: str) -> str:
+    regex = []
+    index = 0
+
+    while index < len(segment):
+        char = segment[index]
+
+        if char == "\\" and index + 1 < len(segment):
+            index += 1
+            regex.append(re.escape(segment[index]))
+        elif char == "*":
+            regex.append(f"[^{SEPARATOR}]*")
+        elif char == "?":
+            regex.append(f"[^{SEPARATOR}]")
+        elif char == "[" and (end := segment.find("]", index + 2)) != -1:
+            content = segment[index + 1 : end]
+            if content.startswith("!"):
+                content = "^" + content[1:]
+            regex.append(f"[{content.replace(chr(92), chr(92) * 2)}]")
+            index = end
+        else:
+            regex.append(re.escape(char))
+
+        index += 1
+
+    return "".join(regex)
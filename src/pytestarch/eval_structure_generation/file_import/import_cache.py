@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from pytestarch.eval_structure.build_statistics import BuildStatistics
+from pytestarch.eval_structure_generation.file_import.import_types import RawImport
+from pytestarch.eval_structure_generation.file_import.skip_criteria import SkipCriteria
+from pytestarch.eval_structure_generation.file_import.source_reader import (
+    Source,
+    open_source,
+)
+
+CACHE_FILE_NAME = "pytestarch_imports.json"
+# version 2 added the kind of each import
+CACHE_FORMAT_VERSION = 2
+
+
+def content_hash(source: Source) -> str:
+    """Calculates the hash used to detect whether the content of a file has changed."""
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+class ImportCache:
+    """Persistent cache of the raw imports of each parsed file.
+
+    An entry is identified by the absolute path of the file and is considered valid if either the modification time
+    and size of the file are unchanged, or if the file's content still has the same hash. In the first case, the file
+    does not need to be read at all, in the second case it does not need to be parsed.
+
+    Entries are only valid if their imports were found the way they are currently found, and if the file would not be
+    skipped by the current skip criteria. Skipped files are not cached at all.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        statistics: BuildStatistics,
+        accepted_methods: tuple[str | None, ...] = (None,),
+        skip_criteria: SkipCriteria | None = None,
+    ) -> None:
+        """
+        Args:
+            cache_dir: directory in which the cache file is stored. Will be created if it does not exist.
+            statistics: collects cache hits, misses, and evictions
+            accepted_methods: only entries whose imports were found with one of these methods are valid, e.g. by
+                reading the bytecode or by only scanning the header of a file. None stands for completely parsing the
+                source code.
+            skip_criteria: criteria by which files are currently skipped. Entries of files that would be skipped are
+                not valid.
+        """
+        self._cache_file = cache_dir / CACHE_FILE_NAME
+        self._statistics = statistics
+        self._accepted_methods = accepted_methods
+        self._max_file_size = (
+            skip_criteria.max_file_size if skip_criteria is not None else None
+        )
+        self._marker = _describe_marker(skip_criteria)
+        self._entries = self._load()
+        self._used_entries: set[str] = set()
+
+    def lookup(self, path: Path, stat: os.stat_result) -> list[RawImport] | None:
+        """Returns the cached imports of the given file or None, if there is no valid cache entry.
+
+        Args:
+            path: absolute path of the file
+            stat: status of the file, determined before it is read
+        Returns:
+            cached imports, if the cache entry is still valid
+        """
+        key = str(path)
+        entry = self._entries.get(key)
+
+        if entry is not None and self._is_applicable(entry, stat):
+            if entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+                return self._hit(key, entry)
+
+            if entry["size"] == stat.st_size:
+                with open_source(path) as source:
+                    unchanged = entry["hash"] == content_hash(source)
+
+                if unchanged:
+                    entry["mtime"] = stat.st_mtime_ns
+                    return self._hit(key, entry)
+
+        self._statistics.cache_misses += 1
+        return None
+
+    def store(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        source_hash: str,
+        imports: list[RawImport],
+        method: str | None = None,
+    ) -> None:
+        """Adds or replaces the cache entry of the given file.
+
+        Args:
+            path: absolute path of the file
+            stat: status of the file, determined before it was read. If the file changes after it was read, the entry
+                is thus recognised as outdated.
+            source_hash: content hash of the file as calculated by content_hash
+            imports: raw imports of the file
+            method: how the imports were found, if the source code was not parsed completely
+        """
+        key = str(path)
+
+        self._entries[key] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": source_hash,
+            "imports": [list(raw_import) for raw_import in imports],
+        }
+        if method is not None:
+            self._entries[key]["method"] = method
+        if self._marker is not None:
+            # the file did not match the marker, otherwise it would have been skipped
+            self._entries[key]["marker"] = self._marker
+        self._used_entries.add(key)
+
+    def save(self, scanned_path: Path) -> None:
+        """Writes the cache to disk. Entries of files below the scanned path that were not used during this scan
+        belong to deleted or excluded files and are evicted, as are entries of files that no longer exist.
+
+        Args:
+            scanned_path: path that was scanned for python files
+        """
+        scanned_path = scanned_path.resolve()
+
+        for key in list(self._entries):
+            if key in self._used_entries:
+                continue
+
+            if scanned_path in Path(key).parents or not os.path.exists(key):
+                del self._entries[key]
+                self._statistics.cache_evictions += 1
+
+        self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first so that concurrent readers never see a partially written cache
+        temporary_file = self._cache_file.with_suffix(f".{os.getpid()}.tmp")
+        temporary_file.write_text(
+            json.dumps({"version": CACHE_FORMAT_VERSION, "entries": self._entries})
+        )
+        os.replace(temporary_file, self._cache_file)
+
+    def _is_applicable(self, entry: dict[str, Any], stat: os.stat_result) -> bool:
+        """Returns whether the imports of the entry were found the way they are currently found, and whether the
+        file would not be skipped. Valid entries have the same size as the file, so the size can be checked based on
+        the status alone. Whether a file matches the generated file marker is only known for the marker the entry was
+        stored with.
+        """
+        if entry.get("method") not in self._accepted_methods:
+            return False
+
+        if self._max_file_size is not None and stat.st_size > self._max_file_size:
+            return False
+
+        return self._marker is None or entry.get("marker") == self._marker
+
+    def _hit(self, key: str, entry: dict[str, Any]) -> list[RawImport]:
+        self._statistics.cache_hits += 1
+        self._used_entries.add(key)
+
+        return [RawImport(*raw_import) for raw_import in entry["imports"]]
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Reads the cache file. A missing, unreadable, or outdated cache file results in an empty cache."""
+        try:
+            content = json.loads(self._cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
+        if (
+            not isinstance(content, dict)
+            or content.get("version") != CACHE_FORMAT_VERSION
+        ):
+            return {}
+
+        return content["entries"]
+
+
+def _describe_marker(skip_criteria: SkipCriteria | None) -> str | None:
+    """Returns the generated file marker in a form that can be stored in the cache file."""
+    if skip_criteria is None or skip_criteria.generated_file_marker is None:
+        return None
+
+    marker = skip_criteria.generated_file_marker
+    return f"{marker.flags}:{marker.pattern.decode(errors='backslashreplace')}"
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
 
+from pytestarch.eval_structure.build_statistics import BuildStatistics
+from pytestarch.eval_structure.module_hierarchy import NO_PARENT, ModuleHierarchy
 from pytestarch.eval_structure.types import Import
 from pytestarch.eval_structure_generation.file_import.config import Config
 from pytestarch.eval_structure_generation.file_import.file_filter import FileFilter
+from pytestarch.eval_structure_generation.file_import.module_classifier import (
+    ModuleClassifier,
+)
+
+# maximum number of external modules whose classification is cached
+CLASSIFICATION_CACHE_SIZE = 65536
 
 
 class ExternalImportFilter:
     """Filters out imports of (some) external modules from the list of all imports.
     External modules are all modules that are not submodules of the configured module to search for imports.
 
-    Two possibilities: either all external modules are filtered out, or only those matching given regex patterns.
+    Two possibilities: either all external modules are filtered out, or only those matching given regex patterns or
+    belonging to excluded kinds of modules, e.g. the standard library.
+
+    As the same external modules are usually imported many times, whether an external module is retained is cached
+    in a bounded least recently used cache. A module is excluded if it or any of its parent modules is excluded, so the
+    cached decision for a parent module, e.g. 'numpy', also applies to all its submodules, e.g. 'numpy.linalg'.
     """
 
     def __init__(
@@ -19,6 +33,9 @@ class ExternalImportFilter:
         exclude_external_libraries: bool,
         root_module_name: str,
         external_exclusions: tuple[str, ...],
+        module_hierarchy: ModuleHierarchy | None = None,
+        module_classifier: ModuleClassifier | None = None,
+        statistics: BuildStatistics | None = None,
     ) -> None:
         """
         Args:
@@ -26,10 +43,20 @@ class ExternalImportFilter:
             root_module_name: name of the module that determines which modules are considered external. If a module
                 is a submodule of this module, it is considered internal.
             external_exclusions: regex pattern: all external modules that match it shall be filtered out.
+            module_hierarchy: table of module names to look up parent modules in
+            module_classifier: if set, external modules of the kinds excluded by the classifier are filtered out
+            statistics: build statistics the hits and misses of the classification cache are counted in
         """
         self._exclude_external_libraries = exclude_external_libraries
         self._root_module_name = root_module_name
         self._external_exclusion_filter = FileFilter(Config(external_exclusions))
+        self._module_hierarchy = (
+            module_hierarchy if module_hierarchy is not None else ModuleHierarchy()
+        )
+        self._module_classifier = module_classifier or ModuleClassifier(False, None)
+        self._statistics = statistics or BuildStatistics()
+
+        self._retained_external_modules: OrderedDict[str, bool] = OrderedDict()
 
     def filter(self, imports: Sequence[Import]) -> Sequence[Import]:
         """According to the configuration, imports will be filtered.
@@ -39,34 +66,88 @@ class ExternalImportFilter:
         Returns:
             filtered list of imports
         """
-        if (
-            not self._exclude_external_libraries
-            and not self._external_exclusion_filter.has_filter()
-        ):
+        if not self._exclude_external_libraries and not self._has_exclusions():
             return imports
 
         # is this is set, then _exclude_external_libraries is False, as asserted by previously executed code
-        if self._external_exclusion_filter.has_filter():
+        if self._has_exclusions():
             return [
                 i for i in imports if self._is_internal_or_retained_external_import(i)
             ]
 
         return [i for i in imports if self._is_internal_import(i)]
 
+    def filter_lazily(self, imports: Iterable[Import]) -> Iterator[Import]:
+        """Same as filter, but imports are consumed and returned one by one instead of as a list.
+
+        Args:
+            imports: imports to be filtered
+        Returns:
+            filtered imports
+        """
+        if not self._exclude_external_libraries and not self._has_exclusions():
+            yield from imports
+        elif self._has_exclusions():
+            yield from filter(self._is_internal_or_retained_external_import, imports)
+        else:
+            yield from filter(self._is_internal_import, imports)
+
     def _is_internal_import(self, i: Import) -> bool:
         importee = i.importee()
 
         return importee.startswith(self._root_module_name)
 
+    def _has_exclusions(self) -> bool:
+        return (
+            self._external_exclusion_filter.has_filter()
+            or self._module_classifier.has_exclusions()
+        )
+
     def _is_internal_or_retained_external_import(self, i: Import) -> bool:
         if self._is_internal_import(i):
             return True
 
         importee = i.importee()
+        retained = self._get_cached_classification(importee)
 
-        excluded = self._external_exclusion_filter.is_excluded(importee)
-        any_parent_excluded = any(
-            self._external_exclusion_filter.is_excluded(parent)
-            for parent in i.importee_parent_modules()
-        )
-        return not (excluded or any_parent_excluded)
+        if retained is not None:
+            self._statistics.classification_hits += 1
+            return retained
+
+        self._statistics.classification_misses += 1
+        return self._classify(self._module_hierarchy.id(importee))
+
+    def _get_cached_classification(self, module: str) -> bool | None:
+        retained = self._retained_external_modules.get(module)
+
+        if retained is not None:
+            self._retained_external_modules.move_to_end(module)
+
+        return retained
+
+    def _classify(self, module_id: int) -> bool:
+        """Returns True if the external module with the given id is retained, i.e. neither the module nor any of its
+        parent modules is excluded. Parent modules are only classified if their classification is not cached yet.
+        """
+        module = self._module_hierarchy.name(module_id)
+        parent_id = self._module_hierarchy.parent(module_id)
+
+        if parent_id == NO_PARENT:
+            retained = not self._module_classifier.is_excluded(module)
+        else:
+            parent_retained = self._get_cached_classification(
+                self._module_hierarchy.name(parent_id)
+            )
+            retained = (
+                parent_retained
+                if parent_retained is not None
+                else self._classify(parent_id)
+            )
+
+        retained = retained and not self._external_exclusion_filter.is_excluded(module)
+
+        self._retained_external_modules[module] = retained
+        if len(self._retained_external_modules) > CLASSIFICATION_CACHE_SIZE:
+            self._retained_external_modules.popitem(last=False)
+
+        return retained
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import threading
+from collections.abc import Sequence
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import FrameType, ModuleType, TracebackType
+
+DEFAULT_BUFFER_SIZE = 1024
+SEPARATOR = "\t"
+
+# frames of the import system, which are skipped when searching for the importing module
+IMPORT_SYSTEM_MODULE = "importlib"
+
+
+class ImportRecorder:
+    """Records which module imports which other module while the interpreter is running, including imports that
+    cannot be found by parsing the source code, e.g. via importlib.import_module or plugin loaders.
+
+    The recorder is registered as the first finder in sys.meta_path, where it only observes: it is consulted each time a
+    module is loaded for the first time, and never finds a module itself. Modules that are already loaded are served
+    from sys.modules without consulting any finder, so recording costs nothing for them. For each loaded module, the
+    importing module is the innermost calling module outside of the import system, so the module that is recorded for a
+    plugin loaded via importlib.metadata is the one that loads the plugin.
+
+    As a consequence, only the import that loads a module is recorded. If a module is imported dynamically after it has
+    already been loaded, e.g. via importlib.import_module, this import is not recorded, and neither are imports of
+    modules loaded before recording started. The sys.audit event 'import' is only raised when a module is loaded as
+    well. To record as many imports as possible, recording has to start before the application is imported.
+
+    Recorded imports are collected in a preallocated buffer and appended to the recording file in batches, whenever the
+    buffer is full and when recording stops, at the latest when the interpreter exits. Each line of the file contains
+    the importing and the imported module, separated by a tab.
+    """
+
+    def __init__(
+        self, path: str | Path, buffer_size: int = DEFAULT_BUFFER_SIZE
+    ) -> None:
+        """
+        Args:
+            path: file the recorded imports are appended to
+            buffer_size: number of imports that are collected before they are written to the file
+        """
+        self._path = Path(path)
+        self._buffer: list[tuple[str, str]] = [("", "")] * buffer_size
+        self._size = 0
+        self._recorded: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> ImportRecorder:
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def start(self) -> ImportRecorder:
+        """Starts recording imports until stop is called or the interpreter exits."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)  # type: ignore[arg-type]
+            atexit.register(self.stop)
+
+        return self
+
+    def stop(self) -> None:
+        """Stops recording and writes all imports recorded so far to the file."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)  # type: ignore[arg-type]
+            atexit.unregister(self.stop)
+
+        self.flush()
+
+    def flush(self) -> None:
+        """Appends the buffered imports to the file."""
+        with self._lock:
+            lines = [
+                f"{importer}{SEPARATOR}{importee}\n"
+                for importer, importee in self._buffer[: self._size]
+            ]
+            self._size = 0
+
+        if lines:
+            with open(self._path, "a", encoding="utf-8") as file:
+                file.write("".join(lines))
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None = None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        """Records the import of the given module. Always returns None, so that the module is found by the actual
+        finders.
+        """
+        importer = _find_importer(sys._getframe(1))
+
+        if importer is not None and importer != fullname:
+            self._record(importer, fullname)
+
+        return None
+
+    def _record(self, importer: str, importee: str) -> None:
+        with self._lock:
+            if (importer, importee) in self._recorded:
+                return
+
+            self._recorded.add((importer, importee))
+            self._buffer[self._size] = (importer, importee)
+            self._size += 1
+            buffer_full = self._size == len(self._buffer)
+
+        if buffer_full:
+            self.flush()
+
+
+def _find_importer(frame: FrameType | None) -> str | None:
+    """Returns the name of the innermost module on the stack that is not part of the import system. Imports of packages
+    are assigned to their __init__ module, like for files that are parsed.
+    """
+    while frame is not None:
+        frame_globals = frame.f_globals
+        name = frame_globals.get("__name__")
+
+        if (
+            isinstance(name, str)
+            and name != __name__
+            and name != IMPORT_SYSTEM_MODULE
+            and not name.startswith(IMPORT_SYSTEM_MODULE + ".")
+        ):
+            if "__path__" in frame_globals and frame_globals.get("__file__"):
+                module_name = os.path.basename(frame_globals["__file__"])
+                return f"{name}.{os.path.splitext(module_name)[0]}"
+
+            return name
+
+        frame = frame.f_back
+
+    return None
+
+
+def read_recorded_imports(path: Path) -> list[tuple[str, str]]:
+    """Reads the imports recorded by an ImportRecorder, without duplicates.
+
+    Args:
+        path: recording file
+    Returns:
+        importing and imported module of each recorded import
+    """
+    imports: dict[tuple[str, str], None] = {}
+
+    for line in path.read_text(encoding="utf-8").splitlines():
+        importer, separator, importee = line.partition(SEPARATOR)
+
+        if separator:
+            imports[(importer, importee)] = None
+
+    return list(imports)
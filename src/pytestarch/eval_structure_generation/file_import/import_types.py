@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import ast
 from dataclasses import dataclass
+from typing import NamedTuple
 
-from pytestarch.eval_structure.types import Import, get_parent_modules
+from pytestarch.eval_structure.types import (
+    RUNTIME_IMPORT,
+    Import,
+    get_parent_modules,
+)
 from pytestarch.eval_structure_generation.file_import.exceptions import ImportException
 
 
@@ -20,48 +25,99 @@ class NamedModule:
     name: str
 
 
+class RawImport(NamedTuple):
+    """Compact representation of a single import as it appears in a source file, before any module names are resolved.
+
+    Attributes:
+        module: imported module, e.g. 'a.b' for 'import a.b' or 'from a.b import c'. None for 'from . import c'.
+        name: imported name for relative imports, e.g. 'c' for 'from .a import c'. None for absolute imports.
+        level: number of leading dots of a relative import, 0 for absolute imports
+        kind: combination of import kind flags, e.g. TYPE_CHECKING_IMPORT for an import within an 'if TYPE_CHECKING:'
+            block
+    """
+
+    module: str | None
+    name: str | None
+    level: int
+    kind: int = RUNTIME_IMPORT
+
+
+class ExtractedImports(NamedTuple):
+    """Result of extracting the imports of a single file.
+
+    Attributes:
+        imports: raw imports of the file
+        source_hash: content hash of the file, None if the file was skipped
+        skip_reason: reason why the file was skipped, None if it was parsed
+        missed_imports: if the header scan of the file was verified, all imports the header scan did not find
+        from_bytecode: True if the imports were read from the cached bytecode of the file
+    """
+
+    imports: list[RawImport]
+    source_hash: str | None = None
+    skip_reason: str | None = None
+    missed_imports: list[RawImport] | None = None
+    from_bytecode: bool = False
+
+
+@dataclass
+class ModuleImports:
+    """Contains all raw imports of a module with the module's name.
+
+    Attributes:
+        name: module name
+        imports: raw imports found in the module's source code
+    """
+
+    name: str
+    imports: list[RawImport]
+
+
 class AbsoluteImport(Import):
     """Represents an absolute import."""
 
-    def __init__(self, importer: str, module_name: str) -> None:
-        super().__init__(importer)
+    __slots__ = ("_module_name",)
+
+    def __init__(
+        self, importer: str, module_name: str, kind: int = RUNTIME_IMPORT
+    ) -> None:
+        super().__init__(importer, kind)
         self._module_name = module_name
-        self._importee_module_hierarchy = get_parent_modules(self._module_name)
 
     def importee(self) -> str:
         return self._module_name
 
     def importee_parent_modules(self) -> list[str]:
-        return self._importee_module_hierarchy
+        return get_parent_modules(self._module_name)
 
 
 class RelativeImport(Import):
     """Represents a relative import."""
 
+    __slots__ = ("_module_name", "_importee")
+
     def __init__(
         self,
         importer: str,
         module_name: str | None,
         import_name: str | None,
         level: int,
+        kind: int = RUNTIME_IMPORT,
     ) -> None:
-        super().__init__(importer)
+        super().__init__(importer, kind)
         if module_name is None and import_name is None:
             raise ImportException(
                 "Either name of module of of import needs to be specified."
             )
-        self._module_name = module_name or import_name
-        self._level = level
-
-        self._importee = self._calculate_importee()
+        self._module_name: str = module_name or import_name  # type: ignore
 
-        self._importee_module_hierarchy = get_parent_modules(self._module_name)  # type: ignore
+        self._importee = self._calculate_importee(level)
 
     def importee(self) -> str:
         return self._importee
 
     def importee_parent_modules(self) -> list[str]:
-        return self._importee_module_hierarchy
+        return get_parent_modules(self._module_name)
 
-    def _calculate_importee(self) -> str:
-        return self._importer_module_hierarchy[-self._level] + "." + self._module_name  # type: ignore
+    def _calculate_importee(self, level: int) -> str:
+        return get_parent_modules(self._importer)[-level] + "." + self._module_name
@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable
 from pathlib import Path
 
+from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
 from pytestarch.eval_structure.types import Import
 
 
 class ImporteeModuleCalculator:
     """Adds all parent modules of imported modules if they are not yet part of the modules list."""
 
-    def __init__(self, root_path: Path) -> None:
+    def __init__(
+        self, root_path: Path, module_hierarchy: ModuleHierarchy | None = None
+    ) -> None:
         self._root_path = root_path
+        self._module_hierarchy = (
+            module_hierarchy if module_hierarchy is not None else ModuleHierarchy()
+        )
 
     def calculate_importee_modules(
         self,
-        imports: Sequence[Import],
+        imports: Iterable[Import],
         all_modules: list[str],
     ) -> list[str]:
         """For all imported modules: Calculate parent modules and add them to the list of existing modules if they
@@ -33,12 +39,7 @@ class ImporteeModuleCalculator:
             importee = imp.importee()
 
             if str(self._root_path) not in importee:
-                extended_modules.update(self._calculate_parent_modules(imp))
+                extended_modules.add(self._module_hierarchy.intern(importee))
+                extended_modules.update(self._module_hierarchy.ancestors(importee))
 
         return list(extended_modules)
-
-    def _calculate_parent_modules(self, imp: Import) -> set[str]:
-        modules = {imp.importee()}
-        modules.update(imp.importee_parent_modules())
-
-        return modules
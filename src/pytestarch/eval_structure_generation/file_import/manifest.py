@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+NULL_SEPARATOR = b"\0"
+LINE_SEPARATOR = b"\n"
+
+
+def read_manifest(path: Path) -> list[str]:
+    """Reads the paths listed in a manifest file. The paths are either separated by null characters, as written by
+    'git ls-files -z', or listed one per line, as written by 'git ls-files'. Empty entries are skipped.
+
+    Args:
+        path: path of the manifest file
+    Returns:
+        listed paths, decoded like all other file names of the operating system
+    """
+    content = path.read_bytes()
+
+    if NULL_SEPARATOR in content:
+        entries = content.split(NULL_SEPARATOR)
+    else:
+        entries = [line.rstrip(b"\r") for line in content.split(LINE_SEPARATOR)]
+
+    return [os.fsdecode(entry) for entry in entries if entry]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import functools
+import sys
+from collections.abc import Iterable
+from importlib import metadata
+
+STANDARD_LIBRARY = "stdlib"
+THIRD_PARTY = "third_party"
+UNKNOWN = "unknown"
+
+
+class ModuleClassifier:
+    """Determines whether an external module belongs to the standard library, to an installed third-party distribution,
+    or to neither, e.g. a module of the analysed code itself or a module that is not installed.
+
+    Modules are classified by their top level module only, which is looked up in an index of the names of all standard
+    library modules and of the top level modules of all installed distributions. The index of installed distributions is
+    read from their metadata once per interpreter.
+    """
+
+    def __init__(
+        self, exclude_stdlib: bool, keep_third_party: Iterable[str] | None
+    ) -> None:
+        """
+        Args:
+            exclude_stdlib: if True, modules of the standard library are excluded
+            keep_third_party: if not None, modules of installed third-party distributions are excluded, except for
+                the top level modules listed here
+        """
+        self._exclude_stdlib = exclude_stdlib
+        self._keep_third_party = (
+            frozenset(keep_third_party) if keep_third_party is not None else None
+        )
+
+    def has_exclusions(self) -> bool:
+        return self._exclude_stdlib or self._keep_third_party is not None
+
+    def is_excluded(self, top_level_module: str) -> bool:
+        """Returns True if the given top level module is excluded because of its kind.
+
+        Args:
+            top_level_module: name of a top level module, e.g. 'os' for 'os.path'
+        """
+        kind = classify(top_level_module)
+
+        if kind == STANDARD_LIBRARY:
+            return self._exclude_stdlib
+
+        if kind == THIRD_PARTY and self._keep_third_party is not None:
+            return top_level_module not in self._keep_third_party
+
+        return False
+
+
+def classify(top_level_module: str) -> str:
+    """Returns the kind of the given top level module: STANDARD_LIBRARY, THIRD_PARTY, or UNKNOWN."""
+    if top_level_module in sys.stdlib_module_names:
+        return STANDARD_LIBRARY
+
+    if top_level_module in _third_party_modules():
+        return THIRD_PARTY
+
+    return UNKNOWN
+
+
+@functools.cache
+def _third_party_modules() -> frozenset[str]:
+    """Names of the top level modules of all installed distributions, read once from their metadata."""
+    return frozenset(metadata.packages_distributions())
@@ -2,20 +2,245 @@ from __future__ import annotations
 
 import ast
 import os
-from pathlib import Path
+import posixpath
+import zipfile
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from pathlib import Path, PurePath, PurePosixPath
+from types import ModuleType
 
+from pytestarch.eval_structure.build_statistics import BuildStatistics
+from pytestarch.eval_structure_generation.file_import.bytecode_reader import (
+    BYTECODE,
+    read_bytecode_imports,
+)
+from pytestarch.eval_structure_generation.file_import.converter import ImportConverter
+from pytestarch.eval_structure_generation.file_import.executors import (
+    PROCESS_EXECUTOR,
+    create_executor,
+)
 from pytestarch.eval_structure_generation.file_import.file_filter import FileFilter
-from pytestarch.eval_structure_generation.file_import.import_types import NamedModule
+from pytestarch.eval_structure_generation.file_import.git_history import GitRevision
+from pytestarch.eval_structure_generation.file_import.ignore_rules import IgnoreRules
+from pytestarch.eval_structure_generation.file_import.import_cache import (
+    ImportCache,
+    content_hash,
+)
+from pytestarch.eval_structure_generation.file_import.import_types import (
+    ExtractedImports,
+    ModuleImports,
+    NamedModule,
+    RawImport,
+)
+from pytestarch.eval_structure_generation.file_import.prefetcher import prefetch
+from pytestarch.eval_structure_generation.file_import.skip_criteria import (
+    SkipCriteria,
+)
+from pytestarch.eval_structure_generation.file_import.source_reader import (
+    Source,
+    open_source,
+)
+from pytestarch.eval_structure_generation.file_import.token_scanner import (
+    TokenImportScanner,
+)
 
 PYTHON_FILE_SUFFIX = ".py"
 
+AST_SCANNER = "ast"
+TOKENIZE_SCANNER = "tokenize"
+HEADER_ONLY_SCANNER = "header_only"
+SCANNERS = (AST_SCANNER, TOKENIZE_SCANNER, HEADER_ONLY_SCANNER)
+
+# number of chunks each worker receives on average; more chunks balance the load better, fewer reduce overhead
+CHUNKS_PER_WORKER = 4
+
+
+def extract_imports_from_file(
+    path: Path,
+    scanner: str = AST_SCANNER,
+    skip_criteria: SkipCriteria | None = None,
+    header_only_verification: float = 0.0,
+    use_bytecode: bool = False,
+) -> ExtractedImports:
+    """Parses a single python file and returns its raw imports together with the content hash of the file.
+    Defined on module level so that it can be executed in worker processes; only the compact raw imports are sent
+    back, not the ast.
+
+    Args:
+        path: absolute path of the python file
+        scanner: AST_SCANNER to parse the file into an ast, TOKENIZE_SCANNER to only scan its tokens,
+            HEADER_ONLY_SCANNER to only scan the tokens of its header
+        skip_criteria: if set, files matching these criteria are not parsed
+        header_only_verification: fraction of files whose header scan is verified by parsing the complete file
+        use_bytecode: if True, the imports are read from the cached bytecode of the file if it is up-to-date. The
+            scanner is only used if it is not.
+    Returns:
+        raw imports and content hash of the file, or the reason why it was skipped
+    """
+    with open_source(path) as source:
+        return extract_imports_from_source(
+            source,
+            path,
+            scanner,
+            skip_criteria,
+            header_only_verification,
+            use_bytecode,
+        )
+
+
+def extract_imports_from_source(
+    source: Source,
+    path: str | PurePath,
+    scanner: str = AST_SCANNER,
+    skip_criteria: SkipCriteria | None = None,
+    header_only_verification: float = 0.0,
+    use_bytecode: bool = False,
+) -> ExtractedImports:
+    """Same as extract_imports_from_file, but for source code that has already been read, e.g. from an archive.
+
+    Args:
+        source: undecoded content of the python file
+        path: path of the python file, used to select the files whose header scan is verified and to find the cached
+            bytecode of the file
+        scanner: see extract_imports_from_file
+        skip_criteria: if set, files matching these criteria are not parsed
+        header_only_verification: fraction of files whose header scan is verified by parsing the complete file
+        use_bytecode: if True, the imports are read from the cached bytecode of the file if it is up-to-date
+    Returns:
+        raw imports and content hash of the file, or the reason why it was skipped
+    """
+    skipped_imports = _skip(source, skip_criteria)
+    if skipped_imports is not None:
+        return skipped_imports
+
+    if use_bytecode:
+        bytecode_imports = read_bytecode_imports(Path(path), source)
+
+        if bytecode_imports is not None:
+            return ExtractedImports(
+                bytecode_imports, content_hash(source), from_bytecode=True
+            )
+
+    return _scan(source, path, scanner, header_only_verification)
+
+
+def _skip(
+    source: Source, skip_criteria: SkipCriteria | None
+) -> ExtractedImports | None:
+    """Returns the result for a file that is not parsed, or None if the file should be parsed."""
+    if skip_criteria is None:
+        return None
+
+    skip_reason = skip_criteria.skip_reason(source)
+    if skip_reason is None:
+        return None
+
+    if skip_criteria.scan_imports:
+        return ExtractedImports(
+            TokenImportScanner().scan_import_lines(source), skip_reason=skip_reason
+        )
+
+    return ExtractedImports([], skip_reason=skip_reason)
+
+
+def _scan(
+    source: Source,
+    path: str | PurePath,
+    scanner: str,
+    header_only_verification: float,
+) -> ExtractedImports:
+    imports = extract_imports(source, scanner)
+    missed_imports = None
+
+    if scanner == HEADER_ONLY_SCANNER and _is_sampled(path, header_only_verification):
+        found_imports = set(imports)
+        missed_imports = [
+            raw_import
+            for raw_import in extract_imports(source, AST_SCANNER)
+            if raw_import not in found_imports
+        ]
+
+    return ExtractedImports(
+        imports, content_hash(source), missed_imports=missed_imports
+    )
+
+
+def extract_imports(source: Source, scanner: str = AST_SCANNER) -> list[RawImport]:
+    """Returns the raw imports of the given undecoded source code, found with the given scanner."""
+    if scanner == TOKENIZE_SCANNER:
+        return TokenImportScanner().scan(source)
+
+    if scanner == HEADER_ONLY_SCANNER:
+        return TokenImportScanner().scan_header(source)
+
+    return ImportConverter().extract_raw_imports(ast.parse(source))  # type: ignore[call-overload]
+
+
+def _is_sampled(path: str | PurePath, fraction: float) -> bool:
+    """Deterministically selects the given fraction of all files, independent of the order in which they are
+    processed and of the process they are processed in.
+    """
+    return zlib.crc32(os.fsencode(path)) < fraction * 2**32
+
+
+def _describe(raw_import: RawImport) -> str:
+    """Returns the name of the imported module, relative imports prefixed by one dot per level, e.g. '..a.b'."""
+    name = ".".join(part for part in (raw_import.module, raw_import.name) if part)
+
+    return "." * raw_import.level + name
+
 
 class Parser:
     """Parses all files that match given criteria starting at a source path."""
 
-    def __init__(self, filter: FileFilter, source_root: Path) -> None:
+    def __init__(
+        self,
+        filter: FileFilter,
+        source_root: Path,
+        import_cache: ImportCache | None = None,
+        workers: int = 1,
+        scanner: str = AST_SCANNER,
+        respect_ignore_files: bool = False,
+        skip_criteria: SkipCriteria | None = None,
+        statistics: BuildStatistics | None = None,
+        header_only_verification: float = 0.0,
+        use_bytecode: bool = False,
+        prefetch_bytes: int = 0,
+        executor: str = PROCESS_EXECUTOR,
+    ) -> None:
+        """
+        Args:
+            filter: determines which files and directories are excluded
+            source_root: root directory of the source code, used to determine the module names
+            import_cache: if set, raw imports of unchanged files are served from this cache instead of being parsed
+            workers: number of workers used to parse files. If 1, all files are parsed in the current process.
+            scanner: AST_SCANNER to find imports in the abstract syntax tree of each file, TOKENIZE_SCANNER to find
+                them in the token stream of each file without building an ast
+            respect_ignore_files: if True, files and directories ignored by .gitignore or .ignore files are skipped,
+                ignored directories are not descended into at all
+            skip_criteria: if set, files matching these criteria are not parsed, but still added as modules
+            statistics: collects the files that were skipped and the results of verifying header scans
+            header_only_verification: fraction of files that are parsed completely in addition to scanning their header,
+                in order to report imports missed by the HEADER_ONLY_SCANNER
+            use_bytecode: if True, imports are read from the cached bytecode of each file if it is up-to-date, and
+                files are only scanned if it is not
+            prefetch_bytes: if not 0 and files are parsed in the current process, files are read ahead in background
+                threads until they take up this number of bytes
+            executor: kind of workers used to parse files if there are multiple workers, one of EXECUTORS
+        """
         self._filter = filter
         self._source_root = source_root
+        self._import_cache = import_cache
+        self._workers = workers
+        self._scanner = scanner
+        self._respect_ignore_files = respect_ignore_files
+        self._skip_criteria = skip_criteria
+        self._statistics = statistics or BuildStatistics()
+        self._header_only_verification = header_only_verification
+        self._use_bytecode = use_bytecode
+        self._prefetch_bytes = prefetch_bytes
+        self._executor = executor
 
     def parse(self, path: Path) -> tuple[list[str], list[NamedModule]]:
         """Reads all python files in the given path and returns list of ast
@@ -26,44 +251,580 @@ class Parser:
         Returns:
             list of python modules, one per python file
         """
+        self._all_modules: list[str] = []
+
+        modules = [
+            self._parse_file(file_path, module_name)
+            for file_path, module_name in self._walk(path)
+        ]
+
+        return self._all_modules, modules
+
+    def parse_imports(self, path: Path) -> tuple[list[str], list[ModuleImports]]:
+        """Reads all python files in the given path and returns their raw imports. In contrast to parse, no ast
+        modules are retained, and an import cache is used if one has been configured.
+
+        Args:
+            path: either to a file or to a directory
+        Returns:
+            list of python modules, raw imports of each python file
+        """
         self._all_modules = []
 
-        paths = [path]
-        modules = []
+        return self._parse_imports_of_files(path, list(self._walk(path)))
+
+    def parse_imports_of_listed_files(
+        self, path: Path, files: Iterable[str | Path]
+    ) -> tuple[list[str], list[ModuleImports]]:
+        """Same as parse_imports, but instead of walking the file system, only the given files are taken into account,
+        e.g. all files tracked by git. Files outside the given path are skipped.
+
+        All module names are derived from the paths of the listed files, so that no directory has to be listed.
+        Consequently, only directories that contain at least one listed python file are added to the list of all
+        modules.
+
+        Args:
+            path: either to a file or to a directory
+            files: paths of files, relative paths are interpreted relative to the current working directory
+        Returns:
+            list of python modules, raw imports of each python file
+        """
+        self._all_modules = []
+
+        return self._parse_imports_of_files(path, list(self._select(path, files)))
+
+    def parse_imports_of_archive(
+        self, archive: Path, path: Path
+    ) -> tuple[list[str], list[ModuleImports]]:
+        """Same as parse_imports, but the python files are read from a zip archive, e.g. a wheel, without extracting it.
+        Each file is read directly from the archive based on its entry in the central directory of the archive.
+        Exclusion patterns are matched against the names of the members of the archive, e.g. 'pkg/sub/module.py'.
+
+        Like for parse_imports_of_listed_files, only directories that contain at least one python file are added to
+        the list of all modules. The files are read one after another, the import cache is not used.
+
+        Args:
+            archive: path of the zip archive
+            path: path of either a file or a directory within the archive, starting with the path of the archive
+        Returns:
+            list of python modules, raw imports of each python file
+        """
+        self._all_modules = []
+
+        with zipfile.ZipFile(archive) as zip_file:
+            return self._parse_imports_of_members(
+                archive,
+                path,
+                zip_file.namelist(),
+                lambda member: self._extract_imports_from_source(
+                    zip_file.read(member), archive / member
+                ),
+            )
+
+    def parse_imports_of_revision(
+        self, revision: GitRevision, path: Path
+    ) -> tuple[list[str], list[ModuleImports]]:
+        """Same as parse_imports_of_archive, but the python files are read from a commit of a git repository, without
+        checking it out. Exclusion patterns are matched against the paths of the files relative to the top level of the
+        repository.
+
+        Files are identified by the hashes of their blobs: a blob that has already been parsed for another revision
+        sharing the same parsed blobs is not read or parsed again.
+
+        Args:
+            revision: commit to read the files of
+            path: path of either a file or a directory within the working tree of the repository, starting with the
+                path of its top level
+        Returns:
+            list of python modules, raw imports of each python file
+        """
+        self._all_modules = []
+
+        top_level = revision.repository.top_level
+        files = revision.repository.files(
+            revision.commit, PurePosixPath(path.relative_to(top_level).as_posix())
+        )
+
+        return self._parse_imports_of_members(
+            top_level,
+            path,
+            list(files),
+            lambda member: self._extract_imports_of_blob(
+                revision, files[member], top_level / member
+            ),
+        )
+
+    def _parse_imports_of_members(
+        self,
+        container: Path,
+        path: Path,
+        members: list[str],
+        extract: Callable[[str], ExtractedImports],
+    ) -> tuple[list[str], list[ModuleImports]]:
+        """Extracts the imports of all python files within the given path from a container of files that are not read
+        from the file system, such as an archive.
+
+        Args:
+            container: path of the container
+            path: path of either a file or a directory within the container, starting with the path of the container
+            members: paths of all files in the container relative to the container, separated by '/'
+            extract: returns the imports of a single member
+        """
+        module_imports = []
+
+        for member, module_name in list(self._select_members(container, path, members)):
+            extracted_imports = extract(member)
+            self._record_statistics(container / member, extracted_imports)
+
+            module_imports.append(ModuleImports(module_name, extracted_imports.imports))
+
+        return self._all_modules, module_imports
+
+    def _parse_imports_of_files(
+        self, path: Path, files: list[tuple[Path, str]]
+    ) -> tuple[list[str], list[ModuleImports]]:
+        imports = self._get_imports([file_path for file_path, _ in files])
+
+        module_imports = [
+            ModuleImports(module_name, file_imports)
+            for (_, module_name), file_imports in zip(files, imports)
+        ]
+
+        if self._import_cache is not None:
+            self._import_cache.save(path)
+
+        return self._all_modules, module_imports
+
+    def _walk(self, path: Path) -> Iterator[tuple[Path, str]]:
+        """Finds all python files in the given path that should be parsed. All directories and files that are not
+        excluded are added to the list of all modules.
+
+        The file system is traversed via os.scandir, so that the file type information returned when listing a
+        directory can be reused instead of querying it for every single file. Directories and files that are reached
+        multiple times, e.g. via symbolic links, are only taken into account once; this also prevents endless loops.
+        If ignore files are respected, the rules of each directory are loaded once when it is entered, and ignored
+        directories are pruned before they are listed.
+
+        Args:
+            path: either to a file or to a directory
+        Returns:
+            absolute path and module name of each python file
+        """
+        if not path.is_dir():
+            absolute_path = path.resolve()
+            if self._file_should_be_parsed(str(absolute_path)):
+                module_name = self._get_module_name(path)
+                self._all_modules.append(module_name)
+
+                yield absolute_path, module_name
+            return
+
+        if self._filter.is_excluded(path):
+            return
+
+        self._all_modules.append(self._get_module_name(path))
+
+        root_stat = path.stat()
+        device = root_stat.st_dev
+        visited: set[tuple[int, int]] = {(device, root_stat.st_ino)}
+
+        ignore_rules = (
+            IgnoreRules.for_directory(path) if self._respect_ignore_files else None
+        )
 
-        while paths:
-            path = paths.pop()
+        # each entry is stored with the absolute path, the module name prefix and the ignore rules of its parent
+        # directory
+        entries = self._scandir(
+            str(path), str(path.resolve()), self._get_module_prefix(path), ignore_rules
+        )
 
-            if path.is_dir():
-                if not self._filter.is_excluded(path):
-                    module_name = self._get_module_name(path)
-                    if module_name:
-                        self._all_modules.append(module_name)
-                    paths.extend(path.iterdir())
+        while entries:
+            entry, absolute_parent, parent_prefix, parent_ignore_rules = entries.pop()
+            is_dir = entry.is_dir()
+
+            if parent_ignore_rules is not None and parent_ignore_rules.is_ignored(
+                entry.path, is_dir
+            ):
+                continue
+
+            if entry.is_symlink():
+                absolute_entry_path = os.path.realpath(entry.path)
             else:
-                new_module = self._parse_file(path)
-                if new_module:
-                    modules.append(new_module)
+                absolute_entry_path = os.path.join(absolute_parent, entry.name)
 
-        return self._all_modules, modules
+            if is_dir:
+                if self._filter.is_excluded(entry.path) or not self._visit(
+                    entry, device, visited
+                ):
+                    continue
 
-    def _parse_file(self, path: Path) -> NamedModule | None:
-        """Converts a given python file to an ast module and its name."""
-        absolute_path = path.resolve()
-        if self._file_should_be_parsed(absolute_path):
-            with open(absolute_path) as file:
-                code = file.read()
+                self._all_modules.append(
+                    f"{parent_prefix}.{self._remove_suffix(entry.name)}"
+                )
+                entries.extend(
+                    self._scandir(
+                        entry.path,
+                        absolute_entry_path,
+                        f"{parent_prefix}.{entry.name}",
+                        parent_ignore_rules
+                        and parent_ignore_rules.for_subdirectory(entry.path),
+                    )
+                )
+            elif self._file_should_be_parsed(absolute_entry_path) and self._visit(
+                entry, device, visited
+            ):
+                module_name = f"{parent_prefix}.{self._remove_suffix(entry.name)}"
+                self._all_modules.append(module_name)
+
+                yield Path(absolute_entry_path), module_name
+
+    def _select(
+        self, path: Path, files: Iterable[str | Path]
+    ) -> Iterator[tuple[Path, str]]:
+        """Selects the python files within the given path from a list of files that should be parsed. Like _walk,
+        all directories and files that are not excluded are added to the list of all modules.
+
+        Args:
+            path: either to a file or to a directory
+            files: paths of files that can be parsed
+        Returns:
+            absolute path and module name of each python file
+        """
+        if not path.is_dir():
+            yield from self._walk(path)
+            return
+
+        if self._filter.is_excluded(path):
+            return
+
+        self._all_modules.append(self._get_module_name(path))
+
+        for file, module_name in self._select_files(
+            os.path.abspath(path),
+            str(path),
+            self._get_module_prefix(path),
+            map(os.path.abspath, files),
+            os.path,
+        ):
+            yield Path(file), module_name
+
+    def _select_files(
+        self,
+        root: str,
+        displayed_root: str,
+        module_prefix: str,
+        files: Iterable[str],
+        path_module: ModuleType,
+    ) -> Iterator[tuple[str, str]]:
+        """Selects the python files below the given root directory. Directories containing at least one selected file
+        and the selected files are added to the list of all modules.
+
+        Args:
+            root: path of the root directory in the same form as the paths of the files
+            displayed_root: path of the root directory as used in exclusion patterns
+            module_prefix: prefix of the names of all modules within the root directory
+            files: paths of all files that can be parsed
+            path_module: module implementing the path operations for the paths of the files, e.g. os.path
+        Returns:
+            path and module name of each selected file
+        """
+        separator = path_module.sep
+
+        # relative path of each directory already encountered, mapped to whether it is excluded
+        excluded_directories = {"": False}
+        selected_files = set()
+
+        for file in files:
+            if (
+                path_module.splitext(file)[1] != PYTHON_FILE_SUFFIX
+                or not file.startswith(root + separator)
+                or file in selected_files
+            ):
+                continue
+
+            relative_directory, name = path_module.split(file[len(root) + 1 :])
+
+            if self._directory_is_excluded(
+                relative_directory,
+                displayed_root,
+                module_prefix,
+                excluded_directories,
+                path_module,
+            ) or not self._file_should_be_parsed(file):
+                continue
+
+            selected_files.add(file)
+
+            if relative_directory:
+                module_name = f"{module_prefix}.{relative_directory.replace(separator, '.')}.{self._remove_suffix(name)}"
+            else:
+                module_name = f"{module_prefix}.{self._remove_suffix(name)}"
 
-            module_name = self._get_module_name(path)
             self._all_modules.append(module_name)
 
+            yield file, module_name
+
+    def _directory_is_excluded(
+        self,
+        relative_directory: str,
+        root: str,
+        module_prefix: str,
+        excluded_directories: dict[str, bool],
+        path_module: ModuleType,
+    ) -> bool:
+        """Returns True if the directory or one of its parent directories up to the root is excluded. Each directory is
+        only checked once; directories that are not excluded are added to the list of all modules.
+        """
+        excluded = excluded_directories.get(relative_directory)
+        if excluded is not None:
+            return excluded
+
+        parent, name = path_module.split(relative_directory)
+
+        excluded = self._directory_is_excluded(
+            parent, root, module_prefix, excluded_directories, path_module
+        ) or self._filter.is_excluded(path_module.join(root, relative_directory))
+        excluded_directories[relative_directory] = excluded
+
+        if not excluded:
+            parent_prefix = (
+                f"{module_prefix}.{parent.replace(path_module.sep, '.')}"
+                if parent
+                else module_prefix
+            )
+            self._all_modules.append(f"{parent_prefix}.{self._remove_suffix(name)}")
+
+        return excluded
+
+    def _select_members(
+        self, container: Path, path: Path, members: list[str]
+    ) -> Iterator[tuple[str, str]]:
+        """Selects the python files within the given path from the members of a container such as an archive. Like
+        _walk, all directories and files that are not excluded are added to the list of all modules.
+        """
+        root = path.relative_to(container).as_posix()
+
+        if root in members:
+            if self._file_should_be_parsed(root):
+                module_name = self._get_module_name(path)
+                self._all_modules.append(module_name)
+
+                yield root, module_name
+            return
+
+        if self._filter.is_excluded(root):
+            return
+
+        self._all_modules.append(self._get_module_name(path))
+
+        yield from self._select_files(
+            root, root, self._get_module_prefix(path), members, posixpath
+        )
+
+    def _extract_imports_from_source(
+        self, source: Source, path: Path
+    ) -> ExtractedImports:
+        return extract_imports_from_source(
+            source,
+            path,
+            self._scanner,
+            self._skip_criteria,
+            self._header_only_verification,
+        )
+
+    def _extract_imports_of_blob(
+        self, revision: GitRevision, object_hash: str, path: Path
+    ) -> ExtractedImports:
+        extracted_imports = revision.parsed_blobs.get(object_hash)
+
+        if extracted_imports is not None:
+            self._statistics.reused_blobs += 1
+            return extracted_imports
+
+        extracted_imports = self._extract_imports_from_source(
+            revision.repository.read_blob(object_hash), path
+        )
+        revision.parsed_blobs[object_hash] = extracted_imports
+
+        return extracted_imports
+
+    @classmethod
+    def _scandir(
+        cls,
+        path: str,
+        absolute_path: str,
+        module_prefix: str,
+        ignore_rules: IgnoreRules | None,
+    ) -> list[tuple[os.DirEntry[str], str, str, IgnoreRules | None]]:
+        with os.scandir(path) as entries:
+            return [
+                (entry, absolute_path, module_prefix, ignore_rules) for entry in entries
+            ]
+
+    @classmethod
+    def _visit(
+        cls, entry: os.DirEntry[str], device: int, visited: set[tuple[int, int]]
+    ) -> bool:
+        """Marks the file or directory as visited. Returns False if it has already been visited before.
+        The inode number of an entry is known without an additional system call, except for symbolic links,
+        which are resolved to their target.
+        """
+        if entry.is_symlink():
+            stat = entry.stat()
+            identity = (stat.st_dev, stat.st_ino)
+        else:
+            identity = (device, entry.inode())
+
+        if identity in visited:
+            return False
+
+        visited.add(identity)
+        return True
+
+    @classmethod
+    def _remove_suffix(cls, name: str) -> str:
+        if name.endswith(PYTHON_FILE_SUFFIX):
+            return name[: -len(PYTHON_FILE_SUFFIX)]
+
+        return str(PurePath(name).with_suffix(""))
+
+    def _get_module_prefix(self, path: Path) -> str:
+        """Determine the prefix of the names of all modules within the given directory, such as A.B for directory B."""
+        module_path = path.relative_to(self._source_root)
+
+        if str(module_path) == ".":
+            return self._source_root.name
+
+        return f"{self._source_root.name}.{str(module_path).replace(os.sep, '.')}"
+
+    def _parse_file(self, path: Path, module_name: str) -> NamedModule:
+        """Converts a given python file to an ast module and its name."""
+        with open_source(path) as source:
             return NamedModule(
-                ast.parse(code),
+                ast.parse(source),  # type: ignore[call-overload]
                 module_name,
             )
 
+    def _get_imports(self, paths: list[Path]) -> list[list[RawImport]]:
+        """Returns the raw imports of the given python files in the same order, either from the import cache or by
+        parsing them.
+        """
+        imports: list[list[RawImport] | None] = [None] * len(paths)
+        # determined before the files are read, so that no cache entry combines the status of a newer version of a file
+        # with the imports of an older one
+        stats: list[os.stat_result] = []
+
+        if self._import_cache is not None:
+            stats = [path.stat() for path in paths]
+            imports = [
+                self._import_cache.lookup(path, stat)
+                for path, stat in zip(paths, stats)
+            ]
+
+        indices_to_parse = [index for index, i in enumerate(imports) if i is None]
+        paths_to_parse = [paths[index] for index in indices_to_parse]
+
+        for index, path, extracted_imports in zip(
+            indices_to_parse,
+            paths_to_parse,
+            self._extract_all(paths_to_parse),
+        ):
+            imports[index] = extracted_imports.imports
+            self._record_statistics(path, extracted_imports)
+
+            # skipped files are not cached, so that they are parsed as soon as they no longer match the skip criteria
+            if self._import_cache is not None and extracted_imports.skip_reason is None:
+                self._import_cache.store(
+                    path,
+                    stats[index],
+                    extracted_imports.source_hash,  # type: ignore[arg-type]
+                    extracted_imports.imports,
+                    self._get_method(extracted_imports),
+                )
+
+        return imports  # type: ignore
+
+    def _extract_all(self, paths: list[Path]) -> Iterable[ExtractedImports]:
+        """Extracts the imports of all given files in the same order. If files are processed in the current process and
+        prefetching is enabled, the files are read ahead in background threads.
+        """
+        if self._prefetch_bytes and self._workers <= 1:
+            return (
+                extract_imports_from_source(
+                    source,
+                    path,
+                    self._scanner,
+                    self._skip_criteria,
+                    self._header_only_verification,
+                    self._use_bytecode,
+                )
+                for path, source in prefetch(paths, self._prefetch_bytes)
+            )
+
+        return self._map(
+            partial(
+                extract_imports_from_file,
+                scanner=self._scanner,
+                skip_criteria=self._skip_criteria,
+                header_only_verification=self._header_only_verification,
+                use_bytecode=self._use_bytecode,
+            ),
+            paths,
+        )
+
+    def _get_method(self, extracted_imports: ExtractedImports) -> str | None:
+        """Returns how the imports were found, if the source code was not parsed completely."""
+        if extracted_imports.from_bytecode:
+            return BYTECODE
+
+        if self._scanner == HEADER_ONLY_SCANNER:
+            return HEADER_ONLY_SCANNER
+
         return None
 
+    def _record_statistics(
+        self, path: str | Path, extracted_imports: ExtractedImports
+    ) -> None:
+        if extracted_imports.missed_imports is not None:
+            self._record_verification(path, extracted_imports.missed_imports)
+
+        if extracted_imports.skip_reason is not None:
+            self._statistics.skipped_files[str(path)] = extracted_imports.skip_reason
+        elif self._use_bytecode:
+            self._record_bytecode_usage(extracted_imports.from_bytecode)
+
+    def _record_bytecode_usage(self, from_bytecode: bool) -> None:
+        if from_bytecode:
+            self._statistics.bytecode_hits += 1
+        else:
+            self._statistics.bytecode_misses += 1
+
+    def _record_verification(
+        self, path: str | Path, missed_imports: list[RawImport]
+    ) -> None:
+        self._statistics.verified_files += 1
+
+        if missed_imports:
+            self._statistics.missed_imports[str(path)] = [
+                _describe(raw_import) for raw_import in missed_imports
+            ]
+
+    def _map(
+        self,
+        function: Callable[[Path], ExtractedImports],
+        paths: list[Path],
+    ) -> Iterable[ExtractedImports]:
+        """Applies the function to all paths, in parallel if multiple workers are configured. The order of the
+        results always corresponds to the order of the paths, regardless of the number of workers.
+        """
+        if self._workers <= 1 or len(paths) <= 1:
+            return map(function, paths)
+
+        chunk_size = max(1, len(paths) // (self._workers * CHUNKS_PER_WORKER))
+
+        with create_executor(self._executor, self._workers) as executor:
+            return list(executor.map(function, paths, chunksize=chunk_size))
+
     def _get_module_name(self, path: Path) -> str:
         """Determine full name of module, such as A.B.C"""
         module_path = path.relative_to(self._source_root)
@@ -76,9 +837,8 @@ class Parser:
 
         return f"{self._source_root.name}.{module_in_dot_notation}"
 
-    def _file_should_be_parsed(self, path: Path) -> bool:
+    def _file_should_be_parsed(self, path: str) -> bool:
         """Returns True if path represents a python file that does not match any exclusion filters."""
-        correct_file_type = path.suffix == PYTHON_FILE_SUFFIX
-        file_excluded = self._filter.is_excluded(path)
+        correct_file_type = os.path.splitext(path)[1] == PYTHON_FILE_SUFFIX
 
-        return correct_file_type and not file_excluded
+        return correct_file_type and not self._filter.is_excluded(path)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+# number of threads reading files at the same time
+PREFETCH_THREADS = 8
+
+
+def prefetch(
+    paths: list[Path], byte_budget: int, threads: int = PREFETCH_THREADS
+) -> Iterator[tuple[Path, bytes]]:
+    """Reads the given files in a pool of threads ahead of the consumer, so that waiting for slow storage, e.g. a
+    network file system, overlaps with processing the files that have already been read.
+
+    Files are only read ahead as long as the files that have been read but not yet consumed take up less than the byte
+    budget. As the size of a file is only known once it has been read, up to one file per thread may be read in
+    addition, so that no file system call is required to determine the size beforehand.
+
+    Args:
+        paths: files to read
+        byte_budget: maximum number of bytes of files that have been read ahead
+        threads: number of threads reading files
+    Returns:
+        path and content of each file, in the order of the given paths
+    """
+    budget = _ByteBudget(byte_budget)
+    pending: deque[Future[bytes]] = deque()
+    next_index = 0
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        try:
+            for path in paths:
+                while (
+                    next_index < len(paths)
+                    and len(pending) < threads
+                    and (budget.available() or not pending)
+                ):
+                    pending.append(executor.submit(_read, paths[next_index], budget))
+                    next_index += 1
+
+                content = pending.popleft().result()
+                budget.release(len(content))
+
+                yield path, content
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _read(path: Path, budget: _ByteBudget) -> bytes:
+    """Reads the given file and reserves its size in the budget before returning, so that the consumer can only
+    release the size once it has been reserved.
+    """
+    with open(path, "rb") as file:
+        content = file.read()
+
+    budget.reserve(len(content))
+
+    return content
+
+
+class _ByteBudget:
+    """Keeps track of the number of bytes that have been read ahead, which is updated by the reading threads."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        with self._lock:
+            return self._used < self._limit
+
+    def reserve(self, size: int) -> None:
+        with self._lock:
+            self._used += size
+
+    def release(self, size: int) -> None:
+        with self._lock:
+            self._used -= size
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import ast
+import linecache
+import os
+import sys
+import weakref
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+
+from pytestarch.eval_structure.build_statistics import BuildStatistics
+from pytestarch.eval_structure_generation.file_import.converter import ImportConverter
+from pytestarch.eval_structure_generation.file_import.file_filter import FileFilter
+from pytestarch.eval_structure_generation.file_import.import_types import (
+    ModuleImports,
+    RawImport,
+)
+
+# entries of linecache.cache that have not been loaded yet only contain a function to load them
+LAZY_CACHE_ENTRY_LENGTH = 1
+
+# reason listed in the build statistics for modules whose source code is not cached by linecache
+SOURCE_NOT_CACHED = "source not cached by linecache"
+
+# raw imports of each module read so far, together with the spec of the module at that time. Since reloading a module
+# replaces its spec, outdated entries of reloaded modules are detected without accessing the file system.
+_module_imports: weakref.WeakKeyDictionary[
+    ModuleType, tuple[ModuleSpec | None, list[RawImport]]
+] = weakref.WeakKeyDictionary()
+
+
+def read_runtime_imports(
+    module_name: str, file_filter: FileFilter, statistics: BuildStatistics | None = None
+) -> tuple[list[str], list[ModuleImports]]:
+    """Determines the modules and their raw imports from the modules that have already been imported by the running
+    interpreter, i.e. the modules in sys.modules. Modules that have not been imported are not taken into account.
+
+    Like for files that are parsed, the imports of a package are assigned to its __init__ module, and modules whose file
+    or package directory is excluded by the filter are skipped together with all their submodules.
+
+    The imports are only taken from source code that is already cached by linecache, so no file is read again. Modules
+    whose source code is not cached are part of the result without imports, and are listed as skipped files in the
+    statistics.
+
+    Args:
+        module_name: name of the module whose submodules are taken into account, e.g. 'a.b'
+        file_filter: determines which modules are excluded, based on the paths of their files
+        statistics: build statistics the modules without cached source code are listed in
+    Returns:
+        list of python modules, raw imports of each python module
+    """
+    statistics = statistics or BuildStatistics()
+    all_modules = []
+    module_imports = []
+
+    # names of all packages, mapped to whether they are excluded
+    excluded_packages: dict[str, bool] = {}
+
+    for name, module in sorted(sys.modules.items()):
+        if (
+            not isinstance(module, ModuleType)
+            or module.__name__ != name
+            or (name != module_name and not name.startswith(module_name + "."))
+        ):
+            continue
+
+        parent = name.rpartition(".")[0]
+        if name != module_name and excluded_packages.get(parent, True):
+            continue
+
+        file = getattr(module, "__file__", None)
+        package_path = getattr(module, "__path__", None)
+
+        if package_path is not None:
+            directory = (
+                os.path.dirname(file) if file else next(iter(package_path), name)
+            )
+            excluded_packages[name] = file_filter.is_excluded(directory)
+
+            if excluded_packages[name]:
+                continue
+
+            all_modules.append(name)
+
+        if file is None or file_filter.is_excluded(file):
+            continue
+
+        if package_path is not None:
+            # e.g. a.b.__init__, like the name of the module of the file
+            name = f"{name}.{os.path.splitext(os.path.basename(file))[0]}"
+
+        imports = _read_imports(module, file)
+        if imports is None:
+            statistics.skipped_files[file] = SOURCE_NOT_CACHED
+            imports = []
+
+        all_modules.append(name)
+        module_imports.append(ModuleImports(name, imports))
+
+    return all_modules, module_imports
+
+
+def _read_imports(module: ModuleType, file: str) -> list[RawImport] | None:
+    cached_imports = _module_imports.get(module)
+
+    if cached_imports is not None and cached_imports[0] is module.__spec__:
+        return cached_imports[1]
+
+    imports = _extract_imports(file)
+    if imports is not None:
+        _module_imports[module] = (module.__spec__, imports)
+
+    return imports
+
+
+def _extract_imports(file: str) -> list[RawImport] | None:
+    """Returns the raw imports of a module from its source code if it has been cached by the line cache already, e.g.
+    by a traceback or by inspect, or None otherwise. The code object a module is executed with is not kept once the
+    module is loaded, so it cannot be used without reading the file again.
+    """
+    cache_entry = linecache.cache.get(file)
+
+    if cache_entry is None or len(cache_entry) <= LAZY_CACHE_ENTRY_LENGTH:
+        return None
+
+    try:
+        return ImportConverter().extract_raw_imports(
+            ast.parse("".join(cache_entry[2]))  # type: ignore[misc]
+        )
+    except SyntaxError:
+        return None
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from pytestarch.eval_structure_generation.file_import.source_reader import Source
+
+# number of bytes at the beginning of a file that are searched for the generated file marker
+GENERATED_FILE_HEADER_SIZE = 4096
+
+SCAN_IMPORTS = "scan"
+IGNORE_IMPORTS = "ignore"
+SKIPPED_FILE_IMPORTS = (SCAN_IMPORTS, IGNORE_IMPORTS)
+
+EXCEEDS_MAX_FILE_SIZE = "exceeds maximum file size"
+GENERATED_FILE = "generated file"
+
+
+@dataclass(frozen=True)
+class SkipCriteria:
+    """Determines which files are not parsed, because parsing them is expensive and usually not worth it, e.g. for
+    large generated modules.
+
+    Attributes:
+        max_file_size: files larger than this number of bytes are skipped
+        generated_file_marker: files whose first GENERATED_FILE_HEADER_SIZE bytes match this pattern are skipped
+        scan_imports: if True, the imports of skipped files are extracted by only tokenizing the lines that contain
+            import statements. Otherwise, the imports of skipped files are ignored.
+    """
+
+    max_file_size: int | None = None
+    generated_file_marker: re.Pattern[bytes] | None = None
+    scan_imports: bool = True
+
+    def skip_reason(self, source: Source) -> str | None:
+        """Returns why the file with the given content should be skipped, or None if it should be parsed."""
+        if self.max_file_size is not None and len(source) > self.max_file_size:
+            return EXCEEDS_MAX_FILE_SIZE
+
+        if self.generated_file_marker is not None and self.generated_file_marker.search(
+            source[:GENERATED_FILE_HEADER_SIZE]
+        ):
+            return GENERATED_FILE
+
+        return None
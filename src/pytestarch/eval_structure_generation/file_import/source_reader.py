@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from io import BytesIO
+from pathlib import Path
+
+# files at least this large are memory-mapped instead of being read into memory
+MEMORY_MAP_THRESHOLD = 1024 * 1024
+
+Source = bytes | mmap.mmap
+
+
+@contextmanager
+def open_source(path: Path) -> Iterator[Source]:
+    """Provides the undecoded content of a python file. Small files are read completely, large files are
+    memory-mapped, so that their content does not have to be copied into memory as a whole.
+
+    The content is not decoded, as both the python parser and tokenizer determine the encoding of a file themselves,
+    taking into account encoding declarations (PEP 263) and byte order marks. Consequently, the result does not depend
+    on the platform's default encoding.
+
+    Args:
+        path: path of the python file
+    Returns:
+        content of the file, only valid until the context is exited
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+
+        if size < MEMORY_MAP_THRESHOLD:
+            yield file.read()
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            yield mapped_file
+
+
+def line_reader(source: Source) -> Callable[[], bytes]:
+    """Returns a function that reads the source line by line, as required by the tokenize module."""
+    if isinstance(source, mmap.mmap):
+        source.seek(0)
+        return source.readline
+
+    return BytesIO(source).readline
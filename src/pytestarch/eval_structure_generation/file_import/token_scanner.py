@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import re
+import tokenize
+from collections.abc import Iterator
+from keyword import iskeyword
+
+from pytestarch.eval_structure.types import (
+    GUARDED_IMPORT,
+    LOCAL_IMPORT,
+    RUNTIME_IMPORT,
+    TYPE_CHECKING_IMPORT,
+)
+from pytestarch.eval_structure_generation.file_import.import_types import RawImport
+from pytestarch.eval_structure_generation.file_import.source_reader import (
+    Source,
+    line_reader,
+)
+
+# blocks of these statements are scanned for imports, as they correspond to the 'body' of the ast statement
+SCANNED_BLOCK_KEYWORDS = {"if", "for", "while", "with", "try", "def", "class", "async"}
+# blocks of these statements are not scanned, as they correspond to e.g. the 'orelse' or 'handlers' of the ast statement
+IGNORED_BLOCK_KEYWORDS = {"else", "elif", "except", "finally"}
+MATCH_KEYWORD = "match"
+
+# top-level statements starting with these keywords do not end the header of a file. An else or elif branch can only
+# follow a TYPE_CHECKING block in the header, as the header would have ended with any other compound statement
+HEADER_KEYWORDS = {"import", "from", "else", "elif"}
+TYPE_CHECKING = "TYPE_CHECKING"
+
+IGNORED_TOKEN_TYPES = {tokenize.ENCODING, tokenize.COMMENT, tokenize.NL}
+OPENING_BRACKETS = {"(", "[", "{"}
+CLOSING_BRACKETS = {")", "]", "}"}
+
+# start of a line containing an import statement, e.g. 'import a', 'from .a import b', or 'from . import (b'
+IMPORT_LINE = re.compile(
+    rb"^[ \t]*(?:import[ \t]+[\w.]|from[ \t]+\.*[\w.]*[ \t]*import\b)", re.MULTILINE
+)
+
+Line = list[tokenize.TokenInfo]
+
+
+class TokenImportScanner:
+    """Extracts imports from the token stream of a python file instead of its abstract syntax tree.
+
+    Only import statements are analysed in detail; all other statements are skipped after their first token. The
+    result is identical to the one of ImportConverter.extract_raw_imports: imports are only found in the blocks that the
+    ast-based extraction descends into (e.g. the body of an if statement, but not its else branch).
+    """
+
+    def scan(self, source: Source) -> list[RawImport]:
+        """Returns all raw imports of the given source code.
+
+        Args:
+            source: undecoded content of a python file
+        Returns:
+            list of raw imports, in the same order as ImportConverter.extract_raw_imports returns them
+        """
+        return self._scan(source, header_only=False)
+
+    def scan_header(self, source: Source) -> list[RawImport]:
+        """Returns the raw imports of the header of the given source code. The header ends with the first top-level
+        statement that is neither an import statement, a docstring, nor an 'if TYPE_CHECKING:' block (including its
+        else branch); the source code is not tokenized any further.
+
+        Args:
+            source: undecoded content of a python file
+        Returns:
+            list of raw imports, in the same order as ImportConverter.extract_raw_imports returns the imports of the
+            header
+        """
+        return self._scan(source, header_only=True)
+
+    def _scan(self, source: Source, header_only: bool) -> list[RawImport]:
+        if source.find(b"import") == -1:
+            return []
+
+        # raw imports are collected per import statement. The ast-based extraction visits the import statements
+        # in reverse order, so the statements are reversed at the end to achieve an identical result
+        imports_per_statement: list[list[RawImport]] = []
+
+        scanned_blocks = [True]
+        next_block_scanned = True
+        # import kinds of the blocks, e.g. TYPE_CHECKING_IMPORT for an 'if TYPE_CHECKING:' block
+        block_kinds = [RUNTIME_IMPORT]
+        next_block_kind = RUNTIME_IMPORT
+
+        for line in self._logical_lines(source):
+            token = line[0]
+
+            if token.type == tokenize.INDENT:
+                scanned_blocks.append(next_block_scanned)
+                block_kinds.append(next_block_kind)
+                line = line[1:]
+            while line and line[0].type == tokenize.DEDENT:
+                scanned_blocks.pop()
+                block_kinds.pop()
+                line = line[1:]
+
+            if not line:
+                continue
+
+            if (
+                header_only
+                and len(scanned_blocks) == 1
+                and not self._belongs_to_header(line)
+            ):
+                break
+
+            block_scanned = scanned_blocks[-1]
+            kind = block_kinds[-1]
+            header_end = self._find_end_of_block_header(line)
+
+            if header_end is not None:
+                keyword = line[0].string
+                block_scanned = block_scanned and keyword in SCANNED_BLOCK_KEYWORDS
+                kind |= self._block_kind(line, header_end)
+                next_block_scanned = block_scanned
+                next_block_kind = kind
+                # the block of a compound statement may directly follow the colon on the same line
+                line = line[header_end + 1 :]
+
+            if not block_scanned:
+                continue
+
+            for statement in self._split_statements(line):
+                raw_imports = self._parse_import_statement(statement, kind)
+
+                if raw_imports:
+                    imports_per_statement.append(raw_imports)
+
+        return [
+            raw_import
+            for raw_imports in reversed(imports_per_statement)
+            for raw_import in raw_imports
+        ]
+
+    def scan_import_lines(self, source: Source) -> list[RawImport]:
+        """Cheap approximation of scan for files that are too large to be tokenized completely: only the lines
+        starting with an import statement are found via a regex and tokenized, all other lines are skipped.
+
+        In contrast to scan, imports are found in all blocks (e.g. also in the else branch of an if statement), and
+        lines within multi-line strings that look like import statements are mistaken for imports. As the blocks of the
+        imports are not known, all imports are runtime imports.
+
+        Args:
+            source: undecoded content of a python file
+        Returns:
+            list of raw imports, in reverse order of the import statements
+        """
+        imports_per_statement: list[list[RawImport]] = []
+
+        for match in IMPORT_LINE.finditer(source):
+            statement_source = self._read_statement(source, match.start())
+
+            try:
+                for line in self._logical_lines(statement_source):
+                    for statement in self._split_statements(line):
+                        raw_imports = self._parse_import_statement(statement)
+
+                        if raw_imports:
+                            imports_per_statement.append(raw_imports)
+            except (tokenize.TokenError, SyntaxError, IndexError):
+                # not an actual import statement, e.g. a line within a string
+                continue
+
+        return [
+            raw_import
+            for raw_imports in reversed(imports_per_statement)
+            for raw_import in raw_imports
+        ]
+
+    @classmethod
+    def _read_statement(cls, source: Source, start: int) -> bytes:
+        """Returns the source of the statement starting at the given position without its indentation, including all
+        lines it continues on via parentheses or backslashes.
+        """
+        lines: list[bytes] = []
+        open_parentheses = 0
+
+        while True:
+            end = source.find(b"\n", start)
+            line = source[start:] if end == -1 else source[start : end + 1]
+            lines.append(line.lstrip() if not lines else line)
+            open_parentheses += line.count(b"(") - line.count(b")")
+
+            if end == -1 or (
+                open_parentheses <= 0 and not line.rstrip().endswith(b"\\")
+            ):
+                return b"".join(lines)
+
+            start = end + 1
+
+    @classmethod
+    def _logical_lines(cls, source: Source) -> Iterator[Line]:
+        """Groups the tokens of the source code into logical lines, without comments and line breaks within a
+        logical line. Indentation changes are part of the logical line they precede.
+        """
+        line: Line = []
+
+        for token in tokenize.tokenize(line_reader(source)):
+            if token.type in IGNORED_TOKEN_TYPES:
+                continue
+
+            if token.type in (tokenize.NEWLINE, tokenize.ENDMARKER):
+                if line:
+                    yield line
+                line = []
+            else:
+                line.append(token)
+
+    @classmethod
+    def _belongs_to_header(cls, line: Line) -> bool:
+        """Returns True if the top-level statement starting the line can be part of the header of a file."""
+        first_token = line[0]
+
+        if first_token.type == tokenize.STRING:
+            return all(token.type == tokenize.STRING for token in line)
+
+        if first_token.type != tokenize.NAME:
+            return False
+
+        if first_token.string in HEADER_KEYWORDS:
+            return True
+
+        if first_token.string != "if":
+            return False
+
+        # e.g. 'if TYPE_CHECKING:' or 'if typing.TYPE_CHECKING:'
+        condition = [
+            token.string for token in line[1 : cls._find_end_of_block_header(line)]
+        ]
+
+        return (
+            bool(condition)
+            and condition[-1] == TYPE_CHECKING
+            and all(part == "." or part.isidentifier() for part in condition)
+        )
+
+    @classmethod
+    def _block_kind(cls, line: Line, header_end: int) -> int:
+        """Returns the kind of all imports within the block of the compound statement starting the line."""
+        keyword = line[0].string
+
+        if keyword == "def" or (keyword == "async" and line[1].string == "def"):
+            return LOCAL_IMPORT
+
+        if keyword == "try":
+            return GUARDED_IMPORT
+
+        if keyword == "if" and cls._is_type_checking(line[1:header_end]):
+            return TYPE_CHECKING_IMPORT
+
+        return RUNTIME_IMPORT
+
+    @classmethod
+    def _is_type_checking(cls, condition: Line) -> bool:
+        """Returns True for the conditions 'TYPE_CHECKING' and e.g. 'typing.TYPE_CHECKING'."""
+        if not condition or condition[-1].string != TYPE_CHECKING:
+            return False
+
+        return all(
+            token.string == "."
+            if index % 2
+            else token.type == tokenize.NAME and not iskeyword(token.string)
+            for index, token in enumerate(condition)
+        )
+
+    @classmethod
+    def _find_end_of_block_header(cls, line: Line) -> int | None:
+        """If the line starts a compound statement (e.g. if, def, else), returns the index of the colon that ends its
+        header. Otherwise, None is returned.
+        """
+        first_token = line[0]
+
+        if first_token.type != tokenize.NAME:
+            return None
+
+        keyword = first_token.string
+
+        if keyword == MATCH_KEYWORD:
+            # soft keyword: only a match statement if the line ends with a colon, e.g. not 'match = x'
+            if len(line) > 1 and cls._is_operator(line[-1], ":"):
+                return len(line) - 1
+            return None
+
+        if (
+            keyword not in SCANNED_BLOCK_KEYWORDS
+            and keyword not in IGNORED_BLOCK_KEYWORDS
+        ):
+            return None
+
+        depth = 0
+        open_lambdas = 0
+
+        for index, token in enumerate(line):
+            if token.type != tokenize.OP and token.string != "lambda":
+                continue
+
+            if token.string in OPENING_BRACKETS:
+                depth += 1
+            elif token.string in CLOSING_BRACKETS:
+                depth -= 1
+            elif depth == 0 and token.string == "lambda":
+                open_lambdas += 1
+            elif depth == 0 and token.string == ":":
+                # a colon of a lambda expression is not the end of the header
+                if open_lambdas == 0:
+                    return index
+                open_lambdas -= 1
+
+        return None
+
+    @classmethod
+    def _split_statements(cls, line: Line) -> Iterator[Line]:
+        """Splits a logical line into simple statements separated by semicolons."""
+        statement: Line = []
+
+        for token in line:
+            if cls._is_operator(token, ";"):
+                if statement:
+                    yield statement
+                statement = []
+            else:
+                statement.append(token)
+
+        if statement:
+            yield statement
+
+    @classmethod
+    def _parse_import_statement(
+        cls, statement: Line, kind: int = RUNTIME_IMPORT
+    ) -> list[RawImport] | None:
+        """Converts an import statement to raw imports. Returns None if the statement is not an import statement."""
+        first_token = statement[0]
+
+        if first_token.type != tokenize.NAME:
+            return None
+
+        if first_token.string == "import":
+            return [
+                RawImport(name, None, 0, kind)
+                for name in cls._parse_imported_names(statement[1:])
+            ]
+
+        if first_token.string == "from":
+            return cls._parse_from_import_statement(statement, kind)
+
+        return None
+
+    @classmethod
+    def _parse_from_import_statement(
+        cls, statement: Line, kind: int
+    ) -> list[RawImport]:
+        level = 0
+        index = 1
+
+        # a relative import can start with '...', which is a single token
+        while statement[index].type == tokenize.OP and set(statement[index].string) == {
+            "."
+        }:
+            level += len(statement[index].string)
+            index += 1
+
+        module_parts = []
+        while statement[index].string != "import":
+            module_parts.append(statement[index].string)
+            index += 1
+
+        module = "".join(module_parts) or None
+
+        if level == 0:
+            return [RawImport(module, None, 0, kind)]
+
+        return [
+            RawImport(module, name, level, kind)
+            for name in cls._parse_imported_names(statement[index + 1 :])
+        ]
+
+    @classmethod
+    def _parse_imported_names(cls, tokens: Line) -> list[str]:
+        """Returns the imported names, e.g. ['a.b', 'c'] for 'a.b as x, c' and ['*'] for '*'. Aliases and
+        parentheses are skipped.
+        """
+        names = []
+        name_parts: list[str] = []
+        alias_follows = False
+
+        for token in tokens:
+            if cls._is_operator(token, ",") or cls._is_operator(token, ")"):
+                if name_parts:
+                    names.append("".join(name_parts))
+                name_parts = []
+                alias_follows = False
+            elif token.type == tokenize.NAME and token.string == "as":
+                alias_follows = True
+            elif not alias_follows and not cls._is_operator(token, "("):
+                name_parts.append(token.string)
+
+        if name_parts:
+            names.append("".join(name_parts))
+
+        return names
+
+    @classmethod
+    def _is_operator(cls, token: tokenize.TokenInfo, operator: str) -> bool:
+        return token.type == tokenize.OP and token.string == operator
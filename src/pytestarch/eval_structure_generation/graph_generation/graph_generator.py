@@ -1,23 +1,62 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Sequence
+import re
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
 from pathlib import Path
 
+from pytestarch.eval_structure.build_statistics import BuildStatistics
+from pytestarch.eval_structure.collapsed_imports import CollapsedImports
+from pytestarch.eval_structure.csr_graph import CsrGraph
 from pytestarch.eval_structure.evaluable_graph import EvaluableArchitectureGraph
+from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
 from pytestarch.eval_structure.networkxgraph import NetworkxGraph, Node
 from pytestarch.eval_structure.types import Import
+from pytestarch.eval_structure_generation.file_import.bytecode_reader import (
+    BYTECODE,
+    SOURCE,
+)
 from pytestarch.eval_structure_generation.file_import.config import Config
 from pytestarch.eval_structure_generation.file_import.converter import ImportConverter
+from pytestarch.eval_structure_generation.file_import.executors import (
+    PROCESS_EXECUTOR,
+)
 from pytestarch.eval_structure_generation.file_import.file_filter import FileFilter
+from pytestarch.eval_structure_generation.file_import.git_history import GitRevision
+from pytestarch.eval_structure_generation.file_import.import_cache import ImportCache
 from pytestarch.eval_structure_generation.file_import.import_filter import (
     ExternalImportFilter,
 )
-from pytestarch.eval_structure_generation.file_import.import_types import NamedModule
+from pytestarch.eval_structure_generation.file_import.import_types import (
+    AbsoluteImport,
+    ModuleImports,
+)
 from pytestarch.eval_structure_generation.file_import.importee_module_calculator import (
     ImporteeModuleCalculator,
 )
-from pytestarch.eval_structure_generation.file_import.parser import Parser
+from pytestarch.eval_structure_generation.file_import.module_classifier import (
+    ModuleClassifier,
+)
+from pytestarch.eval_structure_generation.file_import.parser import (
+    AST_SCANNER,
+    HEADER_ONLY_SCANNER,
+    Parser,
+)
+from pytestarch.eval_structure_generation.file_import.runtime_modules import (
+    read_runtime_imports,
+)
+from pytestarch.eval_structure_generation.file_import.skip_criteria import (
+    SCAN_IMPORTS,
+    SkipCriteria,
+)
+
+NETWORKX_BACKEND = "networkx"
+CSR_BACKEND = "csr"
+GRAPH_BACKENDS: dict[str, type[NetworkxGraph] | type[CsrGraph]] = {
+    NETWORKX_BACKEND: NetworkxGraph,
+    CSR_BACKEND: CsrGraph,
+}
 
 
 def _get_absolute_import_prefix(
@@ -39,45 +78,183 @@ def generate_graph(
     exclude_external_libraries: bool,
     level_limit: int | None,
     external_exclusions: tuple[str, ...] | None,
+    *,
+    cache_dir: Path | None = None,
+    workers: int = 1,
+    scanner: str = AST_SCANNER,
+    respect_ignore_files: bool = False,
+    files: list[Path] | None = None,
+    max_file_size: int | None = None,
+    generated_file_marker: str | None = None,
+    skipped_file_imports: str = SCAN_IMPORTS,
+    header_only_verification: float = 0.0,
+    source: str = SOURCE,
+    archive: Path | None = None,
+    revision: GitRevision | None = None,
+    runtime_module: str | None = None,
+    prefetch_bytes: int = 0,
+    executor: str = PROCESS_EXECUTOR,
+    exclude_stdlib: bool = False,
+    keep_third_party: tuple[str, ...] | None = None,
+    external_depth: int | None = None,
+    backend: str = NETWORKX_BACKEND,
 ) -> EvaluableArchitectureGraph:
+    statistics = BuildStatistics()
+
     level_limit = _add_extra_levels_to_limit_if_root_and_module_path_differ(
         level_limit,
         path_diff_between_root_and_module,
     )
 
-    all_modules, ast = _get_all_ast_modules(module_path, root_path, exclusions)
+    all_modules, module_imports = _get_all_module_imports(
+        module_path,
+        root_path,
+        Config(
+            exclusions,
+            cache_dir=cache_dir,
+            workers=workers,
+            scanner=scanner,
+            respect_ignore_files=respect_ignore_files,
+            max_file_size=max_file_size,
+            generated_file_marker=generated_file_marker,
+            skipped_file_imports=skipped_file_imports,
+            header_only_verification=header_only_verification,
+            source=source,
+            prefetch_bytes=prefetch_bytes,
+            executor=executor,
+        ),
+        statistics,
+        files,
+        archive,
+        revision,
+        runtime_module,
+    )
 
     internal_module_prefix = _get_internal_module_prefix(
         path_diff_between_root_and_module, root_path
     )
 
-    imports = _get_imports_from_ast(
-        ast,
+    if external_exclusions is None:
+        external_exclusions = ()
+
+    # parent modules of all modules are looked up in this table by all following steps, so that the name of each
+    # module is only created once
+    module_hierarchy = ModuleHierarchy()
+
+    # the import objects are only ever created on the fly from the compact raw imports and are consumed right away,
+    # so that the memory required does not depend on the number of imports. If external modules are added to the
+    # graph, the imports have to be streamed twice: once to collect the external modules, once to add the edges
+    # shared by both streams, so that each external module is only classified once
+    import_filter = ExternalImportFilter(
+        exclude_external_libraries,
+        internal_module_prefix,
+        external_exclusions,
+        module_hierarchy,
+        ModuleClassifier(exclude_stdlib, keep_third_party),
+        statistics,
+    )
+
+    collapsed_imports = (
+        CollapsedImports(external_depth, module_hierarchy)
+        if external_depth is not None
+        else None
+    )
+
+    stream_imports = partial(
+        _stream_imports,
+        module_imports,
         _get_absolute_import_prefix(
             path_diff_between_root_and_module, root_path, module_path
         ),
         _get_all_internal_modules(all_modules, internal_module_prefix),
+        import_filter,
+        internal_module_prefix,
+        collapsed_imports,
     )
 
-    if external_exclusions is None:
-        external_exclusions = ()
+    all_modules = _append_external_modules_to_module_list(
+        all_modules,
+        exclude_external_libraries,
+        stream_imports,
+        root_path,
+        external_exclusions,
+        module_hierarchy,
+    )
+    return EvaluableArchitectureGraph(
+        GRAPH_BACKENDS[backend](
+            all_modules,
+            # collapsed imports are only stored once
+            stream_imports(store_collapsed_imports=True),
+            level_limit,
+            module_hierarchy,
+            collapsed_imports,
+        ),
+        statistics,
+    )
 
-    imports = _remove_excluded_imports(
-        exclude_external_libraries, imports, internal_module_prefix, external_exclusions
+
+def _stream_imports(
+    module_imports: list[ModuleImports],
+    absolute_import_prefix: str,
+    all_internal_modules: set[str],
+    import_filter: ExternalImportFilter,
+    internal_module_prefix: str,
+    collapsed_imports: CollapsedImports | None,
+    store_collapsed_imports: bool = False,
+) -> Iterator[Import]:
+    """Lazily converts the raw imports of all modules to import objects and removes excluded imports. If configured,
+    imports of external modules are collapsed to imports of their parent modules.
+    """
+    imports = _get_imports_from_module_imports(
+        module_imports, absolute_import_prefix, all_internal_modules
     )
 
-    all_modules = _append_external_modules_to_module_list(
-        all_modules, exclude_external_libraries, imports, root_path, external_exclusions
+    filtered_imports = import_filter.filter_lazily(imports)
+
+    if collapsed_imports is None:
+        return filtered_imports
+
+    return _collapse_external_imports(
+        filtered_imports,
+        internal_module_prefix,
+        collapsed_imports,
+        store_collapsed_imports,
     )
-    return EvaluableArchitectureGraph(NetworkxGraph(all_modules, imports, level_limit))
+
+
+def _collapse_external_imports(
+    imports: Iterable[Import],
+    internal_module_prefix: str,
+    collapsed_imports: CollapsedImports,
+    store_collapsed_imports: bool,
+) -> Iterator[Import]:
+    for imp in imports:
+        importee = imp.importee()
+
+        if importee.startswith(internal_module_prefix):
+            yield imp
+            continue
+
+        collapsed = (
+            collapsed_imports.collapse(imp.importer(), importee, imp.kind())
+            if store_collapsed_imports
+            else collapsed_imports.collapsed_module(importee)
+        )
+
+        yield (
+            imp
+            if collapsed == importee
+            else AbsoluteImport(imp.importer(), collapsed, imp.kind())
+        )
 
 
 def _append_external_modules_to_module_list(
     all_modules: list[Node],
     exclude_external_libraries: bool,
-    imports: Sequence[Import],
+    stream_imports: Callable[[], Iterator[Import]],
     root_path: Path,
     external_exclusions: tuple[str, ...],
+    module_hierarchy: ModuleHierarchy,
 ) -> list[Node]:
     """External modules are not detected as modules when importing the source folder - but they will of course show up
     in the imports. To ensure that all edges in the graph have nodes attached, the external modules need to be added to
@@ -85,8 +262,10 @@ def _append_external_modules_to_module_list(
     if exclude_external_libraries:
         return all_modules
 
-    all_modules = ImporteeModuleCalculator(root_path).calculate_importee_modules(
-        imports,
+    all_modules = ImporteeModuleCalculator(
+        root_path, module_hierarchy
+    ).calculate_importee_modules(
+        stream_imports(),
         all_modules,
     )
 
@@ -98,18 +277,6 @@ def _append_external_modules_to_module_list(
     return [module for module in all_modules if not file_filter.is_excluded(module)]
 
 
-def _remove_excluded_imports(
-    exclude_external_libraries: bool,
-    imports: Sequence[Import],
-    internal_module_prefix: str,
-    external_exclusions: tuple[str, ...],
-) -> Sequence[Import]:
-    import_filter = ExternalImportFilter(
-        exclude_external_libraries, internal_module_prefix, external_exclusions
-    )
-    return import_filter.filter(imports)
-
-
 def _get_internal_module_prefix(
     path_diff_between_root_and_module: str, root_path: Path
 ) -> str:
@@ -147,26 +314,99 @@ def _add_extra_levels_to_limit_if_root_and_module_path_differ(
     return level_limit
 
 
-def _get_imports_from_ast(
-    ast: list[NamedModule],
+def _get_imports_from_module_imports(
+    module_imports: list[ModuleImports],
     absolute_import_prefix: str,
     all_internal_modules: set[str],
-) -> Sequence[Import]:
+) -> Iterator[Import]:
     converter = ImportConverter()
-    return converter.convert(ast, absolute_import_prefix, all_internal_modules)
+    return converter.convert_raw_imports(
+        module_imports, absolute_import_prefix, all_internal_modules
+    )
 
 
-def _get_all_ast_modules(
+def _get_all_module_imports(
     module_path: Path,
     root_path: Path,
-    exclusions: tuple[str, ...],
-) -> tuple[list[str], list[NamedModule]]:
-    config = Config(exclusions)
+    config: Config,
+    statistics: BuildStatistics,
+    files: list[Path] | None,
+    archive: Path | None,
+    revision: GitRevision | None,
+    runtime_module: str | None,
+) -> tuple[list[str], list[ModuleImports]]:
     file_filter = FileFilter(config)
 
-    parser = Parser(file_filter, root_path)
-    all_modules, ast = parser.parse(module_path)
-    return all_modules, ast
+    if runtime_module is not None:
+        return read_runtime_imports(runtime_module, file_filter, statistics)
+
+    skip_criteria = _get_skip_criteria(config)
+
+    import_cache = None
+    if config.cache_dir is not None:
+        import_cache = ImportCache(
+            config.cache_dir,
+            statistics,
+            _get_accepted_cache_methods(config),
+            skip_criteria,
+        )
+
+    parser = Parser(
+        file_filter,
+        root_path,
+        import_cache=import_cache,
+        workers=config.workers,
+        scanner=config.scanner,
+        respect_ignore_files=config.respect_ignore_files,
+        skip_criteria=skip_criteria,
+        statistics=statistics,
+        header_only_verification=config.header_only_verification,
+        use_bytecode=config.source == BYTECODE,
+        prefetch_bytes=config.prefetch_bytes,
+        executor=config.executor,
+    )
+
+    if revision is not None:
+        return parser.parse_imports_of_revision(revision, module_path)
+
+    if archive is not None:
+        return parser.parse_imports_of_archive(archive, module_path)
+
+    if files is not None:
+        return parser.parse_imports_of_listed_files(module_path, files)
+
+    return parser.parse_imports(module_path)
+
+
+def _get_accepted_cache_methods(config: Config) -> tuple[str | None, ...]:
+    """Entries of files whose imports were found by parsing them are not used when reading bytecode, and vice versa,
+    so that the result does not depend on how the cache was filled. Complete scans are also accepted for header scans,
+    as they find all imports the header scan finds.
+    """
+    if config.source == BYTECODE:
+        return (BYTECODE,)
+
+    if config.scanner == HEADER_ONLY_SCANNER:
+        return None, HEADER_ONLY_SCANNER
+
+    return (None,)
+
+
+def _get_skip_criteria(config: Config) -> SkipCriteria | None:
+    if config.max_file_size is None and config.generated_file_marker is None:
+        return None
+
+    generated_file_marker = None
+    if config.generated_file_marker is not None:
+        generated_file_marker = re.compile(
+            config.generated_file_marker.encode(), re.MULTILINE
+        )
+
+    return SkipCriteria(
+        config.max_file_size,
+        generated_file_marker,
+        config.skipped_file_imports == SCAN_IMPORTS,
+    )
 
 
 def _get_all_internal_modules(
@@ -1,16 +1,53 @@
 """
-The following two functions are the main entry point to PyTestArch. They can be used to create an evaluable object,
+The following functions are the main entry points to PyTestArch. They can be used to create an evaluable object,
 for which the user can then define architectural rules.
 """
 
 from __future__ import annotations
 
 import os
+import re
+import sys
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from types import ModuleType
 
 from pytestarch import EvaluableArchitecture
+from pytestarch.eval_structure.evaluable_graph import EvaluableArchitectureGraph
+from pytestarch.eval_structure_generation.file_import.bytecode_reader import (
+    SOURCE,
+    SOURCE_KINDS,
+)
+from pytestarch.eval_structure_generation.file_import.exceptions import GitError
+from pytestarch.eval_structure_generation.file_import.executors import (
+    EXECUTORS,
+    PROCESS_EXECUTOR,
+)
+from pytestarch.eval_structure_generation.file_import.git_history import (
+    GitRepository,
+    GitRevision,
+)
+from pytestarch.eval_structure_generation.file_import.import_recorder import (
+    read_recorded_imports,
+)
+from pytestarch.eval_structure_generation.file_import.import_types import (
+    AbsoluteImport,
+    ExtractedImports,
+)
+from pytestarch.eval_structure_generation.file_import.manifest import read_manifest
+from pytestarch.eval_structure_generation.file_import.parser import (
+    AST_SCANNER,
+    HEADER_ONLY_SCANNER,
+    SCANNERS,
+)
+from pytestarch.eval_structure_generation.file_import.skip_criteria import (
+    SCAN_IMPORTS,
+    SKIPPED_FILE_IMPORTS,
+)
 from pytestarch.eval_structure_generation.graph_generation.graph_generator import (
+    GRAPH_BACKENDS,
+    NETWORKX_BACKEND,
     generate_graph,
 )
 from pytestarch.query_language.exceptions import ImproperlyConfigured
@@ -30,6 +67,21 @@ def get_evaluable_architecture(
     regex_exclusions: tuple[str, ...] | None = None,
     external_exclusions: tuple[str, ...] | None = None,
     regex_external_exclusions: tuple[str, ...] | None = None,
+    cache_dir: str | Path | None = None,
+    workers: int = 1,
+    scanner: str = AST_SCANNER,
+    respect_ignore_files: bool = False,
+    max_file_size: int | None = None,
+    generated_file_marker: str | None = None,
+    skipped_file_imports: str = SCAN_IMPORTS,
+    header_only_verification: float = 0.0,
+    source: str = SOURCE,
+    prefetch_bytes: int = 0,
+    executor: str = PROCESS_EXECUTOR,
+    exclude_stdlib: bool = False,
+    keep_third_party: tuple[str, ...] | None = None,
+    external_depth: int | None = None,
+    backend: str = NETWORKX_BACKEND,
 ) -> EvaluableArchitecture:
     """Constructs an evaluable object based on the given module.
 
@@ -46,7 +98,482 @@ def get_evaluable_architecture(
             then assigned to X instead, if Y is above the level limit.
         regex_exclusions: Proper regex version of 'exclusions'. Can only be specified if regex_exclusions is not specified.
         regex_external_exclusions: Proper regex version of 'external_exclusions' to exclude certain external dependencies from being integrated into the evaluable. Can only be specified if exclude_external_libraries is False and external_exclusions is not specified. If a parent module (e.g. 'logging') is excluded, so will be child modules (e.g. 'logging.handlers').
+        cache_dir: if not None, the imports found in each file are cached in this directory, e.g. '.pytest_cache/pytestarch'. Files that have not changed since the cache was last written are neither read nor parsed again.
+        workers: number of workers used to parse the source files. With the default of 1, all files are parsed in the current process. The result does not depend on the number of workers.
+        scanner: method used to find the imports in each file. 'ast' (default) parses each file into an abstract syntax tree, 'tokenize' only scans the token stream of each file for import statements, which requires considerably less memory for large files, e.g. generated code, but takes about twice as long for files of usual size. Both find the same imports. 'header_only' only scans the header of each file, which ends with the first top-level statement that is neither an import statement, a docstring, nor an 'if TYPE_CHECKING:' block. This is considerably faster, but misses all imports after the header, e.g. in functions.
+        respect_ignore_files: if True, files and directories ignored by .gitignore or .ignore files (e.g. virtual environments or build directories) are neither parsed nor added to the evaluable, without having to define exclusions for them. Ignored directories are not even descended into. The ignore files are read directly; git does not need to be installed.
+        max_file_size: if not None, files larger than this number of bytes are not parsed, e.g. to skip large generated modules. The modules are still part of the evaluable, and all skipped files are listed in the build statistics of the evaluable.
+        generated_file_marker: if not None, files whose first 4096 bytes match this regex are not parsed, e.g. '^# Generated by the protocol buffer compiler'. Like files exceeding the max_file_size, they are still part of the evaluable and listed in the build statistics.
+        skipped_file_imports: 'scan' (default) to extract the imports of files that are not parsed by only looking at the lines that start with an import statement, or 'ignore' to not take any imports of these files into account. Unlike a complete parse, the scan also finds imports in e.g. else branches, and it can mistake lines of multi-line strings for imports.
+        header_only_verification: fraction of files between 0 and 1 that are parsed completely in addition to scanning their header if the 'header_only' scanner is used. Imports missed by the header scan are listed in the build statistics of the evaluable, the evaluable itself only contains the imports found by the header scan. The files are selected based on their path, so that the same files are verified in each run.
+        source: 'source' (default) to find the imports in the source code of each file, or 'bytecode' to read them from the cached bytecode in the __pycache__ directories, as written when importing the modules or running compileall. Reading the bytecode is considerably faster than parsing the source code. Each .pyc file is validated against its source file, only files without up-to-date .pyc file are parsed. In contrast to parsing the source code, imports in all blocks are found, e.g. also in else branches or except blocks.
+        prefetch_bytes: if not 0, the files are read ahead of the parser by a pool of threads, until the files that have been read but not yet parsed take up this number of bytes, e.g. 16 * 1024 * 1024. This speeds up the analysis if reading the files is slow, e.g. on network file systems or cold disk caches. Can only be used with a single worker; by default, the files are read one after another by the parser.
+        executor: kind of workers used to parse the source files if there are multiple workers. 'process' (default) parses the files in worker processes. 'thread' parses them in threads of the current process, which start faster, but only parse in parallel on free-threaded builds of Python. 'interpreter' parses them in subinterpreters, each with its own global interpreter lock; it is only available as of Python 3.14.
+        exclude_stdlib: if True, dependencies to modules of the standard library (as listed in sys.stdlib_module_names) are not taken into account. Can only be specified if exclude_external_libraries is False.
+        keep_third_party: if not None, dependencies to modules of installed third-party distributions are not taken into account, except for the top level modules listed here, e.g. ('numpy',). Can only be specified if exclude_external_libraries is False. The top level modules of all installed distributions are read from their metadata once.
+        external_depth: if not None, external modules are only added to the evaluable up to this depth, e.g. 1 to only add top level modules like 'numpy' instead of 'numpy.linalg'. Imports of deeper external modules are stored separately and only added to the evaluable once a rule explicitly names such a module, e.g. 'numpy.linalg'. Modules defined by regex do not add them. This considerably reduces the size of the evaluable if many external modules are imported. Can only be specified if exclude_external_libraries is False.
+        backend: data structure the dependency graph is stored in. 'networkx' (default) stores it in a networkx graph, 'csr' stores it in compact integer arrays, which take up considerably less memory for large graphs. Rules have the same results for both backends.
+    """
+    return _create_evaluable_architecture(
+        root_path,
+        module_path,
+        exclusions=exclusions,
+        exclude_external_libraries=exclude_external_libraries,
+        level_limit=level_limit,
+        regex_exclusions=regex_exclusions,
+        external_exclusions=external_exclusions,
+        regex_external_exclusions=regex_external_exclusions,
+        cache_dir=cache_dir,
+        workers=workers,
+        scanner=scanner,
+        respect_ignore_files=respect_ignore_files,
+        max_file_size=max_file_size,
+        generated_file_marker=generated_file_marker,
+        skipped_file_imports=skipped_file_imports,
+        header_only_verification=header_only_verification,
+        source=source,
+        prefetch_bytes=prefetch_bytes,
+        executor=executor,
+        exclude_stdlib=exclude_stdlib,
+        keep_third_party=keep_third_party,
+        external_depth=external_depth,
+        backend=backend,
+    )
+
+
+def get_evaluable_architecture_for_module_objects(
+    root_module: ModuleType,
+    module: ModuleType,
+    exclusions: tuple[str, ...] = DEFAULT_EXCLUSIONS,
+    exclude_external_libraries: bool = True,
+    level_limit: int | None = None,
+    regex_exclusions: tuple[str, ...] | None = None,
+    external_exclusions: tuple[str, ...] | None = None,
+    regex_external_exclusions: tuple[str, ...] | None = None,
+    cache_dir: str | Path | None = None,
+    workers: int = 1,
+    scanner: str = AST_SCANNER,
+    respect_ignore_files: bool = False,
+    max_file_size: int | None = None,
+    generated_file_marker: str | None = None,
+    skipped_file_imports: str = SCAN_IMPORTS,
+    header_only_verification: float = 0.0,
+    source: str = SOURCE,
+    prefetch_bytes: int = 0,
+    executor: str = PROCESS_EXECUTOR,
+    exclude_stdlib: bool = False,
+    keep_third_party: tuple[str, ...] | None = None,
+    external_depth: int | None = None,
+    backend: str = NETWORKX_BACKEND,
+) -> EvaluableArchitecture:
+    """Same functionality as get_evaluable_architecture, but root module and module to evaluate are passed in as module objects
+    instead of the absolute paths to them.
+    """
+    root_path: str = os.path.dirname(root_module.__file__)  # type: ignore
+    module_path: str = os.path.dirname(module.__file__)  # type: ignore
+
+    return get_evaluable_architecture(
+        root_path,
+        module_path,
+        exclusions,
+        exclude_external_libraries,
+        level_limit,
+        regex_exclusions,
+        external_exclusions,
+        regex_external_exclusions,
+        cache_dir,
+        workers,
+        scanner,
+        respect_ignore_files,
+        max_file_size,
+        generated_file_marker,
+        skipped_file_imports,
+        header_only_verification,
+        source,
+        prefetch_bytes,
+        executor,
+        exclude_stdlib,
+        keep_third_party,
+        external_depth,
+        backend,
+    )
+
+
+def get_evaluable_architecture_for_files(
+    root_path: str | Path,
+    module_path: str | Path,
+    files: Iterable[str | Path] | str | Path,
+    base_path: str | Path | None = None,
+    exclusions: tuple[str, ...] = DEFAULT_EXCLUSIONS,
+    exclude_external_libraries: bool = True,
+    level_limit: int | None = None,
+    regex_exclusions: tuple[str, ...] | None = None,
+    external_exclusions: tuple[str, ...] | None = None,
+    regex_external_exclusions: tuple[str, ...] | None = None,
+    cache_dir: str | Path | None = None,
+    workers: int = 1,
+    scanner: str = AST_SCANNER,
+    max_file_size: int | None = None,
+    generated_file_marker: str | None = None,
+    skipped_file_imports: str = SCAN_IMPORTS,
+    header_only_verification: float = 0.0,
+    source: str = SOURCE,
+    prefetch_bytes: int = 0,
+    executor: str = PROCESS_EXECUTOR,
+    exclude_stdlib: bool = False,
+    keep_third_party: tuple[str, ...] | None = None,
+    external_depth: int | None = None,
+    backend: str = NETWORKX_BACKEND,
+) -> EvaluableArchitecture:
+    """Same functionality as get_evaluable_architecture, but instead of searching the module path for python files, only
+    the given files are taken into account. This way, the file system does not need to be walked if the files are known
+    already, e.g. to a build system or version control.
+
+    Args:
+        files: either the paths of the files or the path of a manifest file listing them, separated by null characters or line breaks, e.g. created via 'git ls-files -z > manifest'. Files outside the module path as well as files that are not python files are skipped, all other files must exist. Only directories containing at least one of the python files are added to the evaluable.
+        base_path: directory relative file paths refer to, e.g. the root of the repository if the files are listed by git. Defaults to the current working directory.
+    """
+    if isinstance(files, str | Path):
+        files = read_manifest(Path(files))
+
+    base = Path(base_path) if base_path is not None else Path.cwd()
+
+    return _create_evaluable_architecture(
+        root_path,
+        module_path,
+        exclusions=exclusions,
+        exclude_external_libraries=exclude_external_libraries,
+        level_limit=level_limit,
+        regex_exclusions=regex_exclusions,
+        external_exclusions=external_exclusions,
+        regex_external_exclusions=regex_external_exclusions,
+        cache_dir=cache_dir,
+        workers=workers,
+        scanner=scanner,
+        respect_ignore_files=False,
+        files=[base / file for file in files],
+        max_file_size=max_file_size,
+        generated_file_marker=generated_file_marker,
+        skipped_file_imports=skipped_file_imports,
+        header_only_verification=header_only_verification,
+        source=source,
+        prefetch_bytes=prefetch_bytes,
+        executor=executor,
+        exclude_stdlib=exclude_stdlib,
+        keep_third_party=keep_third_party,
+        external_depth=external_depth,
+        backend=backend,
+    )
+
+
+def get_evaluable_architecture_for_archive(
+    archive_path: str | Path,
+    root_path: str,
+    module_path: str,
+    exclusions: tuple[str, ...] = DEFAULT_EXCLUSIONS,
+    exclude_external_libraries: bool = True,
+    level_limit: int | None = None,
+    regex_exclusions: tuple[str, ...] | None = None,
+    external_exclusions: tuple[str, ...] | None = None,
+    regex_external_exclusions: tuple[str, ...] | None = None,
+    scanner: str = AST_SCANNER,
+    max_file_size: int | None = None,
+    generated_file_marker: str | None = None,
+    skipped_file_imports: str = SCAN_IMPORTS,
+    header_only_verification: float = 0.0,
+    exclude_stdlib: bool = False,
+    keep_third_party: tuple[str, ...] | None = None,
+    external_depth: int | None = None,
+    backend: str = NETWORKX_BACKEND,
+) -> EvaluableArchitecture:
+    """Same functionality as get_evaluable_architecture, but the source code is read from a zip archive, such as a wheel
+    (.whl), a zip file or a zipapp (.pyz), without extracting it.
+
+    Args:
+        archive_path: path of the archive
+        root_path: root directory of the source code within the archive, e.g. 'mypackage' for a wheel that contains the package mypackage.
+        module_path: path of the module within the archive to generate the evaluable for, e.g. 'mypackage/submodule'. Must be a submodule of the root_path module.
+        exclusions: see get_evaluable_architecture, matched against the paths of the files within the archive, e.g. 'mypackage/tests/test_a.py'.
+    """
+    archive = Path(archive_path)
+
+    if not zipfile.is_zipfile(archive):
+        raise ImproperlyConfigured(f"{archive} is not a zip archive.")
+
+    return _create_evaluable_architecture(
+        archive / root_path,
+        archive / module_path,
+        exclusions=exclusions,
+        exclude_external_libraries=exclude_external_libraries,
+        level_limit=level_limit,
+        regex_exclusions=regex_exclusions,
+        external_exclusions=external_exclusions,
+        regex_external_exclusions=regex_external_exclusions,
+        cache_dir=None,
+        workers=1,
+        scanner=scanner,
+        respect_ignore_files=False,
+        max_file_size=max_file_size,
+        generated_file_marker=generated_file_marker,
+        skipped_file_imports=skipped_file_imports,
+        header_only_verification=header_only_verification,
+        source=SOURCE,
+        prefetch_bytes=0,
+        executor=PROCESS_EXECUTOR,
+        exclude_stdlib=exclude_stdlib,
+        keep_third_party=keep_third_party,
+        external_depth=external_depth,
+        backend=backend,
+        archive=archive,
+    )
+
+
+def get_evaluable_architectures_for_git_history(
+    repository_path: str | Path,
+    root_path: str | Path,
+    module_path: str | Path,
+    revisions: str = "HEAD",
+    max_count: int | None = None,
+    exclusions: tuple[str, ...] = DEFAULT_EXCLUSIONS,
+    exclude_external_libraries: bool = True,
+    level_limit: int | None = None,
+    regex_exclusions: tuple[str, ...] | None = None,
+    external_exclusions: tuple[str, ...] | None = None,
+    regex_external_exclusions: tuple[str, ...] | None = None,
+    scanner: str = AST_SCANNER,
+    max_file_size: int | None = None,
+    generated_file_marker: str | None = None,
+    skipped_file_imports: str = SCAN_IMPORTS,
+    header_only_verification: float = 0.0,
+    exclude_stdlib: bool = False,
+    keep_third_party: tuple[str, ...] | None = None,
+    external_depth: int | None = None,
+    backend: str = NETWORKX_BACKEND,
+) -> Iterator[tuple[str, EvaluableArchitecture]]:
+    """Same functionality as get_evaluable_architecture, but an evaluable is created for each commit of a git history,
+    e.g. to track how violations of architectural rules evolved. The files are read from the git object database via
+    git, nothing is checked out. Each version of a file is only parsed once, even if it is part of many commits.
+
+    Args:
+        repository_path: path of the git repository
+        root_path: root directory of the source code, either absolute or relative to the repository path
+        module_path: path of module to generate the evaluables for, either absolute or relative to the repository path
+        revisions: commits to generate evaluables for, in the format of 'git rev-list', e.g. 'HEAD' for all commits reachable from HEAD or 'v1.0..main'
+        max_count: if not None, only the most recent max_count commits of the revisions are taken into account
+        exclusions: see get_evaluable_architecture, matched against the paths of the files relative to the top level of the repository, e.g. 'src/project/tests/test_a.py'.
+    Returns:
+        hash and evaluable of each commit, oldest commit first. The evaluables are created one after another while iterating.
+    """
+    if max_count is not None and max_count < 1:
+        raise ImproperlyConfigured("At least one commit is required.")
+
+    try:
+        repository = GitRepository(Path(repository_path))
+        commits = repository.commits(revisions, max_count)
+    except GitError as e:
+        raise ImproperlyConfigured(str(e)) from e
+
+    root = (Path(repository_path) / root_path).resolve()
+    module = (Path(repository_path) / module_path).resolve()
+
+    def create_evaluable(revision: GitRevision) -> EvaluableArchitecture:
+        return _create_evaluable_architecture(
+            root,
+            module,
+            exclusions=exclusions,
+            exclude_external_libraries=exclude_external_libraries,
+            level_limit=level_limit,
+            regex_exclusions=regex_exclusions,
+            external_exclusions=external_exclusions,
+            regex_external_exclusions=regex_external_exclusions,
+            cache_dir=None,
+            workers=1,
+            scanner=scanner,
+            respect_ignore_files=False,
+            max_file_size=max_file_size,
+            generated_file_marker=generated_file_marker,
+            skipped_file_imports=skipped_file_imports,
+            header_only_verification=header_only_verification,
+            source=SOURCE,
+            prefetch_bytes=0,
+            executor=PROCESS_EXECUTOR,
+            exclude_stdlib=exclude_stdlib,
+            keep_third_party=keep_third_party,
+            external_depth=external_depth,
+            backend=backend,
+            revision=revision,
+        )
+
+    return _create_evaluable_architectures_for_commits(
+        repository, commits, create_evaluable
+    )
+
+
+def get_evaluable_architecture_from_runtime(
+    root_package: ModuleType | str,
+    module: ModuleType | str | None = None,
+    exclusions: tuple[str, ...] = DEFAULT_EXCLUSIONS,
+    exclude_external_libraries: bool = True,
+    level_limit: int | None = None,
+    regex_exclusions: tuple[str, ...] | None = None,
+    external_exclusions: tuple[str, ...] | None = None,
+    regex_external_exclusions: tuple[str, ...] | None = None,
+    exclude_stdlib: bool = False,
+    keep_third_party: tuple[str, ...] | None = None,
+    external_depth: int | None = None,
+    backend: str = NETWORKX_BACKEND,
+) -> EvaluableArchitecture:
+    """Same functionality as get_evaluable_architecture_for_module_objects, but the evaluable is created from the modules
+    that have already been imported by the running interpreter instead of parsing all source files, e.g. to check the
+    architecture within a test session in which the application is imported anyway.
+
+    Only modules in sys.modules are part of the evaluable; modules that have never been imported are missing. The imports
+    of each module are found in its source code as cached by linecache, so no file is read again. Modules whose source
+    code is not cached are part of the evaluable without imports and are listed in the skipped files of the build
+    statistics.
+
+    Args:
+        root_package: imported root package of the source code, or its name
+        module: imported module to generate the evaluable for, or its name. Defaults to the root package.
+        exclusions: see get_evaluable_architecture, matched against the paths of the files and package directories of the modules.
     """
+    root = _get_imported_module(root_package)
+    module_object = root if module is None else _get_imported_module(module)
+
+    if not hasattr(root, "__path__"):
+        raise ImproperlyConfigured(f"{root.__name__} is not a package.")
+
+    if (
+        module_object.__name__ != root.__name__
+        and not module_object.__name__.startswith(root.__name__ + ".")
+    ):
+        raise ImproperlyConfigured(
+            f"{module_object.__name__} is not a submodule of {root.__name__}."
+        )
+
+    root_path = _get_module_path(root)
+    module_path = root_path.joinpath(
+        *module_object.__name__.split(".")[len(root.__name__.split(".")) :]
+    )
+
+    return _create_evaluable_architecture(
+        root_path,
+        module_path,
+        exclusions=exclusions,
+        exclude_external_libraries=exclude_external_libraries,
+        level_limit=level_limit,
+        regex_exclusions=regex_exclusions,
+        external_exclusions=external_exclusions,
+        regex_external_exclusions=regex_external_exclusions,
+        cache_dir=None,
+        workers=1,
+        scanner=AST_SCANNER,
+        respect_ignore_files=False,
+        max_file_size=None,
+        generated_file_marker=None,
+        skipped_file_imports=SCAN_IMPORTS,
+        header_only_verification=0.0,
+        source=SOURCE,
+        prefetch_bytes=0,
+        executor=PROCESS_EXECUTOR,
+        exclude_stdlib=exclude_stdlib,
+        keep_third_party=keep_third_party,
+        external_depth=external_depth,
+        backend=backend,
+        runtime_module=module_object.__name__,
+    )
+
+
+def add_recorded_imports(
+    evaluable: EvaluableArchitecture, recording_path: str | Path
+) -> EvaluableArchitecture:
+    """Returns a copy of the evaluable that additionally contains the imports recorded by an ImportRecorder, e.g. imports
+    via importlib.import_module that cannot be found in the source code. These imports are marked as dynamic imports.
+    Recorded imports between modules that are not part of the evaluable are ignored; since modules are recorded by
+    their names, the names of the modules in the evaluable have to match the names they are imported by.
+
+    Args:
+        evaluable: evaluable created by one of the other entry points
+        recording_path: file written by an ImportRecorder
+    """
+    if not isinstance(evaluable, EvaluableArchitectureGraph):
+        raise ImproperlyConfigured(
+            "Recorded imports can only be added to graph-based evaluables."
+        )
+
+    return evaluable.with_dynamic_imports(
+        AbsoluteImport(importer, importee)
+        for importer, importee in read_recorded_imports(Path(recording_path))
+    )
+
+
+def _get_imported_module(module: ModuleType | str) -> ModuleType:
+    if isinstance(module, ModuleType):
+        return module
+
+    if module not in sys.modules:
+        raise ImproperlyConfigured(f"Module {module} has not been imported.")
+
+    return sys.modules[module]
+
+
+def _get_module_path(package: ModuleType) -> Path:
+    """Returns the directory of the package, or the first one for namespace packages spanning multiple directories."""
+    file = getattr(package, "__file__", None)
+
+    if file is not None:
+        return Path(file).parent
+
+    return Path(next(iter(package.__path__)))
+
+
+def _create_evaluable_architectures_for_commits(
+    repository: GitRepository,
+    commits: list[str],
+    create_evaluable: Callable[[GitRevision], EvaluableArchitecture],
+) -> Iterator[tuple[str, EvaluableArchitecture]]:
+    # shared by all revisions, so that unchanged files are only parsed once
+    parsed_blobs: dict[str, ExtractedImports] = {}
+
+    for commit in commits:
+        # the 'git cat-file' process is stopped before the evaluable is handed out, so that no process is left running
+        # if the caller stops iterating early
+        with repository:
+            evaluable = create_evaluable(GitRevision(repository, commit, parsed_blobs))
+
+        yield commit, evaluable
+
+
+def _create_evaluable_architecture(
+    root_path: str | Path,
+    module_path: str | Path,
+    *,
+    exclusions: tuple[str, ...],
+    exclude_external_libraries: bool,
+    level_limit: int | None,
+    regex_exclusions: tuple[str, ...] | None,
+    external_exclusions: tuple[str, ...] | None,
+    regex_external_exclusions: tuple[str, ...] | None,
+    cache_dir: str | Path | None,
+    workers: int,
+    scanner: str,
+    respect_ignore_files: bool,
+    files: list[Path] | None = None,
+    max_file_size: int | None,
+    generated_file_marker: str | None,
+    skipped_file_imports: str,
+    header_only_verification: float,
+    source: str,
+    prefetch_bytes: int,
+    executor: str,
+    exclude_stdlib: bool,
+    keep_third_party: tuple[str, ...] | None,
+    external_depth: int | None,
+    backend: str,
+    archive: Path | None = None,
+    revision: GitRevision | None = None,
+    runtime_module: str | None = None,
+) -> EvaluableArchitecture:
     if regex_exclusions and exclusions:
         raise ImproperlyConfigured(
             "Partial match exclusions and regex exclusions cannot both be specified."
@@ -64,6 +591,78 @@ def get_evaluable_architecture(
             "If external libraries are excluded, no exclusion patterns can be defined for them."
         )
 
+    if exclude_external_libraries and (exclude_stdlib or keep_third_party is not None):
+        raise ImproperlyConfigured(
+            "If external libraries are excluded, the standard library and third-party libraries cannot be excluded separately."
+        )
+
+    if exclude_external_libraries and external_depth is not None:
+        raise ImproperlyConfigured(
+            "If external libraries are excluded, their depth cannot be limited."
+        )
+
+    if external_depth is not None and external_depth < 1:
+        raise ImproperlyConfigured(
+            "The depth of external modules has to be at least 1."
+        )
+
+    if workers < 1:
+        raise ImproperlyConfigured("At least one worker is required.")
+
+    if scanner not in SCANNERS:
+        raise ImproperlyConfigured(
+            f"Unknown scanner {scanner}, expected one of: {', '.join(SCANNERS)}."
+        )
+
+    if not 0 <= header_only_verification <= 1:
+        raise ImproperlyConfigured(
+            "The fraction of verified header scans has to be between 0 and 1."
+        )
+
+    if header_only_verification and scanner != HEADER_ONLY_SCANNER:
+        raise ImproperlyConfigured(
+            f"Header scans can only be verified if the {HEADER_ONLY_SCANNER} scanner is used."
+        )
+
+    if source not in SOURCE_KINDS:
+        raise ImproperlyConfigured(
+            f"Unknown source {source}, expected one of: {', '.join(SOURCE_KINDS)}."
+        )
+
+    if backend not in GRAPH_BACKENDS:
+        raise ImproperlyConfigured(
+            f"Unknown backend {backend}, expected one of: {', '.join(GRAPH_BACKENDS)}."
+        )
+
+    if executor not in EXECUTORS:
+        raise ImproperlyConfigured(
+            f"Unknown executor {executor}, expected one of: {', '.join(EXECUTORS)}."
+        )
+
+    if prefetch_bytes < 0:
+        raise ImproperlyConfigured("The prefetch byte budget cannot be negative.")
+
+    if prefetch_bytes and workers > 1:
+        raise ImproperlyConfigured(
+            "Files can only be prefetched if they are parsed in the current process, i.e. with a single worker."
+        )
+
+    if max_file_size is not None and max_file_size < 0:
+        raise ImproperlyConfigured("The maximum file size cannot be negative.")
+
+    if generated_file_marker is not None:
+        try:
+            re.compile(generated_file_marker)
+        except re.error as e:
+            raise ImproperlyConfigured(
+                f"Invalid generated file marker {generated_file_marker}: {e}"
+            ) from e
+
+    if skipped_file_imports not in SKIPPED_FILE_IMPORTS:
+        raise ImproperlyConfigured(
+            f"Unknown handling of skipped file imports {skipped_file_imports}, expected one of: {', '.join(SKIPPED_FILE_IMPORTS)}."
+        )
+
     if exclusions:
         regex_exclusions = tuple(
             convert_partial_match_to_regex(pattern) for pattern in exclusions
@@ -89,32 +688,23 @@ def get_evaluable_architecture(
         exclude_external_libraries,
         level_limit,
         regex_external_exclusions,
-    )
-
-
-def get_evaluable_architecture_for_module_objects(
-    root_module: ModuleType,
-    module: ModuleType,
-    exclusions: tuple[str, ...] = DEFAULT_EXCLUSIONS,
-    exclude_external_libraries: bool = True,
-    level_limit: int | None = None,
-    regex_exclusions: tuple[str, ...] | None = None,
-    external_exclusions: tuple[str, ...] | None = None,
-    regex_external_exclusions: tuple[str, ...] | None = None,
-) -> EvaluableArchitecture:
-    """Same functionality as get_evaluable_architecture, but root module and module to evaluate are passed in as module objects
-    instead of the absolute paths to them.
-    """
-    root_path: str = os.path.dirname(root_module.__file__)  # type: ignore
-    module_path: str = os.path.dirname(module.__file__)  # type: ignore
-
-    return get_evaluable_architecture(
-        root_path,
-        module_path,
-        exclusions,
-        exclude_external_libraries,
-        level_limit,
-        regex_exclusions,
-        external_exclusions,
-        regex_external_exclusions,
+        cache_dir=Path(cache_dir) if cache_dir is not None else None,
+        workers=workers,
+        scanner=scanner,
+        respect_ignore_files=respect_ignore_files,
+        files=files,
+        max_file_size=max_file_size,
+        generated_file_marker=generated_file_marker,
+        skipped_file_imports=skipped_file_imports,
+        header_only_verification=header_only_verification,
+        source=source,
+        archive=archive,
+        revision=revision,
+        runtime_module=runtime_module,
+        prefetch_bytes=prefetch_bytes,
+        executor=executor,
+        exclude_stdlib=exclude_stdlib,
+        keep_third_party=keep_third_party,
+        external_depth=external_depth,
+        backend=backend,
     )
@@ -11,7 +11,9 @@ from pytestarch.eval_structure.evaluable_architecture import (
     ModuleGroup,
     NotExplicitlyRequestedDependenciesByBaseModule,
 )
+from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
 from pytestarch.eval_structure.module_name_converter import ModuleNameConverter
+from pytestarch.eval_structure.subtree_index import SubtreeIndex
 from pytestarch.rule_assessment.error_message.message_generator import (
     LayerRuleViolationMessageGenerator,
     RuleViolationMessageBaseGenerator,
@@ -71,7 +73,7 @@ class RuleMatcher(ABC):
         regex_conversion_mapping = self._create_module_name_regex_conversion_mapping()
 
         return self._get_rule_violation_detector(
-            regex_conversion_mapping
+            regex_conversion_mapping, evaluable
         ).get_rule_violation(
             explicitly_requested_dependencies,
             not_explicitly_requested_dependencies,
@@ -79,7 +81,9 @@ class RuleMatcher(ABC):
 
     @abstractmethod
     def _get_rule_violation_detector(
-        self, module_name_conversion_mapping: dict[str, list[Module]]
+        self,
+        module_name_conversion_mapping: dict[str, list[Module]],
+        evaluable: EvaluableArchitecture,
     ) -> RuleViolationBaseDetector:
         pass
 
@@ -172,7 +176,7 @@ class DefaultRuleMatcher(RuleMatcher):
     """To be used for rules that operate on modules, such as "module X should not import module Y."""
 
     def _get_rule_violation_detector(
-        self, _: dict[str, list[Module]]
+        self, _: dict[str, list[Module]], __: EvaluableArchitecture
     ) -> RuleViolationBaseDetector:
         return RuleViolationDetector(
             self._updated_module_requirement, self._behavior_requirement
@@ -203,10 +207,15 @@ class LayerRuleMatcher(RuleMatcher):
         self._layer_mapping = layer_mapping
 
     def _get_rule_violation_detector(
-        self, module_name_conversion_mapping: dict[str, list[Module]]
+        self,
+        module_name_conversion_mapping: dict[str, list[Module]],
+        evaluable: EvaluableArchitecture,
     ) -> RuleViolationBaseDetector:
         self._updated_layer_mapping = self._update_layer_mapping(
-            self._layer_mapping, module_name_conversion_mapping
+            self._layer_mapping,
+            module_name_conversion_mapping,
+            evaluable.subtree_index(),
+            evaluable.module_hierarchy(),
         )
         return LayerRuleViolationDetector(
             self._updated_module_requirement,
@@ -227,6 +236,8 @@ class LayerRuleMatcher(RuleMatcher):
         cls,
         layer_mapping: LayerMapping,
         module_name_conversion_mapping: dict[str, list[Module]],
+        subtree_index: SubtreeIndex,
+        module_hierarchy: ModuleHierarchy,
     ) -> LayerMapping:
         return LayerMapping(
             {
@@ -234,7 +245,9 @@ class LayerRuleMatcher(RuleMatcher):
                     layer, layer_mapping, module_name_conversion_mapping
                 )
                 for layer in layer_mapping.all_layers
-            }
+            },
+            subtree_index,
+            module_hierarchy,
         )
 
     @classmethod
@@ -6,6 +6,10 @@ from pathlib import Path
 import pytest
 
 from pytestarch import EvaluableArchitecture
+from pytestarch.eval_structure_generation.graph_generation.graph_generator import (
+    CSR_BACKEND,
+    NETWORKX_BACKEND,
+)
 from pytestarch.pytestarch import (
     get_evaluable_architecture,
     get_evaluable_architecture_for_module_objects,
@@ -16,12 +20,15 @@ from resources.test_project import src
 ROOT_DIR = Path(__file__).parent.parent.resolve()
 
 
-@pytest.fixture(scope="session")
-def graph_based_on_string_module_names() -> EvaluableArchitecture:
+@pytest.fixture(scope="session", params=[NETWORKX_BACKEND, CSR_BACKEND])
+def graph_based_on_string_module_names(
+    request: pytest.FixtureRequest,
+) -> EvaluableArchitecture:
     return get_evaluable_architecture(
         os.path.dirname(src.__file__),
         os.path.dirname(src.__file__),
         ("*__pycache__", "*__init__.py", "*Test.py"),
+        backend=request.param,
     )
 
 
@@ -43,13 +50,24 @@ def graph_with_identical_source_and_module_path() -> EvaluableArchitecture:
     )
 
 
-@pytest.fixture(scope="session")
-def graph_with_level_limit_1() -> EvaluableArchitecture:
+@pytest.fixture(scope="session", params=[NETWORKX_BACKEND, CSR_BACKEND])
+def graph_with_level_limit_1(request: pytest.FixtureRequest) -> EvaluableArchitecture:
     return get_evaluable_architecture(
         os.path.dirname(src.__file__),
         os.path.dirname(src.__file__),
         ("*__pycache__", "*__init__.py", "*Test.py"),
         level_limit=1,
+        backend=request.param,
+    )
+
+
+@pytest.fixture(scope="session")
+def graph_parsed_with_multiple_workers() -> EvaluableArchitecture:
+    return get_evaluable_architecture(
+        os.path.dirname(src.__file__),
+        os.path.dirname(src.__file__),
+        ("*__pycache__", "*__init__.py", "*Test.py"),
+        workers=2,
     )
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 
+from pytestarch.eval_structure.csr_graph import CsrGraph
 from pytestarch.eval_structure.evaluable_architecture import Module, ModuleNameFilter
 from pytestarch.eval_structure.evaluable_graph import EvaluableArchitectureGraph
 from pytestarch.eval_structure.networkxgraph import NetworkxGraph
@@ -34,8 +35,11 @@ MODULE_E = "E"
 MODULE_F = "E.F"  # submodule of E
 
 
-@pytest.fixture(scope="session")
-def evaluable() -> EvaluableArchitectureGraph:
+GRAPH_TYPES = [NetworkxGraph, CsrGraph]
+
+
+@pytest.fixture(scope="session", params=GRAPH_TYPES)
+def evaluable(request: pytest.FixtureRequest) -> EvaluableArchitectureGraph:
     all_modules = [MODULE_1, MODULE_2, MODULE_3, MODULE_4, SUB_MODULE_OF_2, MODULE_6]
     imports = [
         AbsoluteImport(MODULE_1, MODULE_2),
@@ -46,11 +50,11 @@ def evaluable() -> EvaluableArchitectureGraph:
         AbsoluteImport(MODULE_3, MODULE_6),
     ]
 
-    return EvaluableArchitectureGraph(NetworkxGraph(all_modules, imports))
+    return EvaluableArchitectureGraph(request.param(all_modules, imports))
 
 
-@pytest.fixture(scope="session")
-def submodule_evaluable() -> EvaluableArchitectureGraph:
+@pytest.fixture(scope="session", params=GRAPH_TYPES)
+def submodule_evaluable(request: pytest.FixtureRequest) -> EvaluableArchitectureGraph:
     all_modules = [MODULE_A, MODULE_B, MODULE_C, MODULE_D, MODULE_E, MODULE_F]
     imports = [
         AbsoluteImport(MODULE_F, MODULE_C),
@@ -58,4 +62,4 @@ def submodule_evaluable() -> EvaluableArchitectureGraph:
         AbsoluteImport(MODULE_C, MODULE_B),
     ]
 
-    return EvaluableArchitectureGraph(NetworkxGraph(all_modules, imports))
+    return EvaluableArchitectureGraph(request.param(all_modules, imports))
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import pytest
+
+from pytestarch.eval_structure.collapsed_imports import CollapsedImports
+from pytestarch.eval_structure.csr_graph import CsrGraph
+from pytestarch.eval_structure.evaluable_architecture import Module, ModuleNameFilter
+from pytestarch.eval_structure.evaluable_graph import EvaluableArchitectureGraph
+from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
+from pytestarch.eval_structure.networkxgraph import NetworkxGraph
+from pytestarch.eval_structure.types import (
+    LOCAL_IMPORT,
+    RUNTIME_IMPORT,
+    TYPE_CHECKING_IMPORT,
+)
+from pytestarch.eval_structure_generation.file_import.import_types import (
+    AbsoluteImport,
+)
+
+
+@pytest.mark.parametrize(
+    "depth, importee, expected",
+    [
+        (1, "numpy", "numpy"),
+        (1, "numpy.linalg", "numpy"),
+        (1, "numpy.linalg.lapack", "numpy"),
+        (2, "numpy", "numpy"),
+        (2, "numpy.linalg", "numpy.linalg"),
+        (2, "numpy.linalg.lapack", "numpy.linalg"),
+    ],
+)
+def test_imports_are_collapsed_to_configured_depth(
+    depth: int, importee: str, expected: str
+) -> None:
+    collapsed_imports = CollapsedImports(depth, ModuleHierarchy())
+
+    assert collapsed_imports.collapse("a", importee) == expected
+    assert collapsed_imports.collapsed_module(importee) == expected
+
+
+def test_collapsed_imports_of_module_and_submodules_are_expanded() -> None:
+    collapsed_imports = CollapsedImports(1, ModuleHierarchy())
+    collapsed_imports.collapse("a", "numpy")
+    collapsed_imports.collapse("a", "numpy.linalg")
+    collapsed_imports.collapse("b", "numpy.linalg.lapack", LOCAL_IMPORT)
+    collapsed_imports.collapse("b", "numpy.fft")
+    collapsed_imports.collapse("c", "scipy.linalg")
+
+    assert list(collapsed_imports.expand("numpy.linalg")) == [
+        ("a", "numpy.linalg", RUNTIME_IMPORT),
+        ("b", "numpy.linalg.lapack", LOCAL_IMPORT),
+    ]
+    assert list(collapsed_imports.expand("numpy.fft")) == [
+        ("b", "numpy.fft", RUNTIME_IMPORT)
+    ]
+    assert list(collapsed_imports.expand("numpy")) == []
+    assert list(collapsed_imports.expand("pandas.io")) == []
+
+
+def test_collapsed_module_does_not_store_import() -> None:
+    collapsed_imports = CollapsedImports(1, ModuleHierarchy())
+
+    collapsed_imports.collapsed_module("numpy.linalg")
+
+    assert list(collapsed_imports.expand("numpy.linalg")) == []
+
+
+def test_graph_is_expanded_by_collapsed_imports() -> None:
+    hierarchy = ModuleHierarchy()
+    collapsed_imports = CollapsedImports(1, hierarchy)
+    imports = [
+        AbsoluteImport("a", collapsed_imports.collapse("a", "numpy.linalg.lapack"))
+    ]
+
+    graph = NetworkxGraph(["a", "numpy"], imports, None, hierarchy, collapsed_imports)
+    expanded_graph = graph.with_expanded_modules(["numpy.linalg"])
+
+    assert "numpy.linalg" in expanded_graph
+    assert "numpy.linalg.lapack" in expanded_graph
+    assert sorted(expanded_graph.direct_successor_nodes("a")) == [
+        "numpy",
+        "numpy.linalg.lapack",
+    ]
+    assert "numpy.linalg" not in graph
+    assert graph.direct_successor_nodes("a") == ["numpy"]
+
+
+def test_graph_is_not_expanded_if_no_module_was_collapsed() -> None:
+    hierarchy = ModuleHierarchy()
+    collapsed_imports = CollapsedImports(1, hierarchy)
+    imports = [AbsoluteImport("a", collapsed_imports.collapse("a", "numpy"))]
+
+    graph = NetworkxGraph(["a", "numpy"], imports, None, hierarchy, collapsed_imports)
+
+    assert graph.with_expanded_modules(["a", "numpy", "numpy.linalg"]) is graph
+
+
+@pytest.mark.parametrize("graph_class", [NetworkxGraph, CsrGraph])
+def test_view_hides_expanded_imports_of_excluded_kinds(
+    graph_class: type[NetworkxGraph] | type[CsrGraph],
+) -> None:
+    hierarchy = ModuleHierarchy()
+    collapsed_imports = CollapsedImports(1, hierarchy)
+    imports = [
+        AbsoluteImport(
+            "a",
+            collapsed_imports.collapse("a", "numpy.linalg", TYPE_CHECKING_IMPORT),
+            TYPE_CHECKING_IMPORT,
+        ),
+        AbsoluteImport("b", collapsed_imports.collapse("b", "numpy.linalg")),
+    ]
+    evaluable = EvaluableArchitectureGraph(
+        graph_class(["a", "b", "numpy"], imports, None, hierarchy, collapsed_imports)
+    )
+    runtime_view = evaluable.view(runtime_only=True)
+    importers = [ModuleNameFilter(name="a"), ModuleNameFilter(name="b")]
+
+    for importee in ["numpy.linalg", "numpy"]:
+        dependencies = runtime_view.get_dependencies(
+            importers, [ModuleNameFilter(name=importee)]
+        )
+
+        assert not dependencies[(Module("a"), Module(importee))]
+        assert dependencies[(Module("b"), Module(importee))]
+
+    dependencies = evaluable.get_dependencies(
+        importers, [ModuleNameFilter(name="numpy.linalg")]
+    )
+
+    assert dependencies[(Module("a"), Module("numpy.linalg"))]
+
+
+@pytest.mark.parametrize("graph_class", [NetworkxGraph, CsrGraph])
+def test_results_do_not_depend_on_modules_named_by_previous_queries(
+    graph_class: type[NetworkxGraph] | type[CsrGraph],
+) -> None:
+    hierarchy = ModuleHierarchy()
+    collapsed_imports = CollapsedImports(1, hierarchy)
+    imports = [
+        AbsoluteImport("a", collapsed_imports.collapse("a", "numpy.linalg")),
+        AbsoluteImport("b", collapsed_imports.collapse("b", "numpy.fft")),
+    ]
+    evaluable = EvaluableArchitectureGraph(
+        graph_class(["a", "b", "numpy"], imports, None, hierarchy, collapsed_imports)
+    )
+    importers = [ModuleNameFilter(name="a"), ModuleNameFilter(name="b")]
+    numpy = [ModuleNameFilter(name="numpy")]
+
+    dependencies_before = evaluable.get_dependencies(importers, numpy)
+    expanded_dependencies = evaluable.get_dependencies(
+        importers, [ModuleNameFilter(name="numpy.linalg")]
+    )
+    dependencies_after = evaluable.get_dependencies(importers, numpy)
+
+    assert expanded_dependencies[(Module("a"), Module("numpy.linalg"))]
+    assert dependencies_after == dependencies_before
+    assert evaluable.modules == ["a", "b", "numpy"]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pytestarch.eval_structure.collapsed_imports import CollapsedImports
+from pytestarch.eval_structure.csr_graph import CsrGraph
+from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
+from pytestarch.eval_structure.networkxgraph import NetworkxGraph
+from pytestarch.eval_structure.types import (
+    GUARDED_IMPORT,
+    LOCAL_IMPORT,
+    TYPE_CHECKING_IMPORT,
+    Import,
+)
+from pytestarch.eval_structure_generation.file_import.import_types import AbsoluteImport
+from pytestarch.pytestarch import get_evaluable_architecture
+from pytestarch.query_language.exceptions import ImproperlyConfigured
+
+RESOURCES_DIR = Path(__file__).parent.parent / "resources"
+
+MODULES = ["a", "a.b", "a.b.c", "a.d", "e", "e.f"]
+IMPORTS = [
+    AbsoluteImport("a.b.c", "e.f"),
+    AbsoluteImport("a.b.c", "e.f", LOCAL_IMPORT),
+    AbsoluteImport("a.d", "a.b", TYPE_CHECKING_IMPORT),
+    AbsoluteImport("e.f", "a.b.c", GUARDED_IMPORT),
+    AbsoluteImport("e", "a.d"),
+    # import of a child module by its parent module
+    AbsoluteImport("a.b", "a.b.c"),
+    AbsoluteImport("a.b.c", "unknown.module"),
+]
+
+
+def _assert_same_graph(csr_graph: CsrGraph, networkx_graph: NetworkxGraph) -> None:
+    assert csr_graph.nodes == networkx_graph.nodes
+    assert set(csr_graph.edges) == set(networkx_graph.edges)
+
+    for node in networkx_graph.nodes:
+        successors = networkx_graph.direct_successor_nodes(node)
+        predecessors = networkx_graph.direct_predecessor_nodes(node)
+
+        assert csr_graph.direct_successor_nodes(node) == successors
+        assert csr_graph.direct_predecessor_nodes(node) == predecessors
+        assert csr_graph.hierarchy_children(node) == (
+            networkx_graph.hierarchy_children(node)
+        )
+        assert csr_graph.import_successors(node) == (
+            networkx_graph.import_successors(node)
+        )
+        assert csr_graph.import_predecessors(node) == (
+            networkx_graph.import_predecessors(node)
+        )
+        assert csr_graph.subtree_index().submodules(node) == (
+            networkx_graph.subtree_index().submodules(node)
+        )
+
+        for successor in successors:
+            assert csr_graph.parent_child_relationship(
+                node, successor
+            ) == networkx_graph.parent_child_relationship(node, successor)
+
+
+def _build(imports: list[Import], level_limit: int | None = None) -> tuple:
+    return (
+        CsrGraph(MODULES, imports, level_limit),
+        NetworkxGraph(MODULES, imports, level_limit),
+    )
+
+
+@pytest.mark.parametrize("level_limit", [None, 0, 1])
+def test_graph_equals_networkx_graph(level_limit: int | None) -> None:
+    _assert_same_graph(*_build(IMPORTS, level_limit))
+
+
+@pytest.mark.parametrize(
+    "excluded_kinds", [TYPE_CHECKING_IMPORT, LOCAL_IMPORT | GUARDED_IMPORT]
+)
+def test_view_equals_networkx_view(excluded_kinds: int) -> None:
+    csr_graph, networkx_graph = _build(IMPORTS)
+
+    _assert_same_graph(
+        csr_graph.view(excluded_kinds), networkx_graph.view(excluded_kinds)
+    )
+    _assert_same_graph(csr_graph, networkx_graph)
+
+
+def test_view_shares_arrays_with_graph() -> None:
+    csr_graph = CsrGraph(MODULES, IMPORTS)
+
+    view = csr_graph.view(TYPE_CHECKING_IMPORT)
+
+    assert view._imports is csr_graph._imports
+
+
+def test_graph_with_dynamic_imports_equals_networkx_graph() -> None:
+    csr_graph, networkx_graph = _build(IMPORTS)
+    dynamic_imports = [AbsoluteImport("a.d", "e"), AbsoluteImport("a.b.c", "e.f")]
+
+    csr_graph_with_dynamic_imports = csr_graph.with_dynamic_imports(dynamic_imports)
+
+    _assert_same_graph(
+        csr_graph_with_dynamic_imports,
+        networkx_graph.with_dynamic_imports(dynamic_imports),
+    )
+    assert csr_graph_with_dynamic_imports.is_dynamic("a.d", "e")
+    assert not csr_graph_with_dynamic_imports.is_dynamic("a.b.c", "e.f")
+    assert "e" not in csr_graph.direct_successor_nodes("a.d")
+
+
+def test_expanded_graph_equals_networkx_graph() -> None:
+    hierarchy = ModuleHierarchy()
+    graphs = []
+
+    for graph_type in (CsrGraph, NetworkxGraph):
+        collapsed_imports = CollapsedImports(1, hierarchy)
+        imports = [
+            AbsoluteImport(
+                "a.b", collapsed_imports.collapse("a.b", "ext.x.y", LOCAL_IMPORT)
+            )
+        ]
+        graph = graph_type(
+            ["a", "a.b", "ext"], imports, None, hierarchy, collapsed_imports
+        )
+        graphs.append(graph.with_expanded_modules(["ext.x"]))
+        assert "ext.x" not in graph
+
+    _assert_same_graph(*graphs)
+    assert "ext.x.y" in graphs[0]
+
+
+def test_paths_are_found() -> None:
+    csr_graph = CsrGraph(MODULES, IMPORTS)
+
+    assert "a.b.c" in csr_graph
+    assert ("a", "e.f") in csr_graph
+    assert ("a.d", "e") not in csr_graph
+    assert ("a.d", "a.b") in csr_graph
+    assert ("a.d", "a.b") not in csr_graph.view(TYPE_CHECKING_IMPORT)
+
+
+@pytest.mark.parametrize("graph_type", [CsrGraph, NetworkxGraph])
+@pytest.mark.parametrize("item", [1, ("a",), ("a", "e", "e.f"), ("a", 1)])
+def test_malformed_items_raise_error(
+    graph_type: type[CsrGraph] | type[NetworkxGraph], item: object
+) -> None:
+    graph = graph_type(MODULES, IMPORTS)
+
+    with pytest.raises(TypeError):
+        item in graph
+
+
+@pytest.mark.parametrize("project", ["test_project", "flat_test_project_1"])
+def test_evaluable_equals_networkx_evaluable(project: str) -> None:
+    path = RESOURCES_DIR / project
+
+    csr_evaluable = get_evaluable_architecture(
+        path, path, exclude_external_libraries=False, backend="csr"
+    )
+    networkx_evaluable = get_evaluable_architecture(
+        path, path, exclude_external_libraries=False
+    )
+
+    _assert_same_graph(csr_evaluable._graph, networkx_evaluable._graph)  # type: ignore
+
+
+def test_unknown_backend_raises_error() -> None:
+    with pytest.raises(ImproperlyConfigured, match="Unknown backend"):
+        get_evaluable_architecture(
+            RESOURCES_DIR, RESOURCES_DIR / "test_project", backend="igraph"
+        )
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import pytest
+
+from pytestarch.eval_structure.evaluable_architecture import (
+    LayerMapping,
+    ModuleNameFilter,
+)
+from pytestarch.eval_structure.evaluable_graph import EvaluableArchitectureGraph
+from pytestarch.eval_structure.exceptions import LayerMismatch
+from pytestarch.eval_structure.module_hierarchy import NO_PARENT, ModuleHierarchy
+from pytestarch.eval_structure.networkxgraph import NetworkxGraph
+from pytestarch.eval_structure.types import get_parent_modules
+
+
+def test_parent_modules_are_added_before_module() -> None:
+    hierarchy = ModuleHierarchy()
+
+    module_id = hierarchy.id("a.b.c")
+
+    assert len(hierarchy) == 3
+    assert [hierarchy.name(i) for i in range(3)] == ["a", "a.b", "a.b.c"]
+    assert hierarchy.parent(module_id) == hierarchy.id("a.b")
+    assert hierarchy.parent(hierarchy.id("a")) == NO_PARENT
+    assert hierarchy.depth(module_id) == 2
+
+
+def test_each_module_is_added_once() -> None:
+    hierarchy = ModuleHierarchy()
+
+    hierarchy.id("a.b.c")
+    hierarchy.id("a.b.d")
+    hierarchy.id("a.b")
+
+    assert len(hierarchy) == 4
+
+
+@pytest.mark.parametrize("module", ["a", "a.b", "a.b.c.d", "a.b.c.d.e"])
+def test_parent_modules_equal_calculated_parent_modules(module: str) -> None:
+    hierarchy = ModuleHierarchy()
+
+    assert hierarchy.parent_modules(module) == get_parent_modules(module)
+    assert list(hierarchy.ancestors(module)) == get_parent_modules(module)[::-1]
+
+
+def test_ancestors_are_interned_names() -> None:
+    hierarchy = ModuleHierarchy()
+    hierarchy.id("a.b")
+
+    assert next(hierarchy.ancestors("a.b.c")) is hierarchy.name(hierarchy.id("a.b"))
+    assert hierarchy.intern("".join(["a", ".b"])) is hierarchy.name(1)
+
+
+@pytest.mark.parametrize(
+    "module, depth, expected",
+    [("a.b.c", 0, "a"), ("a.b.c", 1, "a.b"), ("a.b.c", 2, "a.b.c"), ("a", 3, "a")],
+)
+def test_ancestor_at_depth(module: str, depth: int, expected: str) -> None:
+    assert ModuleHierarchy().ancestor_at_depth(module, depth) == expected
+
+
+def test_layer_of_module_is_found_via_parent_modules() -> None:
+    layer_mapping = LayerMapping(
+        {"L1": [ModuleNameFilter("a.b")], "L2": [ModuleNameFilter("a.c")]}
+    )
+
+    assert layer_mapping.get_layer_for_module_name("a.b") == "L1"
+    assert layer_mapping.get_layer_for_module_name("a.b.x.y") == "L1"
+    assert layer_mapping.get_layer_for_module_name("a.c.x") == "L2"
+    assert layer_mapping.get_layer_for_module_name("a") is None
+
+
+@pytest.mark.parametrize("with_subtree_index", [False, True])
+@pytest.mark.parametrize(
+    "module, expected_layer",
+    [("a.b", "L1"), ("a.b.c", "L1"), ("a.bc", None), ("a.bc.d", None), ("a.b_", None)],
+)
+def test_module_whose_name_only_starts_with_name_of_layer_module_is_not_in_layer(
+    with_subtree_index: bool, module: str, expected_layer: str | None
+) -> None:
+    graph = NetworkxGraph(["a", "a.b", "a.b.c", "a.bc", "a.bc.d", "a.b_"], [])
+    layer_mapping = LayerMapping(
+        {"L1": [ModuleNameFilter("a.b")]},
+        graph.subtree_index() if with_subtree_index else None,
+    )
+
+    assert layer_mapping.get_layer_for_module_name(module) == expected_layer
+
+
+def test_parent_modules_of_layer_lookups_are_added_to_given_table() -> None:
+    hierarchy = ModuleHierarchy()
+    hierarchy.id("a.b.c")
+    layer_mapping = LayerMapping(
+        {"L1": [ModuleNameFilter("a.b")]}, module_hierarchy=hierarchy
+    )
+
+    assert layer_mapping.get_layer_for_module_name("a.b.c") == "L1"
+    assert layer_mapping.get_layer_for_module_name("a.d.e") is None
+    assert len(hierarchy) == 5
+    assert "a.d" in hierarchy
+
+
+def test_evaluable_shares_table_of_module_names_with_its_graph() -> None:
+    hierarchy = ModuleHierarchy()
+    evaluable = EvaluableArchitectureGraph(
+        NetworkxGraph(["a", "a.b"], [], module_hierarchy=hierarchy)
+    )
+
+    assert evaluable.module_hierarchy() is hierarchy
+    assert evaluable.view(runtime_only=True).module_hierarchy() is hierarchy
+
+
+def test_modules_with_parent_modules_in_multiple_layers_raise_error() -> None:
+    layer_mapping = LayerMapping(
+        {"L1": [ModuleNameFilter("a")], "L2": [ModuleNameFilter("a.b")]}
+    )
+
+    with pytest.raises(LayerMismatch):
+        layer_mapping.get_layer_for_module_name("a.b.c")
+
+
+def test_layer_of_module_is_found_via_subtree_index() -> None:
+    graph = NetworkxGraph(["a", "a.b", "a.b.x", "a.b.x.y", "a.bc", "a.c", "a.c.x"], [])
+    layer_mapping = LayerMapping(
+        {"L1": [ModuleNameFilter("a.b")], "L2": [ModuleNameFilter("a.c")]},
+        graph.subtree_index(),
+    )
+
+    assert layer_mapping.get_layer_for_module_name("a.b") == "L1"
+    assert layer_mapping.get_layer_for_module_name("a.b.x.y") == "L1"
+    assert layer_mapping.get_layer_for_module_name("a.c.x") == "L2"
+    assert layer_mapping.get_layer_for_module_name("a.bc") is None
+    assert layer_mapping.get_layer_for_module_name("a") is None
+    # modules that are not part of the graph are looked up via their parent modules
+    assert layer_mapping.get_layer_for_module_name("a.c.z") == "L2"
+
+
+def test_modules_in_subtree_index_with_parent_modules_in_multiple_layers_raise_error() -> (
+    None
+):
+    graph = NetworkxGraph(["a", "a.b", "a.b.c"], [])
+    layer_mapping = LayerMapping(
+        {"L1": [ModuleNameFilter("a")], "L2": [ModuleNameFilter("a.b")]},
+        graph.subtree_index(),
+    )
+
+    with pytest.raises(LayerMismatch):
+        layer_mapping.get_layer_for_module_name("a.b.c")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from pytestarch.eval_structure.networkxgraph import NetworkxGraph
+from pytestarch.eval_structure.subtree_index import SubtreeIndex
+from pytestarch.eval_structure.types import LOCAL_IMPORT
+from pytestarch.eval_structure_generation.file_import.import_types import AbsoluteImport
+
+HIERARCHY = {
+    "a": ("a.b", "a.d"),
+    "a.b": ("a.b.c",),
+    "a.b.c": (),
+    "a.d": (),
+    "e": (),
+}
+
+
+@pytest.fixture
+def subtree_index() -> SubtreeIndex:
+    return SubtreeIndex(HIERARCHY, HIERARCHY.__getitem__)
+
+
+def test_submodules_are_contiguous(subtree_index: SubtreeIndex) -> None:
+    assert subtree_index.submodules("a") == ["a", "a.b", "a.b.c", "a.d"]
+    assert subtree_index.submodules("a.b") == ["a.b", "a.b.c"]
+    assert subtree_index.submodules("a.d") == ["a.d"]
+    assert subtree_index.submodules("e") == ["e"]
+
+
+@pytest.mark.parametrize(
+    "module, parent, expected",
+    [
+        ("a.b.c", "a", True),
+        ("a.b.c", "a.b", True),
+        ("a.b", "a.b", True),
+        ("a.d", "a.b", False),
+        ("a", "a.b", False),
+        ("e", "a", False),
+    ],
+)
+def test_submodules_are_recognised(
+    subtree_index: SubtreeIndex, module: str, parent: str, expected: bool
+) -> None:
+    assert subtree_index.is_submodule_of(module, parent) == expected
+
+
+def test_unknown_module_is_not_contained(subtree_index: SubtreeIndex) -> None:
+    assert "a.b" in subtree_index
+    assert "a.bc" not in subtree_index
+
+
+def test_graph_builds_index_once_and_shares_it_with_views() -> None:
+    graph = NetworkxGraph(
+        ["a", "a.b", "a.c"], [AbsoluteImport("a.b", "a.c", LOCAL_IMPORT)]
+    )
+
+    subtree_index = graph.subtree_index()
+
+    assert graph.subtree_index() is subtree_index
+    assert graph.view(LOCAL_IMPORT).subtree_index() is subtree_index
+    assert subtree_index.submodules("a") == ["a", "a.b", "a.c"]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import ast
+import py_compile
+from pathlib import Path
+
+import pytest
+
+from pytestarch.eval_structure.build_statistics import BuildStatistics
+from pytestarch.eval_structure.types import LOCAL_IMPORT
+from pytestarch.eval_structure_generation.file_import.bytecode_reader import (
+    extract_imports_from_code,
+    read_bytecode_imports,
+)
+from pytestarch.eval_structure_generation.file_import.config import Config
+from pytestarch.eval_structure_generation.file_import.converter import ImportConverter
+from pytestarch.eval_structure_generation.file_import.file_filter import FileFilter
+from pytestarch.eval_structure_generation.file_import.import_types import RawImport
+from pytestarch.eval_structure_generation.file_import.parser import Parser
+
+SOURCE = b"import a.b as c\nfrom . import x, y\nfrom ..m import *\nfrom q import r\n"
+
+
+def test_imports_are_extracted_from_nested_code_objects() -> None:
+    source = SOURCE + b"class A:\n    def f(self):\n        import inner\n"
+
+    imports = extract_imports_from_code(compile(source, "module.py", "exec"))
+
+    assert sorted(imports, key=str) == sorted(
+        [
+            RawImport("a.b", None, 0),
+            RawImport(None, "x", 1),
+            RawImport(None, "y", 1),
+            RawImport("m", "*", 2),
+            RawImport("q", None, 0),
+            RawImport("inner", None, 0, LOCAL_IMPORT),
+        ],
+        key=str,
+    )
+
+
+def test_bytecode_imports_contain_all_imports_found_in_ast() -> None:
+    source = b"if x:\n    import a\nelse:\n    import b\ntry:\n    import c\nexcept ImportError:\n    from .d import e\n"
+
+    ast_imports = ImportConverter().extract_raw_imports(ast.parse(source))
+    bytecode_imports = extract_imports_from_code(compile(source, "module.py", "exec"))
+
+    # the bytecode does not reveal whether an import is located in a try block
+    assert {raw_import[:3] for raw_import in ast_imports} < {
+        raw_import[:3] for raw_import in bytecode_imports
+    }
+
+
+@pytest.mark.parametrize(
+    "invalidation_mode",
+    [
+        py_compile.PycInvalidationMode.TIMESTAMP,
+        py_compile.PycInvalidationMode.CHECKED_HASH,
+        py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    ],
+)
+def test_imports_are_only_read_from_up_to_date_bytecode(
+    tmp_path: Path, invalidation_mode: py_compile.PycInvalidationMode
+) -> None:
+    path = tmp_path / "module.py"
+    path.write_bytes(SOURCE)
+
+    assert read_bytecode_imports(path, SOURCE) is None
+
+    py_compile.compile(str(path), invalidation_mode=invalidation_mode)
+    assert read_bytecode_imports(path, SOURCE) == extract_imports_from_code(
+        compile(SOURCE, str(path), "exec")
+    )
+
+    changed_source = SOURCE + b"import os\n"
+    path.write_bytes(changed_source)
+    assert read_bytecode_imports(path, changed_source) is None
+
+
+def test_parser_falls_back_to_source_without_up_to_date_bytecode(
+    tmp_path: Path,
+) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "compiled.py").write_text("import os\n")
+    (root / "not_compiled.py").write_text("import sys\n")
+    py_compile.compile(str(root / "compiled.py"))
+    statistics = BuildStatistics()
+
+    _, module_imports = Parser(
+        FileFilter(Config((".*__pycache__.*",))),
+        root,
+        statistics=statistics,
+        use_bytecode=True,
+    ).parse_imports(root)
+
+    assert {m.name: m.imports for m in module_imports} == {
+        "root.compiled": [RawImport("os", None, 0)],
+        "root.not_compiled": [RawImport("sys", None, 0)],
+    }
+    assert statistics.bytecode_hits == 1
+    assert statistics.bytecode_misses == 1
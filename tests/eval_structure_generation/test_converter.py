@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import ast
 from pathlib import Path
 
+import pytest
 from util import MockFileFilter
 
+from pytestarch.eval_structure.types import (
+    GUARDED_IMPORT,
+    LOCAL_IMPORT,
+    RUNTIME_IMPORT,
+    TYPE_CHECKING_IMPORT,
+)
 from pytestarch.eval_structure_generation.file_import.converter import ImportConverter
+from pytestarch.eval_structure_generation.file_import.import_types import (
+    ModuleImports,
+    RawImport,
+)
 from pytestarch.eval_structure_generation.file_import.parser import Parser
 
 SOURCE_ROOT = Path(__file__).parent.parent
@@ -36,3 +48,59 @@ def test_converter_retains_all_non_empty_modules() -> None:
     }
 
     assert set(map(lambda i: i.importee(), imports)) == expected_imports
+
+
+def test_converter_creates_imports_from_raw_imports_lazily() -> None:
+    module_imports = [
+        ModuleImports("root.a", [RawImport("os", None, 0), RawImport("b", "c", 1)]),
+        ModuleImports("root.b", [RawImport("a", None, 0)]),
+    ]
+
+    imports = ImportConverter().convert_raw_imports(module_imports, "root", {"root.a"})
+
+    first_import = next(imports)
+    assert (first_import.importer(), first_import.importee()) == ("root.a", "os")
+    assert [(i.importer(), i.importee()) for i in imports] == [
+        ("root.a", "root.b"),
+        ("root.b", "root.a"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "source, expected_kind",
+    [
+        ("import a", RUNTIME_IMPORT),
+        ("if TYPE_CHECKING:\n    import a", TYPE_CHECKING_IMPORT),
+        ("if typing.TYPE_CHECKING:\n    import a", TYPE_CHECKING_IMPORT),
+        ("if not TYPE_CHECKING:\n    import a", RUNTIME_IMPORT),
+        ("def f():\n    import a", LOCAL_IMPORT),
+        ("class A:\n    async def f(self):\n        import a", LOCAL_IMPORT),
+        ("try:\n    import a\nexcept ImportError:\n    pass", GUARDED_IMPORT),
+        (
+            "if TYPE_CHECKING:\n    def f():\n        try:\n            import a\n        finally:\n            pass",
+            TYPE_CHECKING_IMPORT | LOCAL_IMPORT | GUARDED_IMPORT,
+        ),
+    ],
+)
+def test_raw_imports_are_marked_with_kind_of_their_blocks(
+    source: str, expected_kind: int
+) -> None:
+    raw_imports = ImportConverter().extract_raw_imports(ast.parse(source))
+
+    assert raw_imports == [RawImport("a", None, 0, expected_kind)]
+
+
+def test_kind_of_raw_import_is_passed_to_import() -> None:
+    module_imports = [
+        ModuleImports(
+            "root.a",
+            [
+                RawImport("os", None, 0, LOCAL_IMPORT),
+                RawImport("b", "c", 1, GUARDED_IMPORT),
+            ],
+        )
+    ]
+
+    imports = ImportConverter().convert_raw_imports(module_imports, "root", set())
+
+    assert [i.kind() for i in imports] == [LOCAL_IMPORT, GUARDED_IMPORT]
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import pytest
+
 import resources
+from pytestarch.eval_structure.evaluable_architecture import ModuleNameFilter
 from pytestarch.pytestarch import get_evaluable_architecture_for_module_objects
+from pytestarch.query_language.exceptions import ImproperlyConfigured
 from resources import project_with_nested_external_dependencies
 
 
@@ -80,3 +84,113 @@ def test_external_dependencies_removed_if_partial_pseudo_regex_match() -> None:
 
     assert "logging" not in graph
     assert "logging.handlers" not in graph
+
+
+def test_standard_library_dependencies_removed() -> None:
+    evaluable = get_evaluable_architecture_for_module_objects(
+        resources,
+        project_with_nested_external_dependencies,
+        exclude_external_libraries=False,
+        exclude_stdlib=True,
+    )
+    graph = evaluable._graph  # type: ignore[attr-defined]
+
+    assert "logging" not in graph
+    assert "logging.handlers" not in graph
+    assert "os" not in graph
+    assert "pytest" in graph
+
+
+@pytest.mark.parametrize(
+    "keep_third_party, pytest_kept", [((), False), (("pytest",), True)]
+)
+def test_third_party_dependencies_removed_unless_kept(
+    keep_third_party: tuple[str, ...], pytest_kept: bool
+) -> None:
+    evaluable = get_evaluable_architecture_for_module_objects(
+        resources,
+        project_with_nested_external_dependencies,
+        exclude_external_libraries=False,
+        keep_third_party=keep_third_party,
+    )
+    graph = evaluable._graph  # type: ignore[attr-defined]
+
+    assert ("pytest" in graph) == pytest_kept
+    assert "logging" in graph
+
+
+def test_classification_of_external_modules_is_cached() -> None:
+    evaluable = get_evaluable_architecture_for_module_objects(
+        resources,
+        project_with_nested_external_dependencies,
+        exclude_external_libraries=False,
+        exclude_stdlib=True,
+    )
+
+    # each import is classified once for the module list and once for the graph
+    assert evaluable.build_statistics.classification_misses > 0
+    assert (
+        evaluable.build_statistics.classification_hits
+        >= evaluable.build_statistics.classification_misses
+    )
+
+
+def test_standard_library_cannot_be_excluded_separately_if_all_external_libraries_are() -> (
+    None
+):
+    with pytest.raises(ImproperlyConfigured):
+        get_evaluable_architecture_for_module_objects(
+            resources, project_with_nested_external_dependencies, exclude_stdlib=True
+        )
+
+
+def test_external_dependencies_collapsed_to_depth() -> None:
+    evaluable = get_evaluable_architecture_for_module_objects(
+        resources,
+        project_with_nested_external_dependencies,
+        exclude_external_libraries=False,
+        external_depth=1,
+    )
+    graph = evaluable._graph  # type: ignore[attr-defined]
+
+    assert "logging" in graph
+    assert "os" in graph
+    assert "logging.handlers" not in graph
+    assert "os.path" not in graph
+
+
+def test_collapsed_external_dependencies_expanded_if_named() -> None:
+    evaluable = get_evaluable_architecture_for_module_objects(
+        resources,
+        project_with_nested_external_dependencies,
+        exclude_external_libraries=False,
+        external_depth=1,
+    )
+    importer = ModuleNameFilter(
+        name="resources.project_with_nested_external_dependencies.level0.test_dummy"
+    )
+
+    dependencies = evaluable.get_dependencies(
+        [importer], [ModuleNameFilter(name="logging.handlers")]
+    )
+
+    assert all(dependencies.values())
+    assert "logging.handlers" not in evaluable.modules
+
+
+@pytest.mark.parametrize("external_depth", [0, -1])
+def test_external_depth_has_to_be_positive(external_depth: int) -> None:
+    with pytest.raises(ImproperlyConfigured):
+        get_evaluable_architecture_for_module_objects(
+            resources,
+            project_with_nested_external_dependencies,
+            exclude_external_libraries=False,
+            external_depth=external_depth,
+        )
+
+
+def test_external_depth_cannot_be_limited_if_external_libraries_are_excluded() -> None:
+    with pytest.raises(ImproperlyConfigured):
+        get_evaluable_architecture_for_module_objects(
+            resources, project_with_nested_external_dependencies, external_depth=1
+        )
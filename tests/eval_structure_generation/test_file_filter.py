@@ -67,3 +67,33 @@ def test_exclude_files_in_directory(exclusions: tuple[str, ...]) -> None:
     filtered_files = [file for file in files if not filter.is_excluded(Path(file))]
 
     assert filtered_files == [expected_file]
+
+
+combined_filter_test_cases = [
+    pytest.param("/a/__pycache__/b.py", True, id="contained literal"),
+    pytest.param("/a/b/c__init__.py", True, id="trailing literal"),
+    pytest.param("/a/b/__init__.pyc", False, id="trailing literal not at end"),
+    pytest.param("/a/bTestXpy", True, id="regex"),
+    pytest.param("/a/fixture_1.py", True, id="regex with group reference"),
+    pytest.param("/a/b/c.py", False, id="no match"),
+]
+
+
+@pytest.mark.parametrize("path, expected_exclusion", combined_filter_test_cases)
+def test_literal_and_regex_patterns_are_combined_correctly(
+    path: str, expected_exclusion: bool
+) -> None:
+    filter = FileFilter(
+        Config(
+            (
+                convert_partial_match_to_regex("*__pycache__*"),
+                convert_partial_match_to_regex("*__init__.py"),
+                ".*Test.py$",
+                r".*(fixture)_1\.py$",
+                r".*(x)\1$",
+            )
+        )
+    )
+
+    assert filter.is_excluded(path) == expected_exclusion
+    assert filter.is_excluded(Path(path)) == expected_exclusion
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path, PurePosixPath
+
+import pytest
+
+from pytestarch import Rule, get_evaluable_architectures_for_git_history
+from pytestarch.eval_structure.build_statistics import BuildStatistics
+from pytestarch.eval_structure_generation.file_import.config import Config
+from pytestarch.eval_structure_generation.file_import.exceptions import GitError
+from pytestarch.eval_structure_generation.file_import.file_filter import FileFilter
+from pytestarch.eval_structure_generation.file_import.git_history import (
+    GitRepository,
+    GitRevision,
+)
+from pytestarch.eval_structure_generation.file_import.import_types import (
+    ExtractedImports,
+    RawImport,
+)
+from pytestarch.eval_structure_generation.file_import.parser import Parser
+from pytestarch.pytestarch import _create_evaluable_architectures_for_commits
+from pytestarch.query_language.exceptions import ImproperlyConfigured
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="requires git")
+
+
+def _git(repository: Path, *arguments: str) -> None:
+    subprocess.run(  # noqa: S603
+        ["git", "-c", "user.name=test", "-c", "user.email=test@test", *arguments],  # noqa: S607
+        cwd=repository,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _commit(repository: Path, files: dict[str, str]) -> None:
+    for name, content in files.items():
+        path = repository / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    _git(repository, "add", "-A")
+    _git(repository, "commit", "-m", "commit")
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> Path:
+    _git(tmp_path, "init")
+    _commit(
+        tmp_path,
+        {
+            "src/project/a/module.py": "import os\n",
+            "src/project/b/module.py": "",
+            "README.md": "",
+        },
+    )
+    _commit(tmp_path, {"src/project/b/module.py": "from project.a import module\n"})
+    _commit(tmp_path, {"src/project/b/module.py": ""})
+
+    return tmp_path
+
+
+def test_commits_are_listed_oldest_first(repository: Path) -> None:
+    with GitRepository(repository) as git:
+        commits = git.commits("HEAD")
+
+        assert len(commits) == 3
+        assert git.commits("HEAD", max_count=2) == commits[1:]
+
+
+def test_files_and_blobs_of_commit_are_read(repository: Path) -> None:
+    with GitRepository(repository) as git:
+        first_commit, second_commit, _ = git.commits("HEAD")
+        files = git.files(second_commit, PurePosixPath("src"))
+
+        assert set(files) == {"src/project/a/module.py", "src/project/b/module.py"}
+        assert git.read_blob(files["src/project/b/module.py"]) == (
+            b"from project.a import module\n"
+        )
+        assert git.read_blob(files["src/project/a/module.py"]) == b"import os\n"
+        assert (
+            git.files(first_commit, PurePosixPath("src"))["src/project/b/module.py"]
+            != files["src/project/b/module.py"]
+        )
+
+
+def test_missing_blob_raises_error(repository: Path) -> None:
+    with GitRepository(repository) as git, pytest.raises(GitError):
+        git.read_blob("0" * 40)
+
+
+def test_unchanged_files_are_only_parsed_once(repository: Path) -> None:
+    statistics = BuildStatistics()
+    parsed_blobs: dict[str, ExtractedImports] = {}
+
+    with GitRepository(repository) as git:
+        results = [
+            Parser(
+                FileFilter(Config(())),
+                git.top_level / "src/project",
+                statistics=statistics,
+            ).parse_imports_of_revision(
+                GitRevision(git, commit, parsed_blobs),
+                git.top_level / "src/project",
+            )
+            for commit in git.commits("HEAD")
+        ]
+
+    # three distinct blobs: a/module.py and both versions of b/module.py
+    assert len(parsed_blobs) == 3
+    assert statistics.reused_blobs == 3
+
+    all_modules, module_imports = results[1]
+    assert set(all_modules) == {
+        "project",
+        "project.a",
+        "project.a.module",
+        "project.b",
+        "project.b.module",
+    }
+    assert {m.name: m.imports for m in module_imports} == {
+        "project.a.module": [RawImport("os", None, 0)],
+        "project.b.module": [RawImport("project.a", None, 0)],
+    }
+
+
+def test_evaluable_is_created_for_each_commit(repository: Path) -> None:
+    rule = (
+        Rule()
+        .modules_that()
+        .are_named("project.a")
+        .should_not()
+        .be_imported_by_modules_that()
+        .are_named("project.b")
+    )
+
+    results = []
+    for _, evaluable in get_evaluable_architectures_for_git_history(
+        repository, "src/project", "src/project"
+    ):
+        try:
+            rule.assert_applies(evaluable)
+            results.append(True)
+        except AssertionError:
+            results.append(False)
+
+    assert results == [True, False, True]
+
+
+def test_invalid_repository_raises_error(tmp_path: Path) -> None:
+    with pytest.raises(ImproperlyConfigured):
+        get_evaluable_architectures_for_git_history(tmp_path, "src", "src")
+
+
+def test_no_process_is_left_running_if_iteration_stops_early(repository: Path) -> None:
+    git = GitRepository(repository)
+
+    def read_revision(revision: GitRevision) -> GitRevision:
+        files = git.files(revision.commit, PurePosixPath("src"))
+        git.read_blob(next(iter(files.values())))
+        return revision
+
+    history = _create_evaluable_architectures_for_commits(
+        git,
+        git.commits("HEAD"),
+        read_revision,  # type: ignore[arg-type]
+    )
+    next(history)
+
+    # the history is not exhausted yet and still referenced, e.g. after breaking out of a loop over it
+    assert git._cat_file is None
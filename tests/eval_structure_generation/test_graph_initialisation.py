@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from pytestarch.eval_structure.networkxgraph import NetworkxGraph
+from pytestarch.eval_structure.networkxgraph import KINDS, NetworkxGraph
+from pytestarch.eval_structure.types import (
+    GUARDED_IMPORT,
+    LOCAL_IMPORT,
+    TYPE_CHECKING_IMPORT,
+)
 from pytestarch.eval_structure_generation.file_import.import_types import AbsoluteImport
 
 
@@ -33,3 +38,80 @@ def test_duplicate_edges_do_not_raise_error() -> None:
 
     assert len(graph._graph.nodes) == 2
     assert len(graph._graph.edges) == 1
+
+
+def test_edges_store_kinds_of_non_runtime_imports() -> None:
+    imports = [
+        AbsoluteImport("A", "B"),
+        AbsoluteImport("A", "C", TYPE_CHECKING_IMPORT),
+        AbsoluteImport("A", "C", LOCAL_IMPORT),
+    ]
+    graph = NetworkxGraph(["A", "B", "C"], imports)
+
+    assert KINDS not in graph._graph.edges["A", "B"]
+    assert graph._graph.edges["A", "C"][KINDS] == (
+        1 << TYPE_CHECKING_IMPORT | 1 << LOCAL_IMPORT
+    )
+
+
+def test_view_hides_edges_of_excluded_import_kinds_only() -> None:
+    imports = [
+        AbsoluteImport("A.a", "B"),
+        AbsoluteImport("A.a", "C", TYPE_CHECKING_IMPORT),
+        AbsoluteImport("A.a", "D", TYPE_CHECKING_IMPORT | LOCAL_IMPORT),
+        AbsoluteImport("A.a", "E", LOCAL_IMPORT),
+        AbsoluteImport("A.a", "E", GUARDED_IMPORT),
+    ]
+    graph = NetworkxGraph(["A", "A.a", "B", "C", "D", "E"], imports)
+
+    view = graph.view(TYPE_CHECKING_IMPORT | LOCAL_IMPORT)
+
+    assert view.direct_successor_nodes("A.a") == ["B", "E"]
+    assert view.direct_successor_nodes("A") == ["A.a"]
+    assert view.nodes == graph.nodes
+    assert graph.direct_successor_nodes("A.a") == ["B", "C", "D", "E"]
+
+
+def test_view_shares_edges_with_graph() -> None:
+    graph = NetworkxGraph(["A", "B"], [AbsoluteImport("A", "B")])
+
+    view = graph.view(TYPE_CHECKING_IMPORT)
+
+    assert view._graph.adj["A"]["B"] is graph._graph.adj["A"]["B"]
+
+
+def test_neighbours_are_split_into_hierarchy_and_import_edges() -> None:
+    imports = [
+        AbsoluteImport("A.b", "C"),
+        AbsoluteImport("A.a", "C"),
+        AbsoluteImport("C", "A"),
+    ]
+    graph = NetworkxGraph(["A", "A.b", "A.a", "C"], imports)
+
+    assert graph.hierarchy_children("A") == ("A.a", "A.b")
+    assert graph.import_successors("A") == ()
+    assert graph.import_predecessors("A") == ("C",)
+    assert graph.import_predecessors("C") == ("A.a", "A.b")
+    assert graph.direct_predecessor_nodes("A.a") == ["A"]
+    assert graph.parent_child_relationship("A", "A.a")
+    assert not graph.parent_child_relationship("C", "A")
+
+
+def test_neighbours_of_view_are_filtered() -> None:
+    imports = [AbsoluteImport("A", "B"), AbsoluteImport("A", "C", LOCAL_IMPORT)]
+    graph = NetworkxGraph(["A", "B", "C"], imports)
+
+    view = graph.view(LOCAL_IMPORT)
+
+    assert view.import_successors("A") == ("B",)
+    assert view.import_predecessors("C") == ()
+    assert graph.import_successors("A") == ("B", "C")
+
+
+def test_neighbours_of_graph_with_dynamic_imports_contain_dynamic_imports() -> None:
+    graph = NetworkxGraph(["A", "B"], [])
+
+    graph_with_dynamic_imports = graph.with_dynamic_imports([AbsoluteImport("A", "B")])
+
+    assert graph_with_dynamic_imports.import_successors("A") == ("B",)
+    assert graph.import_successors("A") == ()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pytestarch.eval_structure_generation.file_import.ignore_rules import (
+    IgnoreRules,
+    parse_ignore_rule,
+)
+
+
+@pytest.mark.parametrize(
+    "line, path, is_dir, expected",
+    [
+        ("build", "build", True, True),
+        ("build", "a/b/build", False, True),
+        ("build", "a/builder", False, False),
+        ("build/", "a/build", True, True),
+        ("build/", "a/build", False, False),
+        ("/build", "build", True, True),
+        ("/build", "a/build", True, False),
+        ("a/build", "a/build", True, True),
+        ("a/build", "x/a/build", True, False),
+        ("*.py", "a/b.py", False, True),
+        ("a/*.py", "a/b/c.py", False, False),
+        ("file?.py", "file1.py", False, True),
+        ("file?.py", "file10.py", False, False),
+        ("file[0-9].py", "file1.py", False, True),
+        ("file[!0-9].py", "file1.py", False, False),
+        ("**/build", "a/b/build", True, True),
+        ("**/build", "build", True, True),
+        ("a/**/build", "a/build", True, True),
+        ("a/**/build", "a/b/c/build", True, True),
+        ("a/**", "a/b/c", False, True),
+        ("a/**", "a", True, False),
+        ("\\#file", "#file", False, True),
+        ("\\!file", "!file", False, True),
+        ("file\\ ", "file ", False, True),
+        ("file  ", "file", False, True),
+    ],
+)
+def test_rule_matches_paths_with_gitignore_semantics(
+    line: str, path: str, is_dir: bool, expected: bool
+) -> None:
+    rule = parse_ignore_rule(line)
+
+    assert rule is not None
+    matches = bool(rule.pattern.match(path)) and (is_dir or not rule.directory_only)
+    assert matches == expected
+
+
+@pytest.mark.parametrize("line", ["", "# comment", "/", "!"])
+def test_blank_lines_and_comments_are_no_rules(line: str) -> None:
+    assert parse_ignore_rule(line) is None
+
+
+def test_negated_rule_includes_path_again() -> None:
+    rule = parse_ignore_rule("!keep.py")
+
+    assert rule is not None
+    assert rule.negated
+    assert rule.pattern.match("keep.py")
+
+
+def test_later_and_deeper_rules_take_precedence(tmp_path: Path) -> None:
+    (tmp_path / ".gitignore").write_text("*.py\n!keep.py\n")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / ".ignore").write_text("keep.py\n")
+
+    rules = IgnoreRules.for_directory(tmp_path)
+    sub_rules = rules.for_subdirectory(str(tmp_path / "sub"))
+
+    assert rules.is_ignored(str(tmp_path / "module.py"), False)
+    assert not rules.is_ignored(str(tmp_path / "keep.py"), False)
+    assert not rules.is_ignored(str(tmp_path / "sub" / "keep.py"), False)
+    assert sub_rules.is_ignored(str(tmp_path / "sub" / "keep.py"), False)
+
+
+def test_rules_of_repository_above_scanned_directory_apply(tmp_path: Path) -> None:
+    (tmp_path / ".git" / "info").mkdir(parents=True)
+    (tmp_path / ".git" / "info" / "exclude").write_text("excluded/\n")
+    (tmp_path / ".gitignore").write_text("src/generated/\n")
+    (tmp_path / "src").mkdir()
+
+    rules = IgnoreRules.for_directory(tmp_path / "src")
+
+    assert rules.is_ignored(str(tmp_path / "src" / "generated"), True)
+    assert rules.is_ignored(str(tmp_path / "src" / "excluded"), True)
+    assert rules.is_ignored(str(tmp_path / "src" / ".git"), True)
+    assert not rules.is_ignored(str(tmp_path / "src" / "package"), True)
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from pytestarch.eval_structure_generation.file_import.import_types import AbsoluteImport
+from pytestarch.eval_structure.types import get_parent_modules
+from pytestarch.eval_structure_generation.file_import.import_types import (
+    AbsoluteImport,
+    RelativeImport,
+)
 
 
 def test_parent_modules_as_expected() -> None:
@@ -8,3 +12,24 @@ def test_parent_modules_as_expected() -> None:
 
     assert set(imp.importer_parent_modules()) == {"test", "test.test1"}
     assert set(imp.importee_parent_modules()) == {"importee"}
+
+
+def test_relative_import_is_resolved_against_importer() -> None:
+    imp = RelativeImport("test.test1.test2", "importee", None, 2)
+
+    assert imp.importee() == "test.importee"
+    assert imp.importer_parent_modules() == ["test", "test.test1"]
+
+
+def test_imports_do_not_have_instance_dictionaries() -> None:
+    imports = [
+        AbsoluteImport("test.test1", "importee"),
+        RelativeImport("test.test1", None, "importee", 1),
+    ]
+
+    assert not any(hasattr(imp, "__dict__") for imp in imports)
+
+
+def test_parent_modules_of_top_level_module_are_empty() -> None:
+    assert get_parent_modules("test") == []
+    assert get_parent_modules("test.test1.test2") == ["test", "test.test1"]
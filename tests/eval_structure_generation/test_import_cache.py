@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import compileall
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pytestarch.eval_structure.build_statistics import BuildStatistics
+from pytestarch.eval_structure_generation.file_import import parser
+from pytestarch.eval_structure_generation.file_import.import_cache import (
+    CACHE_FILE_NAME,
+    ImportCache,
+    content_hash,
+)
+from pytestarch.eval_structure_generation.file_import.import_types import (
+    ExtractedImports,
+    RawImport,
+)
+from pytestarch.pytestarch import get_evaluable_architecture
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    root = tmp_path / "project"
+    (root / "a").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "a" / "__init__.py").write_text("")
+    (root / "a" / "x.py").write_text("from project.b import y\n")
+    (root / "b.py").write_text("import os\ny = 1\n")
+    return root
+
+
+def _build(project: Path, cache_dir: Path):
+    return get_evaluable_architecture(project, project, cache_dir=cache_dir)
+
+
+def test_unchanged_files_are_served_from_cache(project: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+
+    first = _build(project, cache_dir)
+    second = _build(project, cache_dir)
+
+    assert first.build_statistics.cache_hits == 0
+    assert first.build_statistics.cache_misses == 4
+    assert second.build_statistics.cache_hits == 4
+    assert second.build_statistics.cache_misses == 0
+    assert (cache_dir / CACHE_FILE_NAME).exists()
+    assert sorted(first._graph.edges) == sorted(second._graph.edges)  # type: ignore[attr-defined]
+
+
+def test_changed_file_is_parsed_again(project: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    _build(project, cache_dir)
+
+    (project / "b.py").write_text("import project.a.x\n")
+    evaluable = _build(project, cache_dir)
+
+    assert evaluable.build_statistics.cache_hits == 3
+    assert evaluable.build_statistics.cache_misses == 1
+    assert ("project.b", "project.a.x") in evaluable._graph.edges  # type: ignore[attr-defined]
+
+
+def test_touched_file_with_identical_content_is_not_parsed_again(
+    project: Path, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    _build(project, cache_dir)
+
+    stat = (project / "b.py").stat()
+    os.utime(project / "b.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    evaluable = _build(project, cache_dir)
+
+    assert evaluable.build_statistics.cache_hits == 4
+    assert evaluable.build_statistics.cache_misses == 0
+
+
+def test_file_changed_while_it_is_parsed_is_parsed_again(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir = tmp_path / "cache"
+    extract_imports_from_file = parser.extract_imports_from_file
+
+    def extract_and_change(path: Path, **kwargs: Any) -> ExtractedImports:
+        extracted_imports = extract_imports_from_file(path, **kwargs)
+        if path.name == "b.py":
+            path.write_text("import project.a.x\n")
+
+        return extracted_imports
+
+    monkeypatch.setattr(parser, "extract_imports_from_file", extract_and_change)
+    _build(project, cache_dir)
+    monkeypatch.undo()
+
+    evaluable = _build(project, cache_dir)
+
+    assert evaluable.build_statistics.cache_misses == 1
+    assert ("project.b", "project.a.x") in evaluable._graph.edges  # type: ignore[attr-defined]
+
+
+def test_entries_of_deleted_files_are_evicted(project: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    _build(project, cache_dir)
+
+    (project / "a" / "x.py").unlink()
+    evaluable = _build(project, cache_dir)
+
+    assert evaluable.build_statistics.cache_evictions == 1
+    assert evaluable.build_statistics.cache_hits == 3
+
+
+def test_corrupt_cache_file_is_ignored(tmp_path: Path) -> None:
+    (tmp_path / CACHE_FILE_NAME).write_text("{not json")
+    source_file = tmp_path / "module.py"
+    source_file.write_text("import os\n")
+
+    stat = source_file.stat()
+    cache = ImportCache(tmp_path, BuildStatistics())
+    assert cache.lookup(source_file, stat) is None
+
+    cache.store(
+        source_file, stat, content_hash(b"import os\n"), [RawImport("os", None, 0)]
+    )
+    cache.save(tmp_path)
+
+    assert ImportCache(tmp_path, BuildStatistics()).lookup(source_file, stat) == [
+        RawImport("os", None, 0)
+    ]
+
+
+def test_header_only_entries_are_only_used_for_header_scans(
+    project: Path, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    get_evaluable_architecture(
+        project, project, cache_dir=cache_dir, scanner="header_only"
+    )
+
+    header_scan = get_evaluable_architecture(
+        project, project, cache_dir=cache_dir, scanner="header_only"
+    )
+    complete_scan = _build(project, cache_dir)
+
+    assert header_scan.build_statistics.cache_hits == 4
+    assert complete_scan.build_statistics.cache_hits == 0
+    assert complete_scan.build_statistics.cache_misses == 4
+
+
+@pytest.mark.parametrize(
+    "skip_settings",
+    [{"max_file_size": 10}, {"generated_file_marker": "^y = 1$"}],
+)
+def test_entries_are_not_used_for_files_matching_current_skip_criteria(
+    project: Path, tmp_path: Path, skip_settings: dict[str, Any]
+) -> None:
+    cache_dir = tmp_path / "cache"
+    _build(project, cache_dir)
+
+    evaluable = get_evaluable_architecture(
+        project, project, cache_dir=cache_dir, **skip_settings
+    )
+
+    assert str(project / "b.py") in evaluable.build_statistics.skipped_files
+    assert ("project.b", "os") not in evaluable._graph.edges  # type: ignore[attr-defined]
+
+
+def test_entries_stored_with_generated_file_marker_are_only_used_for_same_marker(
+    project: Path, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    get_evaluable_architecture(
+        project, project, cache_dir=cache_dir, generated_file_marker="^z = 1$"
+    )
+
+    same_marker = get_evaluable_architecture(
+        project, project, cache_dir=cache_dir, generated_file_marker="^z = 1$"
+    )
+    other_marker = get_evaluable_architecture(
+        project, project, cache_dir=cache_dir, generated_file_marker="^y = 1$"
+    )
+
+    assert same_marker.build_statistics.cache_hits == 4
+    assert other_marker.build_statistics.cache_hits == 0
+    assert str(project / "b.py") in other_marker.build_statistics.skipped_files
+
+
+def test_parsed_entries_are_not_used_when_reading_bytecode(
+    project: Path, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    _build(project, cache_dir)
+    compileall.compile_dir(project, quiet=1)
+
+    evaluable = get_evaluable_architecture(
+        project, project, cache_dir=cache_dir, source="bytecode"
+    )
+
+    assert evaluable.build_statistics.cache_hits == 0
+    assert evaluable.build_statistics.bytecode_hits == 4
@@ -2,10 +2,18 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
+from pytestarch.eval_structure.build_statistics import BuildStatistics
+from pytestarch.eval_structure.module_hierarchy import ModuleHierarchy
+from pytestarch.eval_structure_generation.file_import import import_filter
 from pytestarch.eval_structure_generation.file_import.import_filter import (
     ExternalImportFilter,
 )
 from pytestarch.eval_structure_generation.file_import.import_types import AbsoluteImport
+from pytestarch.eval_structure_generation.file_import.module_classifier import (
+    ModuleClassifier,
+)
 
 ROOT_PATH = Path("A.B")
 
@@ -30,3 +38,78 @@ def test_import_filter_includes_internal_dependencies() -> None:
     assert len(filtered_imports) == 2
     assert filtered_imports[0].importee() == "A.B.C"
     assert filtered_imports[1].importee() == "A.D"
+
+
+def test_lazy_import_filter_consumes_imports_one_by_one() -> None:
+    filter = ExternalImportFilter(True, str(ROOT_PATH), ())
+    filtered_imports = filter.filter_lazily(iter(imports))
+
+    assert next(filtered_imports).importee() == "A.B.C"
+    assert next(filtered_imports, None) is None
+
+
+def test_excluded_parent_module_excludes_submodules_without_classifying_them() -> None:
+    statistics = BuildStatistics()
+    filter = ExternalImportFilter(
+        False, str(ROOT_PATH), ("numpy$",), statistics=statistics
+    )
+
+    filtered_imports = filter.filter(
+        [
+            AbsoluteImport("X", "numpy"),
+            AbsoluteImport("X", "numpy.linalg"),
+            AbsoluteImport("X", "numpy.linalg"),
+            AbsoluteImport("X", "os.path"),
+        ]
+    )
+
+    assert [i.importee() for i in filtered_imports] == ["os.path"]
+    assert statistics.classification_hits == 1
+    assert statistics.classification_misses == 3
+
+
+def test_parent_modules_are_looked_up_in_given_empty_table() -> None:
+    hierarchy = ModuleHierarchy()
+    filter = ExternalImportFilter(
+        False, str(ROOT_PATH), ("numpy$",), module_hierarchy=hierarchy
+    )
+
+    filter.filter([AbsoluteImport("X", "numpy.linalg")])
+
+    assert "numpy.linalg" in hierarchy
+
+
+def test_classification_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(import_filter, "CLASSIFICATION_CACHE_SIZE", 2)
+    statistics = BuildStatistics()
+    filter = ExternalImportFilter(False, str(ROOT_PATH), ("x$",), statistics=statistics)
+
+    filter.filter([AbsoluteImport("X", name) for name in ("a", "b", "c", "a")])
+
+    assert statistics.classification_hits == 0
+    assert statistics.classification_misses == 4
+
+
+def test_standard_library_and_third_party_modules_are_excluded_by_classifier() -> None:
+    filter = ExternalImportFilter(
+        False,
+        str(ROOT_PATH),
+        (),
+        module_classifier=ModuleClassifier(True, ("pytest",)),
+    )
+
+    filtered_imports = filter.filter(
+        [
+            AbsoluteImport("X", "os.path"),
+            AbsoluteImport("X", "pytest"),
+            AbsoluteImport("X", "_pytest.fixtures"),
+            AbsoluteImport("X", "not_installed"),
+            AbsoluteImport("X", "A.B.C"),
+        ]
+    )
+
+    assert [i.importee() for i in filtered_imports] == [
+        "pytest",
+        "not_installed",
+        "A.B.C",
+    ]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pytestarch import Rule, get_evaluable_architecture
+from pytestarch.eval_structure.types import GUARDED_IMPORT
+
+PACKAGE_NAME = "project"
+
+FILES = {
+    "__init__.py": "",
+    "api.py": "from typing import TYPE_CHECKING\n\nif TYPE_CHECKING:\n    from .db import Session\n",
+    "cli.py": "def main():\n    from . import db\n",
+    "speedups.py": "try:\n    from . import db\nexcept ImportError:\n    db = None\n",
+    "db.py": "",
+}
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> Path:
+    package = tmp_path / PACKAGE_NAME
+
+    for name, content in FILES.items():
+        path = package / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    return package
+
+
+def _db_not_imported_by(module: str) -> Rule:
+    return (
+        Rule()
+        .modules_that()
+        .are_named(f"{PACKAGE_NAME}.db")
+        .should_not()
+        .be_imported_by_modules_that()
+        .are_named(f"{PACKAGE_NAME}.{module}")
+    )
+
+
+@pytest.mark.parametrize("module", ["api", "cli"])
+def test_runtime_only_view_excludes_type_checking_and_local_imports(
+    package: Path, module: str
+) -> None:
+    evaluable = get_evaluable_architecture(package, package)
+
+    with pytest.raises(AssertionError):
+        _db_not_imported_by(module).assert_applies(evaluable)
+
+    _db_not_imported_by(module).assert_applies(evaluable.view(runtime_only=True))
+
+
+def test_guarded_imports_are_runtime_imports_unless_excluded(package: Path) -> None:
+    evaluable = get_evaluable_architecture(package, package)
+
+    with pytest.raises(AssertionError):
+        _db_not_imported_by("speedups").assert_applies(
+            evaluable.view(runtime_only=True)
+        )
+
+    _db_not_imported_by("speedups").assert_applies(
+        evaluable.view(excluded_kinds=GUARDED_IMPORT)
+    )
+
+
+def test_view_does_not_change_evaluable(package: Path) -> None:
+    evaluable = get_evaluable_architecture(package, package)
+
+    evaluable.view(runtime_only=True)
+
+    with pytest.raises(AssertionError):
+        _db_not_imported_by("api").assert_applies(evaluable)
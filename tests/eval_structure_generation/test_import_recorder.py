@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pytestarch import (
+    ImportRecorder,
+    Rule,
+    add_recorded_imports,
+    get_evaluable_architecture,
+)
+from pytestarch.eval_structure_generation.file_import.import_recorder import (
+    read_recorded_imports,
+)
+
+PACKAGE_NAME = "recorded_project"
+
+FILES = {
+    "__init__.py": "",
+    "loader.py": "import importlib\n\n\ndef load(name):\n    return importlib.import_module(name)\n",
+    "plugins/__init__.py": "from . import base\n",
+    "plugins/base.py": "",
+    "plugins/plugin.py": "",
+}
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    for name, content in FILES.items():
+        path = tmp_path / PACKAGE_NAME / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    yield tmp_path / PACKAGE_NAME
+
+    for name in [m for m in sys.modules if m.split(".")[0] == PACKAGE_NAME]:
+        del sys.modules[name]
+
+
+def _record(recording: Path, buffer_size: int = 1024) -> None:
+    with ImportRecorder(recording, buffer_size):
+        loader = importlib.import_module(f"{PACKAGE_NAME}.loader")
+        loader.load(f"{PACKAGE_NAME}.plugins.plugin")
+
+
+def test_dynamic_imports_are_recorded_with_importing_module(
+    package: Path, tmp_path: Path
+) -> None:
+    recording = tmp_path / "imports"
+
+    _record(recording)
+
+    recorded_imports = read_recorded_imports(recording)
+    assert (f"{__name__}", f"{PACKAGE_NAME}.loader") in recorded_imports
+    assert (
+        f"{PACKAGE_NAME}.loader",
+        f"{PACKAGE_NAME}.plugins.plugin",
+    ) in recorded_imports
+    assert (
+        f"{PACKAGE_NAME}.plugins.__init__",
+        f"{PACKAGE_NAME}.plugins.base",
+    ) in recorded_imports
+
+
+def test_imports_of_already_loaded_modules_are_not_recorded(
+    package: Path, tmp_path: Path
+) -> None:
+    recording = tmp_path / "imports"
+    importlib.import_module(f"{PACKAGE_NAME}.plugins.plugin")
+
+    _record(recording)
+
+    recorded_imports = read_recorded_imports(recording)
+    assert (f"{__name__}", f"{PACKAGE_NAME}.loader") in recorded_imports
+    assert (
+        f"{PACKAGE_NAME}.loader",
+        f"{PACKAGE_NAME}.plugins.plugin",
+    ) not in recorded_imports
+
+
+def test_imports_are_written_in_batches(package: Path, tmp_path: Path) -> None:
+    recording = tmp_path / "imports"
+    recorder = ImportRecorder(recording, buffer_size=2).start()
+
+    try:
+        importlib.import_module(f"{PACKAGE_NAME}.plugins.base")
+        lines_before_stop = len(recording.read_text().splitlines())
+    finally:
+        recorder.stop()
+
+    # recorded_project, recorded_project.plugins and recorded_project.plugins.base
+    assert lines_before_stop == 2
+    assert len(recording.read_text().splitlines()) == 3
+    assert recorder not in sys.meta_path
+
+
+def test_duplicate_recorded_imports_are_read_once(tmp_path: Path) -> None:
+    recording = tmp_path / "imports"
+    recording.write_text("a\tb\na\tc\na\tb\ninvalid\n")
+
+    assert read_recorded_imports(recording) == [("a", "b"), ("a", "c")]
+
+
+def test_recorded_imports_are_added_as_dynamic_edges(
+    package: Path, tmp_path: Path
+) -> None:
+    recording = tmp_path / "imports"
+    _record(recording)
+
+    rule = (
+        Rule()
+        .modules_that()
+        .are_named(f"{PACKAGE_NAME}.plugins.plugin")
+        .should_not()
+        .be_imported_by_modules_that()
+        .are_named(f"{PACKAGE_NAME}.loader")
+    )
+
+    evaluable = get_evaluable_architecture(package, package)
+    rule.assert_applies(evaluable)
+
+    evaluable_with_recorded_imports = add_recorded_imports(evaluable, recording)
+    with pytest.raises(AssertionError):
+        rule.assert_applies(evaluable_with_recorded_imports)
+
+    graph = evaluable_with_recorded_imports._graph  # type: ignore
+    assert graph.is_dynamic(f"{PACKAGE_NAME}.loader", f"{PACKAGE_NAME}.plugins.plugin")
+    assert not graph.is_dynamic(
+        f"{PACKAGE_NAME}.plugins.__init__", f"{PACKAGE_NAME}.plugins.base"
+    )
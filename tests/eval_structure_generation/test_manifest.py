@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pytestarch.eval_structure_generation.file_import.manifest import read_manifest
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"src/a.py\0src/with space.py\0",
+        b"src/a.py\nsrc/with space.py\n",
+        b"src/a.py\r\nsrc/with space.py\r\n\r\n",
+    ],
+)
+def test_manifest_entries_are_read(tmp_path: Path, content: bytes) -> None:
+    manifest = tmp_path / "manifest"
+    manifest.write_bytes(content)
+
+    assert read_manifest(manifest) == ["src/a.py", "src/with space.py"]
+
+
+def test_file_names_with_line_breaks_are_read_from_null_separated_manifest(
+    tmp_path: Path,
+) -> None:
+    manifest = tmp_path / "manifest"
+    manifest.write_bytes(b"a\nb.py\0c.py")
+
+    assert read_manifest(manifest) == ["a\nb.py", "c.py"]
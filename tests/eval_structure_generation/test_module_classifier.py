@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from pytestarch.eval_structure_generation.file_import.module_classifier import (
+    STANDARD_LIBRARY,
+    THIRD_PARTY,
+    UNKNOWN,
+    ModuleClassifier,
+    classify,
+)
+
+
+@pytest.mark.parametrize(
+    "module, kind",
+    [
+        ("os", STANDARD_LIBRARY),
+        ("typing", STANDARD_LIBRARY),
+        ("pytest", THIRD_PARTY),
+        ("not_installed", UNKNOWN),
+    ],
+)
+def test_top_level_modules_are_classified(module: str, kind: str) -> None:
+    assert classify(module) == kind
+
+
+def test_classifier_without_exclusions_excludes_nothing() -> None:
+    classifier = ModuleClassifier(False, None)
+
+    assert not classifier.has_exclusions()
+    assert not any(map(classifier.is_excluded, ("os", "pytest", "not_installed")))
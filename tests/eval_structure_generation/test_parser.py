@@ -1,10 +1,32 @@
 from __future__ import annotations
 
+import os
+import re
+import sys
+import zipfile
 from pathlib import Path
 
+import pytest
+
+from pytestarch.eval_structure.build_statistics import BuildStatistics
 from pytestarch.eval_structure_generation.file_import.config import Config
+from pytestarch.eval_structure_generation.file_import.executors import (
+    EXECUTORS,
+    INTERPRETER_EXECUTOR,
+    PROCESS_EXECUTOR,
+    THREAD_EXECUTOR,
+)
 from pytestarch.eval_structure_generation.file_import.file_filter import FileFilter
-from pytestarch.eval_structure_generation.file_import.parser import Parser
+from pytestarch.eval_structure_generation.file_import.parser import (
+    HEADER_ONLY_SCANNER,
+    TOKENIZE_SCANNER,
+    Parser,
+)
+from pytestarch.eval_structure_generation.file_import.skip_criteria import (
+    EXCEEDS_MAX_FILE_SIZE,
+    GENERATED_FILE,
+    SkipCriteria,
+)
 from pytestarch.utils.partial_match_to_regex_converter import (
     convert_partial_match_to_regex,
 )
@@ -12,6 +34,10 @@ from pytestarch.utils.partial_match_to_regex_converter import (
 SOURCE_ROOT = Path(__file__).parent.parent
 RESOURCES_DIR = SOURCE_ROOT / "resources/importer"
 
+requires_subinterpreters = pytest.mark.skipif(
+    sys.version_info < (3, 14), reason="subinterpreters require python 3.14"
+)
+
 
 def test_parser_parses_all_files_in_directory() -> None:
     parser = Parser(
@@ -42,3 +68,245 @@ def test_parser_parses_all_files_in_directory() -> None:
     }
 
     assert set(map(lambda module: module.name, parsed_modules)) == expected_modules
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        PROCESS_EXECUTOR,
+        THREAD_EXECUTOR,
+        pytest.param(INTERPRETER_EXECUTOR, marks=requires_subinterpreters),
+    ],
+)
+def test_parsing_with_multiple_workers_gives_identical_result(executor: str) -> None:
+    file_filter = FileFilter(Config((convert_partial_match_to_regex("*__pycache__"),)))
+
+    sequential_result = Parser(file_filter, SOURCE_ROOT).parse_imports(RESOURCES_DIR)
+    parallel_result = Parser(
+        file_filter, SOURCE_ROOT, workers=2, executor=executor
+    ).parse_imports(RESOURCES_DIR)
+
+    assert sequential_result == parallel_result
+    assert len(parallel_result[1]) == 14
+
+
+@requires_subinterpreters
+def test_interpreter_executor_is_offered() -> None:
+    assert INTERPRETER_EXECUTOR in EXECUTORS
+
+
+def test_parsing_with_token_scanner_gives_identical_result() -> None:
+    file_filter = FileFilter(Config((convert_partial_match_to_regex("*__pycache__"),)))
+
+    ast_result = Parser(file_filter, SOURCE_ROOT).parse_imports(RESOURCES_DIR)
+    token_result = Parser(
+        file_filter, SOURCE_ROOT, scanner=TOKENIZE_SCANNER
+    ).parse_imports(RESOURCES_DIR)
+
+    assert ast_result == token_result
+
+
+@pytest.mark.parametrize("prefetch_bytes", [1, 1024 * 1024])
+def test_parsing_with_prefetching_gives_identical_result(prefetch_bytes: int) -> None:
+    file_filter = FileFilter(Config((convert_partial_match_to_regex("*__pycache__"),)))
+
+    sequential_result = Parser(file_filter, SOURCE_ROOT).parse_imports(RESOURCES_DIR)
+    prefetched_result = Parser(
+        file_filter, SOURCE_ROOT, prefetch_bytes=prefetch_bytes
+    ).parse_imports(RESOURCES_DIR)
+
+    assert sequential_result == prefetched_result
+
+
+def test_parser_follows_symbolic_links_only_once(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    package = root / "package"
+    package.mkdir(parents=True)
+    (package / "module.py").write_text("import os\n")
+    (package / "loop").symlink_to(root, target_is_directory=True)
+    (root / "duplicate").symlink_to(package, target_is_directory=True)
+
+    all_modules, module_imports = Parser(FileFilter(Config(())), root).parse_imports(
+        root
+    )
+
+    assert len(module_imports) == 1
+    assert module_imports[0].name in {"root.package.module", "root.duplicate.module"}
+    assert "root.package.loop" not in all_modules
+
+
+def test_parser_skips_files_and_directories_ignored_by_ignore_files(
+    tmp_path: Path,
+) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("build/\n*_pb2.py\n")
+    root = tmp_path / "root"
+    for directory in ("package", "build", ".venv/lib", "package/generated"):
+        (root / directory).mkdir(parents=True)
+        (root / directory / "module.py").write_text("import os\n")
+    (root / "package" / "messages_pb2.py").write_text("import os\n")
+    (root / ".ignore").write_text(".venv\n")
+    (root / "package" / ".gitignore").write_text("generated/\n!messages_pb2.py\n")
+
+    all_modules, module_imports = Parser(
+        FileFilter(Config(())), root, respect_ignore_files=True
+    ).parse_imports(root)
+
+    assert {m.name for m in module_imports} == {
+        "root.package.module",
+        "root.package.messages_pb2",
+    }
+    assert set(all_modules) == {
+        "root",
+        "root.package",
+        "root.package.messages_pb2",
+        "root.package.module",
+    }
+
+
+def test_parsing_listed_files_gives_same_result_as_walking_the_file_system() -> None:
+    file_filter = FileFilter(Config((convert_partial_match_to_regex("*__pycache__"),)))
+    files = [
+        Path(directory, name)
+        for directory, _, names in os.walk(SOURCE_ROOT)
+        for name in names
+    ]
+
+    walked_modules, walked_imports = Parser(file_filter, SOURCE_ROOT).parse_imports(
+        RESOURCES_DIR
+    )
+    listed_modules, listed_imports = Parser(
+        file_filter, SOURCE_ROOT
+    ).parse_imports_of_listed_files(RESOURCES_DIR, files)
+
+    assert set(listed_modules) == set(walked_modules)
+    assert sorted(listed_imports, key=lambda m: m.name) == sorted(
+        walked_imports, key=lambda m: m.name
+    )
+
+
+def test_listed_files_outside_path_and_in_excluded_directories_are_skipped(
+    tmp_path: Path,
+) -> None:
+    root = tmp_path / "root"
+    for directory in ("package/sub", "excluded", "other"):
+        (root / directory).mkdir(parents=True)
+        (root / directory / "module.py").write_text("import os\n")
+    (root / "package" / "README.md").write_text("")
+
+    files = [
+        root / "package/sub/module.py",
+        root / "package/sub/module.py",
+        root / "package/README.md",
+        root / "excluded/module.py",
+        tmp_path / "outside.py",
+    ]
+
+    all_modules, module_imports = Parser(
+        FileFilter(Config((convert_partial_match_to_regex("*excluded*"),))), root
+    ).parse_imports_of_listed_files(root, files)
+
+    assert [m.name for m in module_imports] == ["root.package.sub.module"]
+    assert all_modules == [
+        "root",
+        "root.package",
+        "root.package.sub",
+        "root.package.sub.module",
+    ]
+
+
+def test_parsing_archive_gives_same_result_as_parsing_extracted_files(
+    tmp_path: Path,
+) -> None:
+    file_filter = FileFilter(Config((convert_partial_match_to_regex("*__pycache__"),)))
+    archive = tmp_path / "tests.whl"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for directory, _, names in os.walk(RESOURCES_DIR):
+            for name in names:
+                path = Path(directory, name)
+                zip_file.write(path, path.relative_to(SOURCE_ROOT.parent).as_posix())
+
+    walked_modules, walked_imports = Parser(file_filter, SOURCE_ROOT).parse_imports(
+        RESOURCES_DIR
+    )
+    archived_modules, archived_imports = Parser(
+        file_filter, archive / "tests"
+    ).parse_imports_of_archive(archive, archive / "tests/resources/importer")
+
+    assert set(archived_modules) == set(walked_modules)
+    assert sorted(archived_imports, key=lambda m: m.name) == sorted(
+        walked_imports, key=lambda m: m.name
+    )
+
+
+@pytest.mark.parametrize(
+    "skip_criteria, expected_imports, expected_skipped_files",
+    [
+        (SkipCriteria(), {"large": 1, "generated": 1, "small": 1}, {}),
+        (
+            SkipCriteria(max_file_size=100),
+            {"large": 1, "generated": 1, "small": 1},
+            {"large.py": EXCEEDS_MAX_FILE_SIZE},
+        ),
+        (
+            SkipCriteria(
+                max_file_size=100,
+                generated_file_marker=re.compile(b"^# Generated", re.MULTILINE),
+                scan_imports=False,
+            ),
+            {"large": 0, "generated": 0, "small": 1},
+            {"large.py": EXCEEDS_MAX_FILE_SIZE, "generated.py": GENERATED_FILE},
+        ),
+    ],
+)
+def test_files_matching_skip_criteria_are_not_parsed_but_reported(
+    tmp_path: Path,
+    skip_criteria: SkipCriteria,
+    expected_imports: dict[str, int],
+    expected_skipped_files: dict[str, str],
+) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "large.py").write_text("import os\n" + "x = 1\n" * 100)
+    (root / "generated.py").write_text(
+        "#!/usr/bin/env python\n# Generated\nimport os\n"
+    )
+    (root / "small.py").write_text("import os\n")
+    statistics = BuildStatistics()
+
+    all_modules, module_imports = Parser(
+        FileFilter(Config(())), root, skip_criteria=skip_criteria, statistics=statistics
+    ).parse_imports(root)
+
+    assert set(all_modules) == {"root", "root.large", "root.generated", "root.small"}
+    assert {
+        m.name.split(".")[-1]: len(m.imports) for m in module_imports
+    } == expected_imports
+    assert statistics.skipped_files == {
+        str(root.resolve() / name): reason
+        for name, reason in expected_skipped_files.items()
+    }
+
+
+def test_header_scan_is_verified_for_sampled_files(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "complete.py").write_text("import os\n\ndef f():\n    pass\n")
+    (root / "incomplete.py").write_text(
+        "import os\n\ndef f():\n    from . import complete\n"
+    )
+    statistics = BuildStatistics()
+
+    _, module_imports = Parser(
+        FileFilter(Config(())),
+        root,
+        scanner=HEADER_ONLY_SCANNER,
+        statistics=statistics,
+        header_only_verification=1,
+    ).parse_imports(root)
+
+    assert all(len(m.imports) == 1 for m in module_imports)
+    assert statistics.verified_files == 2
+    assert statistics.missed_imports == {
+        str(root.resolve() / "incomplete.py"): [".complete"]
+    }
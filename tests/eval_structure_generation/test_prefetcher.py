@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pytestarch.eval_structure_generation.file_import import prefetcher
+from pytestarch.eval_structure_generation.file_import.prefetcher import prefetch
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> list[Path]:
+    paths = []
+
+    for index in range(20):
+        path = tmp_path / f"module_{index}.py"
+        path.write_bytes(b"x" * index)
+        paths.append(path)
+
+    return paths
+
+
+@pytest.mark.parametrize(
+    "byte_budget, threads", [(0, 4), (10, 4), (1000, 1), (1000, 8)]
+)
+def test_files_are_read_in_given_order(
+    files: list[Path], byte_budget: int, threads: int
+) -> None:
+    prefetched = list(prefetch(files, byte_budget, threads))
+
+    assert [path for path, _ in prefetched] == files
+    assert [content for _, content in prefetched] == [p.read_bytes() for p in files]
+
+
+def test_files_are_not_read_ahead_without_byte_budget(
+    files: list[Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    read_paths = []
+    read_file = prefetcher._read
+
+    def read(path: Path, budget: prefetcher._ByteBudget) -> bytes:
+        read_paths.append(path)
+        return read_file(path, budget)
+
+    monkeypatch.setattr(prefetcher, "_read", read)
+    prefetched = prefetch(files, 0, 4)
+
+    for _ in range(3):
+        next(prefetched)
+
+    assert read_paths == files[:3]
+
+
+def test_size_of_file_is_reserved_before_it_is_released(
+    files: list[Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class CheckedByteBudget(prefetcher._ByteBudget):
+        def reserve(self, *args: Any) -> None:
+            # widens the window between reading a file and reserving its size
+            time.sleep(0.001)
+            super().reserve(*args)
+
+        def release(self, size: int) -> None:
+            assert self._used >= size
+            super().release(size)
+
+    monkeypatch.setattr(prefetcher, "_ByteBudget", CheckedByteBudget)
+
+    assert len(list(prefetch(files, 50, 8))) == len(files)
+
+
+def test_error_reading_file_is_raised_when_file_is_consumed(
+    files: list[Path],
+) -> None:
+    files[3].unlink()
+    prefetched = prefetch(files, 1000, 4)
+
+    assert [path for path, _ in (next(prefetched) for _ in range(3))] == files[:3]
+    with pytest.raises(FileNotFoundError):
+        next(prefetched)
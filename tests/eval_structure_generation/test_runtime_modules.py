@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import importlib
+import linecache
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pytestarch import (
+    get_evaluable_architecture,
+    get_evaluable_architecture_from_runtime,
+)
+from pytestarch.eval_structure.build_statistics import BuildStatistics
+from pytestarch.eval_structure_generation.file_import.config import Config
+from pytestarch.eval_structure_generation.file_import.file_filter import FileFilter
+from pytestarch.eval_structure_generation.file_import.import_types import RawImport
+from pytestarch.eval_structure_generation.file_import.runtime_modules import (
+    SOURCE_NOT_CACHED,
+    read_runtime_imports,
+)
+from pytestarch.query_language.exceptions import ImproperlyConfigured
+from pytestarch.utils.partial_match_to_regex_converter import (
+    convert_partial_match_to_regex,
+)
+
+PACKAGE_NAME = "runtime_project"
+
+FILES = {
+    "__init__.py": "",
+    "a/__init__.py": "from . import module\n",
+    "a/module.py": "import os\nfrom runtime_project.b import module\n",
+    "b/__init__.py": "",
+    "b/module.py": "def f():\n    from ..a import module\n",
+    "excluded/__init__.py": "",
+    "excluded/module.py": "import json\n",
+    "not_imported.py": "import sys\n",
+}
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    for name, content in FILES.items():
+        path = tmp_path / PACKAGE_NAME / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    for name in ("a.module", "b.module", "excluded.module"):
+        importlib.import_module(f"{PACKAGE_NAME}.{name}")
+
+    yield tmp_path / PACKAGE_NAME
+
+    for name in [m for m in sys.modules if m.split(".")[0] == PACKAGE_NAME]:
+        del sys.modules[name]
+
+
+def test_only_imported_and_not_excluded_modules_are_read(package: Path) -> None:
+    all_modules, module_imports = read_runtime_imports(
+        PACKAGE_NAME, FileFilter(Config((convert_partial_match_to_regex("*excluded"),)))
+    )
+
+    assert all_modules == [
+        "runtime_project",
+        "runtime_project.__init__",
+        "runtime_project.a",
+        "runtime_project.a.__init__",
+        "runtime_project.a.module",
+        "runtime_project.b",
+        "runtime_project.b.__init__",
+        "runtime_project.b.module",
+    ]
+    assert {m.name for m in module_imports} == {
+        "runtime_project.__init__",
+        "runtime_project.a.__init__",
+        "runtime_project.a.module",
+        "runtime_project.b.__init__",
+        "runtime_project.b.module",
+    }
+
+
+def test_source_cached_by_linecache_is_used(package: Path) -> None:
+    path = str(package / "a" / "module.py")
+    linecache.updatecache(path)
+    linecache.cache[path] = (*linecache.cache[path][:2], ["import json\n"], path)
+
+    try:
+        _, module_imports = read_runtime_imports(
+            f"{PACKAGE_NAME}.a.module", FileFilter(Config(()))
+        )
+    finally:
+        linecache.checkcache(path)
+
+    assert [m.imports for m in module_imports] == [[RawImport("json", None, 0)]]
+
+
+def test_modules_without_cached_source_are_skipped(package: Path) -> None:
+    path = package / "a" / "module.py"
+    linecache.cache.pop(str(path), None)
+    statistics = BuildStatistics()
+
+    # the file is not read again, so its imports cannot be found
+    path.unlink()
+    all_modules, module_imports = read_runtime_imports(
+        f"{PACKAGE_NAME}.a.module", FileFilter(Config(())), statistics
+    )
+
+    assert all_modules == [f"{PACKAGE_NAME}.a.module"]
+    assert [m.imports for m in module_imports] == [[]]
+    assert statistics.skipped_files == {str(path): SOURCE_NOT_CACHED}
+
+
+def test_runtime_evaluable_equals_evaluable_of_imported_files(package: Path) -> None:
+    (package / "not_imported.py").unlink()
+    for path in package.rglob("*.py"):
+        linecache.updatecache(str(path))
+
+    runtime_evaluable = get_evaluable_architecture_from_runtime(
+        PACKAGE_NAME, exclude_external_libraries=False
+    )
+    file_evaluable = get_evaluable_architecture(
+        package, package, exclude_external_libraries=False
+    )
+
+    assert runtime_evaluable._graph._graph.nodes == file_evaluable._graph._graph.nodes  # type: ignore
+    assert set(runtime_evaluable._graph._graph.edges) == set(  # type: ignore
+        file_evaluable._graph._graph.edges  # type: ignore
+    )
+
+
+@pytest.mark.parametrize(
+    "root_package, module",
+    [("never_imported_package", None), ("os.path", None), ("pytest", "json")],
+)
+def test_invalid_modules_raise_error(root_package: str, module: str | None) -> None:
+    with pytest.raises(ImproperlyConfigured):
+        get_evaluable_architecture_from_runtime(root_package, module)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+
+import pytest
+
+from pytestarch.eval_structure_generation.file_import import source_reader
+from pytestarch.eval_structure_generation.file_import.import_types import RawImport
+from pytestarch.eval_structure_generation.file_import.parser import (
+    AST_SCANNER,
+    TOKENIZE_SCANNER,
+    extract_imports_from_file,
+)
+from pytestarch.eval_structure_generation.file_import.source_reader import open_source
+
+encoding_test_cases = [
+    pytest.param(
+        "# -*- coding: latin-1 -*-\nimport os\nname = 'Müller'\n".encode("latin-1"),
+        id="encoding declaration",
+    ),
+    pytest.param(
+        b"\xef\xbb\xbfimport os\nname = '" + "Müller".encode() + b"'\n",
+        id="byte order mark",
+    ),
+]
+
+
+@pytest.mark.parametrize("scanner", [AST_SCANNER, TOKENIZE_SCANNER])
+@pytest.mark.parametrize("content", encoding_test_cases)
+def test_source_encoding_is_determined_from_file(
+    content: bytes, scanner: str, tmp_path: Path
+) -> None:
+    path = tmp_path / "module.py"
+    path.write_bytes(content)
+
+    imports = extract_imports_from_file(path, scanner).imports
+
+    assert imports == [RawImport("os", None, 0)]
+
+
+@pytest.mark.parametrize("scanner", [AST_SCANNER, TOKENIZE_SCANNER])
+def test_large_files_are_memory_mapped(
+    scanner: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(source_reader, "MEMORY_MAP_THRESHOLD", 16)
+    path = tmp_path / "module.py"
+    path.write_bytes(b"import os\nx = 1\nfrom . import y\n")
+
+    with open_source(path) as source:
+        assert isinstance(source, mmap.mmap)
+
+    mapped_result = extract_imports_from_file(path, scanner)
+    monkeypatch.setattr(source_reader, "MEMORY_MAP_THRESHOLD", 1024)
+    read_result = extract_imports_from_file(path, scanner)
+
+    assert mapped_result == read_result
+
+
+def test_empty_file_can_be_read(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_bytes(b"")
+
+    assert extract_imports_from_file(path).imports == []
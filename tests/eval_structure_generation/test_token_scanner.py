@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import ast
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from pytestarch.eval_structure_generation.file_import.converter import ImportConverter
+from pytestarch.eval_structure_generation.file_import.import_types import RawImport
+from pytestarch.eval_structure_generation.file_import.token_scanner import (
+    TokenImportScanner,
+)
+
+REPOSITORY_ROOT = Path(__file__).parent.parent.parent
+
+ALL_PYTHON_FILES = sorted(
+    [
+        *(REPOSITORY_ROOT / "src").rglob("*.py"),
+        *(REPOSITORY_ROOT / "tests").rglob("*.py"),
+    ]
+)
+
+SNIPPETS = [
+    pytest.param("import a", id="simple import"),
+    pytest.param("import a.b.c as d, e", id="dotted import with alias"),
+    pytest.param("from a.b import c as d, e", id="absolute from import"),
+    pytest.param("from . import a", id="relative import without module"),
+    pytest.param("from ...a.b import (\n    c as d,\n    e,\n)", id="parenthesised"),
+    pytest.param("from .... import *", id="ellipsis token and star"),
+    pytest.param("import a; from .b import c; x = 1", id="semicolons"),
+    pytest.param("import \\\n    a", id="line continuation"),
+    pytest.param("def f():\n    import a\n    return 1\nimport b", id="function"),
+    pytest.param("class A:\n    import a\n    class B: import b", id="class"),
+    pytest.param(
+        "if TYPE_CHECKING:\n    import a\nelif x:\n    import b\nelse:\n    import c",
+        id="if elif else",
+    ),
+    pytest.param(
+        "try:\n    import a\nexcept ImportError:\n    import b\nelse:\n    import c\nfinally:\n    import d",
+        id="try except else finally",
+    ),
+    pytest.param("try: import a\nexcept: import b", id="one line blocks"),
+    pytest.param(
+        "for x in y:\n    import a\nelse:\n    import b\nwhile x:\n    import c",
+        id="loops",
+    ),
+    pytest.param(
+        "async def f():\n    async with x:\n        import a\n    async for y in z:\n        import b",
+        id="async",
+    ),
+    pytest.param(
+        "match x:\n    case 1:\n        import a\nmatch = 3\nimport b", id="match"
+    ),
+    pytest.param(
+        "with (a as b,\n      c as d):\n    import e", id="parenthesised with"
+    ),
+    pytest.param(
+        "def f(x: dict[str, int] = {1: 2}) -> int:\n    import a", id="annotations"
+    ),
+    pytest.param("if (lambda: x)():\n    import a", id="lambda in header"),
+    pytest.param('x = "import a"\n"""\nimport b\n"""\n# import c', id="strings"),
+    pytest.param(
+        "if x:\n    if y:\n        pass\n    else:\n        import a\n    import b",
+        id="nesting",
+    ),
+    pytest.param("x: int = 1\nimport a", id="annotated assignment"),
+    pytest.param(
+        "if typing.TYPE_CHECKING:\n    def f(): import a\nif not TYPE_CHECKING:\n    import b",
+        id="type checking",
+    ),
+    pytest.param(
+        "try:\n    class A:\n        async def f(self):\n            import a\nexcept: pass",
+        id="import kinds",
+    ),
+    pytest.param("raise X from e\nyield_ = 1", id="from keyword in expression"),
+    pytest.param("", id="empty file"),
+]
+
+
+def _ast_imports(source: bytes) -> list[RawImport]:
+    return ImportConverter().extract_raw_imports(ast.parse(source))
+
+
+@pytest.mark.parametrize("source", SNIPPETS)
+def test_token_scanner_finds_same_imports_as_ast_for_snippet(source: str) -> None:
+    encoded_source = source.encode()
+
+    assert TokenImportScanner().scan(encoded_source) == _ast_imports(encoded_source)
+
+
+@pytest.mark.parametrize(
+    "path",
+    ALL_PYTHON_FILES,
+    ids=lambda path: str(path.relative_to(REPOSITORY_ROOT)),
+)
+def test_token_scanner_finds_same_imports_as_ast_for_repository_file(
+    path: Path,
+) -> None:
+    source = path.read_bytes()
+
+    assert TokenImportScanner().scan(source) == _ast_imports(source)
+
+
+def _peak_memory(scan: Callable[[bytes], list[RawImport]], source: bytes) -> int:
+    tracemalloc.start()
+    try:
+        scan(source)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_token_scanner_requires_less_memory_than_ast_for_large_file() -> None:
+    source = "".join(
+        f"def f{index}(a):\n    import json\n    return {{'k': [a, {index}]}}\n"
+        for index in range(500)
+    ).encode()
+
+    assert _peak_memory(TokenImportScanner().scan, source) * 10 < _peak_memory(
+        _ast_imports, source
+    )
+
+
+def test_token_scanner_resolves_relative_levels_and_aliases() -> None:
+    source = b"from ..a import b as c, d\nimport e.f as g"
+
+    assert TokenImportScanner().scan(source) == [
+        RawImport("e.f", None, 0),
+        RawImport("a", "b", 2),
+        RawImport("a", "d", 2),
+    ]
+
+
+def test_import_line_scan_finds_imports_in_all_blocks() -> None:
+    source = (
+        b'"""\nfrom the docstring\n"""\n'
+        b"import a.b as c, d\n"
+        b"if x:\n    from . import (e,\n        f)\n"
+        b"else:\n    from ..g import h \\\n  , i\n"
+        b"TABLE = [\n    'import',\n]\n"
+    )
+
+    assert TokenImportScanner().scan_import_lines(source) == [
+        RawImport("g", "h", 2),
+        RawImport("g", "i", 2),
+        RawImport(None, "e", 1),
+        RawImport(None, "f", 1),
+        RawImport("a.b", None, 0),
+        RawImport("d", None, 0),
+    ]
+
+
+@pytest.mark.parametrize("path", ALL_PYTHON_FILES, ids=str)
+def test_import_line_scan_finds_all_imports_found_by_ast(path: Path) -> None:
+    source = path.read_bytes()
+    ast_imports = ImportConverter().extract_raw_imports(ast.parse(source))
+
+    # the import line scan does not determine the kinds of the imports
+    assert {raw_import[:3] for raw_import in ast_imports} <= {
+        raw_import[:3] for raw_import in TokenImportScanner().scan_import_lines(source)
+    }
+
+
+@pytest.mark.parametrize(
+    "source, expected_modules",
+    [
+        pytest.param(
+            b'"""Docstring."""\nfrom __future__ import annotations\nimport a\nx = 1\nimport b',
+            ["a", "__future__"],
+            id="ends with first other statement",
+        ),
+        pytest.param(
+            b"import a\nif TYPE_CHECKING:\n    import b\nelse:\n    import c\nimport d\ndef f():\n    import e",
+            ["d", "b", "a"],
+            id="type checking block",
+        ),
+        pytest.param(
+            b"import a\nif typing.TYPE_CHECKING: import b\nif DEBUG:\n    import c",
+            ["b", "a"],
+            id="qualified type checking",
+        ),
+        pytest.param(
+            b"# comment\n\nimport a\n\n\n@decorator\nclass A:\n    import b",
+            ["a"],
+            id="decorator",
+        ),
+    ],
+)
+def test_header_scan_stops_at_first_statement_after_header(
+    source: bytes, expected_modules: list[str]
+) -> None:
+    imports = TokenImportScanner().scan_header(source)
+
+    assert [raw_import.module for raw_import in imports] == expected_modules
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import os
+import sys
+import zipfile
+from pathlib import Path
 
 import pytest
 from rule_assessment.test_rule_matcher import (
@@ -16,10 +19,17 @@ from integration.interesting_rules_for_tests import (
     single_rule_subject_multiple_rule_objects_error_message_test_cases,
     single_rule_subject_single_rule_object_error_message_test_cases,
 )
-from pytestarch import EvaluableArchitecture, Rule, get_evaluable_architecture
+from pytestarch import (
+    EvaluableArchitecture,
+    Rule,
+    get_evaluable_architecture,
+    get_evaluable_architecture_for_archive,
+    get_evaluable_architecture_for_files,
+)
 from pytestarch.eval_structure.evaluable_graph import EvaluableArchitectureGraph
 from pytestarch.eval_structure.networkxgraph import NetworkxGraph
 from pytestarch.eval_structure_generation.file_import.import_types import AbsoluteImport
+from pytestarch.query_language.exceptions import ImproperlyConfigured
 from resources import nested_root_module_mismatch_project, root_module_mismatch_project
 from resources.nested_root_module_mismatch_project.dir1.dir2 import nested_app
 from resources.root_module_mismatch_project import app
@@ -90,6 +100,113 @@ def test_root_module_mismatch_handled_as_expected() -> None:
         rule.assert_applies(evaluable)
 
 
+def test_listed_files_are_evaluated_like_files_found_in_module_path(
+    tmp_path: Path,
+) -> None:
+    root_path = os.path.dirname(root_module_mismatch_project.__file__)
+    manifest = tmp_path / "manifest"
+    manifest.write_bytes(
+        b"\0".join(
+            os.fsencode(os.path.relpath(os.path.join(directory, name), root_path))
+            for directory, _, names in os.walk(root_path)
+            for name in names
+        )
+    )
+
+    evaluable = get_evaluable_architecture_for_files(
+        root_path,
+        os.path.dirname(app.__file__),
+        manifest,
+        base_path=root_path,
+        exclusions=("*__pycache__", "*__init__.py", "*Test.py"),
+    )
+
+    rule = (
+        Rule()
+        .modules_that()
+        .are_sub_modules_of("root_module_mismatch_project.app.red")
+        .should_not()
+        .be_imported_by_modules_that()
+        .are_sub_modules_of("root_module_mismatch_project.app.green")
+    )
+
+    error_message = (
+        '"root_module_mismatch_project.app.red.red" is imported by "root_module_mismatch_project.app.green.green".\n'
+        '"root_module_mismatch_project.app.red.red2" is imported by "root_module_mismatch_project.app.green.green".\n'
+        '"root_module_mismatch_project.app.red.red3" is imported by "root_module_mismatch_project.app.green.green".'
+    )
+    with pytest.raises(AssertionError, match=error_message):
+        rule.assert_applies(evaluable)
+
+
+def test_archive_is_evaluated_like_extracted_files(tmp_path: Path) -> None:
+    root_path = os.path.dirname(root_module_mismatch_project.__file__)
+    archive = tmp_path / "project.pyz"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for directory, _, names in os.walk(root_path):
+            for name in names:
+                path = os.path.join(directory, name)
+                zip_file.write(path, os.path.relpath(path, os.path.dirname(root_path)))
+
+    evaluable = get_evaluable_architecture_for_archive(
+        archive,
+        "root_module_mismatch_project",
+        "root_module_mismatch_project/app",
+        exclusions=("*__pycache__", "*__init__.py", "*Test.py"),
+    )
+
+    rule = (
+        Rule()
+        .modules_that()
+        .are_sub_modules_of("root_module_mismatch_project.app.red")
+        .should_not()
+        .be_imported_by_modules_that()
+        .are_sub_modules_of("root_module_mismatch_project.app.green")
+    )
+
+    error_message = (
+        '"root_module_mismatch_project.app.red.red" is imported by "root_module_mismatch_project.app.green.green".\n'
+        '"root_module_mismatch_project.app.red.red2" is imported by "root_module_mismatch_project.app.green.green".\n'
+        '"root_module_mismatch_project.app.red.red3" is imported by "root_module_mismatch_project.app.green.green".'
+    )
+    with pytest.raises(AssertionError, match=error_message):
+        rule.assert_applies(evaluable)
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 14), reason="subinterpreters are offered as of python 3.14"
+)
+def test_interpreter_executor_is_not_offered_before_python_3_14() -> None:
+    with pytest.raises(ImproperlyConfigured, match="Unknown executor"):
+        get_evaluable_architecture(
+            os.path.dirname(app.__file__),
+            os.path.dirname(app.__file__),
+            workers=2,
+            executor="interpreter",
+        )
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 14), reason="subinterpreters require python 3.14"
+)
+def test_evaluable_parsed_by_subinterpreters_equals_sequentially_parsed_one() -> None:
+    path = os.path.dirname(app.__file__)
+
+    sequential = get_evaluable_architecture(path, path)
+    parallel = get_evaluable_architecture(path, path, workers=2, executor="interpreter")
+
+    assert sorted(parallel._graph.edges) == sorted(sequential._graph.edges)  # type: ignore[attr-defined]
+    assert sorted(parallel.modules) == sorted(sequential.modules)
+
+
+def test_file_that_is_not_an_archive_raises_error(tmp_path: Path) -> None:
+    archive = tmp_path / "project.whl"
+    archive.write_text("")
+
+    with pytest.raises(ImproperlyConfigured, match="not a zip archive"):
+        get_evaluable_architecture_for_archive(archive, "project", "project")
+
+
 def test_root_module_match_handled_as_expected() -> None:
     evaluable = get_evaluable_architecture(
         os.path.dirname(app.__file__),
@@ -87,6 +87,22 @@ def test_identical_source_and_module_path_do_not_lead_to_errors(
             rule.assert_applies(graph_with_identical_source_and_module_path)
 
 
+@pytest.mark.parametrize(
+    "rule, expected_result, skip_with_level_limit", rules_for_no_level_limits
+)
+def test_parsing_with_multiple_workers_leads_to_identical_results(
+    rule: Rule,
+    expected_result: bool,
+    skip_with_level_limit: bool,
+    graph_parsed_with_multiple_workers: EvaluableArchitecture,
+) -> None:
+    if expected_result:
+        rule.assert_applies(graph_parsed_with_multiple_workers)
+    else:
+        with pytest.raises(AssertionError):
+            rule.assert_applies(graph_parsed_with_multiple_workers)
+
+
 @pytest.mark.parametrize(
     "rule, expected_result, skip_with_level_limit", rules_for_level_limit_1
 )
@@ -14,6 +14,9 @@ from integration.interesting_rules_for_tests import (
     layer_rule_error_messages_test_cases,
 )
 from pytestarch import EvaluableArchitecture, LayeredArchitecture, LayerRule
+from pytestarch.eval_structure.evaluable_graph import EvaluableArchitectureGraph
+from pytestarch.eval_structure.networkxgraph import NetworkxGraph
+from pytestarch.eval_structure_generation.file_import.import_types import AbsoluteImport
 
 
 def _get_layered_architecture(
@@ -97,3 +100,35 @@ def test_rule_violated_modules_based_on_regex_raises_proper_error_message(
         match=re.escape(test_case.expected_error_message),  # type: ignore
     ):
         rule.assert_applies(flat_project_1)
+
+
+def test_module_whose_name_only_starts_with_name_of_layer_module_is_not_in_layer() -> (
+    None
+):
+    evaluable = EvaluableArchitectureGraph(
+        NetworkxGraph(
+            ["a", "a.b", "a.b.x", "a.bc", "a.c"], [AbsoluteImport("a.bc", "a.c")]
+        )
+    )
+    arch = (
+        LayeredArchitecture()
+        .layer("B")
+        .containing_modules(["a.b"])
+        .layer("C")
+        .containing_modules(["a.c"])
+    )
+    rule = (
+        LayerRule()
+        .based_on(arch)
+        .layers_that()
+        .are_named("C")
+        .should_only()
+        .be_accessed_by_layers_that()
+        .are_named("B")
+    )
+
+    with pytest.raises(
+        AssertionError,
+        match=re.escape('"a.c" (layer "C") is imported by "a.bc" (no layer).'),
+    ):
+        rule.assert_applies(evaluable)